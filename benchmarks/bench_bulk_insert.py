@@ -0,0 +1,36 @@
+"""
+Insert throughput: one commit per row versus the single-transaction bulk API.
+
+Run from the project root:
+    python -m benchmarks.bench_bulk_insert
+"""
+from benchmarks.common import make_employee_rows, temp_database, timed
+from models.employee import Employee
+from services.employee_service import EmployeeService
+
+FIELDS = ['name', 'age', 'job', 'email', 'gender', 'phone', 'address']
+ROW_BY_ROW = 2_000
+BULK = 100_000
+
+
+def main():
+    rows = make_employee_rows(BULK)
+    dicts = [dict(zip(FIELDS, row)) for row in rows]
+
+    with temp_database() as db:
+        service = EmployeeService(db)
+        seconds = timed(lambda: [service.add_employee(d) for d in dicts[:ROW_BY_ROW]])
+        print(f"{'add_employee loop':<26}{ROW_BY_ROW:>8} rows  {ROW_BY_ROW / seconds:>12,.0f} rows/s")
+
+    with temp_database() as db:
+        service = EmployeeService(db)
+        seconds = timed(lambda: service.add_employees(dicts))
+        print(f"{'add_employees':<26}{BULK:>8} rows  {BULK / seconds:>12,.0f} rows/s")
+
+    with temp_database() as db:
+        seconds = timed(lambda: db.insert_employees(Employee(None, *row) for row in rows))
+        print(f"{'Database.insert_employees':<26}{BULK:>8} rows  {BULK / seconds:>12,.0f} rows/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Insert latency while a long export is reading the table.
+
+A worker thread streams the whole table into a CSV writer (as an export
+does) while the main thread keeps inserting employees. With the classic
+rollback journal the export's read lock stalls every commit; with WAL the
+inserts proceed while the export runs.
+
+Run from the project root:
+    python -m benchmarks.bench_concurrency
+"""
+import csv
+import io
+import statistics
+import threading
+import time
+
+from benchmarks.common import make_employee_rows, temp_database
+from models.employee import Employee
+
+ROWS = 200_000
+INSERTS = 200
+
+
+def export_worker(db, started, done):
+    """Stream every row into an in-memory CSV writer, like a slow export"""
+    cursor = db.con.execute("SELECT * FROM Employees")
+    writer = csv.writer(io.StringIO())
+    started.set()
+    while True:
+        chunk = cursor.fetchmany(500)
+        if not chunk:
+            break
+        writer.writerows(chunk)
+        time.sleep(0.001)
+    db.release_connection()
+    done.set()
+
+
+def run(journal_mode):
+    with temp_database(ROWS, journal_mode=journal_mode, busy_timeout_ms=30_000) as db:
+        employees = [Employee(None, *row) for row in make_employee_rows(INSERTS, seed=7)]
+
+        started, done = threading.Event(), threading.Event()
+        exporter = threading.Thread(target=export_worker, args=(db, started, done))
+        exporter.start()
+        started.wait()
+
+        latencies = []
+        during_export = 0
+        for employee in employees:
+            start = time.perf_counter()
+            db.insert_employee(employee)
+            latencies.append(time.perf_counter() - start)
+            if not done.is_set():
+                during_export += 1
+        exporter.join()
+
+    latencies.sort()
+    print(f"{journal_mode:<8} inserts finished during export: {during_export:>4}/{INSERTS}  "
+          f"p50 {statistics.median(latencies) * 1e3:8.2f} ms  "
+          f"p95 {latencies[int(len(latencies) * 0.95)] * 1e3:8.2f} ms  "
+          f"max {latencies[-1] * 1e3:8.2f} ms")
+
+
+def main():
+    for journal_mode in ("DELETE", "WAL"):
+        run(journal_mode)
+
+
+if __name__ == '__main__':
+    main()
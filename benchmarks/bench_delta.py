@@ -0,0 +1,53 @@
+"""
+Delta export cost: full CSV export versus changes since a checkpoint.
+
+Loads a table, sets a checkpoint, changes a given number of rows (a third
+each inserted, updated and deleted) and times the delta export for each
+change volume against a full export of the same table.
+
+Run from the project root:
+    python -m benchmarks.bench_delta [rows]
+"""
+import os
+import sys
+import tempfile
+
+from benchmarks.common import make_employee_rows, temp_database, timed
+from models.employee import Employee
+from services.employee_service import EmployeeService
+
+DEFAULT_ROWS = 500_000
+CHANGES = [0, 100, 1_000, 10_000]
+
+
+def make_changes(db, count):
+    """Insert, update and delete count rows in total, a third of each"""
+    with db.transaction():
+        db.insert_employees(Employee(None, *row) for row in make_employee_rows(count // 3, seed=7))
+        for employee_id in range(1, count // 3 + 1):
+            db.con.execute("UPDATE Employees SET job = job || '+' WHERE id = ?", (employee_id,))
+        db.con.execute("DELETE FROM Employees WHERE id > ? AND id <= ?",
+                       (count // 3, count // 3 + count - 2 * (count // 3)))
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    with tempfile.TemporaryDirectory(prefix="ems-bench-") as directory:
+        filename = os.path.join(directory, "out.csv")
+
+        with temp_database(rows) as db:
+            service = EmployeeService(db)
+            seconds = timed(lambda: service.export_to_csv(filename))
+            print(f"{'full export':<22}{rows:>10,} rows     {seconds * 1000:>9.1f} ms")
+
+        for count in CHANGES:
+            with temp_database(rows) as db:
+                service = EmployeeService(db)
+                service.mark_export_checkpoint('bench')
+                make_changes(db, count)
+                seconds = timed(lambda: service.export_changes(filename, 'bench', advance=False))
+                print(f"{'delta export':<22}{count:>10,} changes  {seconds * 1000:>9.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
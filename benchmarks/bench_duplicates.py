@@ -0,0 +1,45 @@
+"""
+Duplicate detection cost versus table size.
+
+Without key columns, checking a new employee for a duplicate email or
+phone means reading the whole table and normalizing every row in Python.
+find_duplicate does two lookups on the email_key and phone_key indexes
+instead, and the duplicate report is one GROUP BY per key index.
+
+Run from the project root:
+    python -m benchmarks.bench_duplicates
+"""
+import re
+
+from benchmarks.common import temp_database, timed
+
+SIZES = [1_000, 100_000, 500_000]
+
+
+def scan_duplicate(db, email, phone):
+    """The Python-side check: fetch every row and compare normalized values"""
+    email, phone = email.strip().lower(), re.sub(r'[\s\-\(\)]', '', phone)
+    for row in db.fetch_all_employees():
+        if row[4].strip().lower() == email or re.sub(r'[\s\-\(\)]', '', row[6]) == phone:
+            return row[0]
+    return None
+
+
+def main():
+    print(f"{'rows':>9} {'path':<16} {'time (ms)':>10}")
+    for size in SIZES:
+        with temp_database(size) as db:
+            email, phone = 'nobody@example.com', '000-000-0000'
+            paths = [
+                ("find_duplicate", lambda: db.find_duplicate(email, phone), 1000),
+                ("report", lambda: [db.fetch_duplicate_groups(field) for field in ('email', 'phone')], 1),
+            ]
+            # The scan is left out where it would dominate the run
+            if size <= 100_000:
+                paths.insert(0, ("python scan", lambda: scan_duplicate(db, email, phone), 1))
+            for label, func, repeat in paths:
+                print(f"{size:>9,} {label:<16} {timed(func, repeat) * 1000:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
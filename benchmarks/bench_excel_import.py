@@ -0,0 +1,77 @@
+"""
+Excel import cost versus workbook size.
+
+Reading a workbook the default way loads every cell of every sheet
+before the first row can be used, so memory grows with the workbook.
+The import reads it in openpyxl's read-only mode instead, one chunk of
+rows at a time. Both readers are timed with their peak memory, followed
+by the full import_excel (read, validate and insert).
+
+Run from the project root:
+    python -m benchmarks.bench_excel_import [rows ...]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import openpyxl
+
+from benchmarks.common import temp_database, timed
+from services.employee_service import EmployeeService
+from services.importers.excel_importer import open_excel
+
+DEFAULT_SIZES = [10_000, 50_000]
+
+
+def loaded_read(filename):
+    """The default-mode reader: load the workbook, then walk its rows"""
+    workbook = openpyxl.load_workbook(filename, data_only=True)
+    rows = sum(1 for sheet in workbook.worksheets for _ in sheet.iter_rows(min_row=2, values_only=True))
+    workbook.close()
+    return rows
+
+
+def streamed_read(filename):
+    """The import's reader: read-only mode, in chunks"""
+    source = open_excel(filename)
+    try:
+        return sum(len(batch) for batch in source.batches)
+    finally:
+        source.close()
+
+
+def measure(func):
+    """Run func once for its time, then again under tracemalloc for its peak MiB"""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or DEFAULT_SIZES
+    print(f"{'rows':>9} {'path':<14} {'time (s)':>9} {'peak (MiB)':>11}")
+    with tempfile.TemporaryDirectory(prefix="ems-bench-") as directory:
+        for size in sizes:
+            filename = os.path.join(directory, f"employees-{size}.xlsx")
+            with temp_database(size) as db:
+                EmployeeService(db).export('xlsx', filename)
+
+            for label, reader in (("loaded read", loaded_read), ("streamed read", streamed_read)):
+                elapsed, peak = measure(lambda: reader(filename))
+                print(f"{size:>9,} {label:<14} {elapsed:>9.2f} {peak:>11.1f}")
+
+            with temp_database() as db:
+                service = EmployeeService(db)
+                seconds = timed(lambda: service.import_excel(filename))
+                print(f"{size:>9,} {'import_excel':<14} {seconds:>9.2f} {'':>11} {size / seconds:,.0f} rows/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""
+Export cost versus table size.
+
+The old CSV export loaded every row into a list and wrote
+them with one writerows call, so peak memory grew with the table. The old
+Excel export assigned every cell of a normal openpyxl workbook and then
+walked all cells again to size the columns. The old PDF export built one
+auto-sized reportlab Table with a style command per striped row. Each is
+compared with the streaming export that replaced it.
+
+Run from the project root:
+    python -m benchmarks.bench_export
+"""
+import csv
+import os
+import tempfile
+import time
+import tracemalloc
+
+import openpyxl
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter, landscape
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
+
+from benchmarks.common import temp_database
+from services.employee_service import EmployeeService
+from services.exporters import EXPORT_HEADERS
+
+CSV_SIZES = [1_000, 100_000, 500_000]
+EXCEL_SIZES = [1_000, 50_000, 100_000]
+PDF_SIZES = [1_000, 5_000, 10_000]
+
+
+def list_csv(service, filename):
+    """The pre-streaming implementation: materialize the table, then write it"""
+    employees = service.db.fetch_all_employees()
+    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(EXPORT_HEADERS)
+        writer.writerows(employees)
+
+
+def cell_excel(service, filename):
+    """The pre-write-only implementation: per-cell assignment, then a width pass"""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Employees"
+    for col_num, header in enumerate(EXPORT_HEADERS, 1):
+        sheet.cell(row=1, column=col_num).value = header
+    for row_num, employee in enumerate(service.iter_employees(), 2):
+        for col_num, value in enumerate(employee, 1):
+            sheet.cell(row=row_num, column=col_num).value = value
+    for column in sheet.columns:
+        max_length = 0
+        column_letter = column[0].column_letter
+        for cell in column:
+            if cell.value:
+                max_length = max(max_length, len(str(cell.value)))
+        sheet.column_dimensions[column_letter].width = (max_length + 2) * 1.2
+    workbook.save(filename)
+
+
+def table_pdf(service, filename):
+    """The pre-paging implementation: one auto-sized Table for the whole report"""
+    doc = SimpleDocTemplate(filename, pagesize=landscape(letter))
+    styles = getSampleStyleSheet()
+    elements = [Paragraph("Employee Management System - Employee Report", styles['Title']),
+                Paragraph("<br/><br/>", styles['Normal'])]
+    data = [EXPORT_HEADERS] + service.db.fetch_all_employees()
+    table = Table(data)
+    style = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ])
+    for i in range(2, len(data), 2):
+        style.add('BACKGROUND', (0, i), (-1, i), colors.lightgrey)
+    table.setStyle(style)
+    elements.append(table)
+    doc.build(elements)
+
+
+def measure(func):
+    """Return (seconds, peak traced MiB); timed without tracing, which slows Python code"""
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def run(directory, sizes, paths):
+    """Time every export path at every table size"""
+    print(f"{'rows':>9} {'path':<12} {'time (s)':>9} {'peak (MiB)':>11}")
+    for size in sizes:
+        with temp_database(size) as db:
+            service = EmployeeService(db)
+            for label, export, name in paths(service):
+                filename = os.path.join(directory, name)
+                elapsed, peak = measure(lambda: export(filename))
+                print(f"{size:>9,} {label:<12} {elapsed:>9.2f} {peak:>11.1f}")
+                os.remove(filename)
+
+
+def main():
+    directory = tempfile.mkdtemp(prefix="ems-export-")
+    try:
+        run(directory, CSV_SIZES, lambda service: [
+            ('list csv', lambda f: list_csv(service, f), 'list.csv'),
+            ('stream csv', service.export_to_csv, 'stream.csv'),
+            ('stream gzip', service.export_to_csv, 'stream.csv.gz'),
+        ])
+        print()
+        run(directory, EXCEL_SIZES, lambda service: [
+            ('cell excel', lambda f: cell_excel(service, f), 'cell.xlsx'),
+            ('write-only', service.export_to_excel, 'stream.xlsx'),
+        ])
+        print()
+        run(directory, PDF_SIZES, lambda service: [
+            ('table pdf', lambda f: table_pdf(service, f), 'table.pdf'),
+            ('paged pdf', service.export_to_pdf, 'paged.pdf'),
+        ])
+    finally:
+        os.rmdir(directory)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+"""
+CSV import throughput: EmployeeService.import_csv on a generated file.
+
+Writes a CSV with the export's columns (one row in a thousand invalid),
+then imports it into an empty database, validating in this process and,
+on multi-core machines, across a process pool.
+
+Run from the project root:
+    python -m benchmarks.bench_import [rows]
+"""
+import csv
+import os
+import sys
+import tempfile
+
+from benchmarks.common import make_employee_rows, temp_database, timed
+from services.employee_service import EmployeeService
+from services.exporters import EXPORT_HEADERS
+
+DEFAULT_ROWS = 1_000_000
+
+
+def write_csv(filename, rows):
+    """Write rows synthetic employees; every 1000th has an invalid age"""
+    with open(filename, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_HEADERS)
+        for i, row in enumerate(make_employee_rows(rows)):
+            if i % 1000 == 999:
+                row = (row[0], 'n/a') + row[2:]
+            writer.writerow((i + 1,) + row)
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    with tempfile.TemporaryDirectory(prefix="ems-bench-") as directory:
+        filename = os.path.join(directory, "employees.csv")
+        write_csv(filename, rows)
+
+        cores = os.cpu_count() or 1
+        for processes in sorted({0, cores if cores > 1 else 0}):
+            with temp_database() as db:
+                service = EmployeeService(db)
+                result = {}
+                seconds = timed(lambda: result.update(service.import_csv(filename, processes=processes)[2]))
+                label = f"{processes} validation processes" if processes else "validation in-process"
+                print(f"{label:<26}{rows:>10,} rows  {seconds:>7.1f} s  {rows / seconds:>10,.0f} rows/s  "
+                      f"({result['imported']:,} imported, {result['rejected']:,} rejected)")
+
+
+if __name__ == '__main__':
+    main()
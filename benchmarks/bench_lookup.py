@@ -0,0 +1,50 @@
+"""
+Single-employee lookup latency as the table grows.
+
+Compares the old full-table scan used by get_employee_by_id with the
+primary-key and indexed email/name lookups.
+
+Run from the project root:
+    python -m benchmarks.bench_lookup
+"""
+import random
+
+from benchmarks.common import temp_database, timed
+from models.employee import Employee
+
+SIZES = [1_000, 10_000, 50_000, 200_000]
+LOOKUPS = 200
+
+
+def scan_lookup(db, employee_id):
+    """The pre-index implementation: fetch every row and search in Python"""
+    for row in db.fetch_all_employees():
+        if row[0] == employee_id:
+            return row
+    return None
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{'rows':>10} {'scan (ms)':>12} {'by id (us)':>12} {'by email (us)':>14} {'by name (us)':>13}")
+    for size in SIZES:
+        with temp_database(size) as db:
+            ids = [rng.randint(1, size) for _ in range(LOOKUPS)]
+            emails = [db.fetch_employee_by_id(i)[4] for i in ids]
+            # Synthetic names repeat, so probe with a unique one to time the index
+            # rather than the size of the result set
+            db.insert_employee(Employee(name="Probe Person", age="40", job="Tester",
+                                        email="probe@example.com", gender="Female",
+                                        phone="555-000-0000", address="1 Probe Rd"))
+
+            scan = timed(lambda: scan_lookup(db, ids[0]), repeat=3)
+            by_id = timed(lambda: [db.fetch_employee_by_id(i) for i in ids]) / LOOKUPS
+            by_email = timed(lambda: [db.fetch_employees_by_email(e) for e in emails]) / LOOKUPS
+            by_name = timed(lambda: [db.fetch_employees_by_name("Probe Person") for _ in ids]) / LOOKUPS
+
+            print(f"{size:>10} {scan * 1e3:>12.2f} {by_id * 1e6:>12.1f} "
+                  f"{by_email * 1e6:>14.1f} {by_name * 1e6:>13.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Time the in-place upgrade of a legacy (untyped) database to the typed schema.
+
+Builds a version-1 file with the given number of rows, then times opening
+it with Database, which applies the pending migrations in one transaction.
+
+Run from the project root:
+    python -m benchmarks.bench_migration [rows]
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+from benchmarks.common import make_employee_rows
+from db.database import Database
+from db.migrations import migrate
+
+DEFAULT_ROWS = 1_000_000
+
+
+def build_legacy_database(path, rows):
+    """Create a schema-version-1 file holding rows synthetic employees"""
+    con = sqlite3.connect(path)
+    con.execute("""
+        CREATE TABLE Employees(
+            id INTEGER PRIMARY KEY, name TEXT, age TEXT, job TEXT,
+            email TEXT, gender TEXT, phone TEXT, address TEXT
+        )
+    """)
+    con.executemany(
+        "INSERT INTO Employees (name, age, job, email, gender, phone, address) VALUES (?,?,?,?,?,?,?)",
+        make_employee_rows(rows)
+    )
+    migrate(con, target=1)
+    con.commit()
+    con.close()
+
+
+def used_bytes(path):
+    """Bytes in use by the file, excluding free pages left by the old table"""
+    con = sqlite3.connect(path)
+    try:
+        pages = con.execute("PRAGMA page_count").fetchone()[0]
+        free = con.execute("PRAGMA freelist_count").fetchone()[0]
+        return (pages - free) * con.execute("PRAGMA page_size").fetchone()[0]
+    finally:
+        con.close()
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    with tempfile.TemporaryDirectory(prefix="ems-bench-") as directory:
+        path = os.path.join(directory, "legacy.db")
+        build_legacy_database(path, rows)
+        size_before = used_bytes(path)
+
+        start = time.perf_counter()
+        db = Database(path)
+        seconds = time.perf_counter() - start
+        version = db.schema_version()
+        db.close()
+        size_after = used_bytes(path)
+
+        print(f"{rows:,} rows migrated to schema v{version} in {seconds:.2f} s "
+              f"({rows / seconds:,.0f} rows/s); pages in use {size_before / 2**20:.1f} MiB "
+              f"-> {size_after / 2**20:.1f} MiB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,35 @@
+"""
+Search latency: Python substring filtering versus the FTS5 index.
+
+The old View tab search re-read the whole table and filtered it in Python
+on every keystroke. This compares that with Database.search_employees.
+
+Run from the project root:
+    python -m benchmarks.bench_search
+"""
+from benchmarks.common import temp_database, timed
+
+ROWS = 500_000
+QUERIES = ['j', 'jo', 'john', 'john sm', 'engineer', 'istanbul', 'zzz']
+LIMIT = 500
+
+
+def scan_search(db, text):
+    """The pre-FTS implementation: fetch every row, substring-match id and name"""
+    return [row for row in db.fetch_all_employees()
+            if text in str(row[0]).lower() or text in str(row[1]).lower()][:LIMIT]
+
+
+def main():
+    with temp_database(ROWS) as db:
+        print(f"{ROWS:,} rows, limit {LIMIT}")
+        print(f"{'query':<12} {'scan (ms)':>10} {'fts (ms)':>10} {'hits':>6}")
+        for query in QUERIES:
+            scan = timed(lambda: scan_search(db, query))
+            fts = timed(lambda: db.search_employees(query, LIMIT), repeat=5)
+            hits = len(db.search_employees(query, LIMIT))
+            print(f"{query:<12} {scan * 1e3:>10.1f} {fts * 1e3:>10.2f} {hits:>6}")
+
+
+if __name__ == '__main__':
+    main()
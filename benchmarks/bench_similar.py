@@ -0,0 +1,73 @@
+"""
+Similar-employee search cost versus table size.
+
+Comparing every pair of employees grows with the square of the table;
+find_similar_employees only compares employees sharing a blocking key.
+The table gets varied names and addresses plus one near-duplicate (a
+one-letter typo in the name) per hundred employees; the all-pairs cost
+is measured on the smallest table only.
+
+Run from the project root:
+    python -m benchmarks.bench_similar [rows ...]
+"""
+import os
+import random
+import sys
+
+from benchmarks.common import temp_database, timed
+from models.employee import Employee
+from services.duplicates import compare_block
+from services.employee_service import EmployeeService
+
+DEFAULT_SIZES = [2_000, 20_000, 200_000]
+SYLLABLES = ['ka', 'ri', 'mo', 'sa', 'le', 'na', 'to', 'vi', 'da', 'ne', 'ho', 'ju', 'pe', 'zo', 'ma',
+             'li', 'ra', 'en', 'ol', 'ta', 'mi', 'ga', 'bu', 'fe', 'si', 'ko', 'an', 'el', 'yu', 'di']
+CITIES = ['Istanbul', 'Cairo', 'Ankara', 'Alexandria', 'London', 'Berlin']
+
+
+def word(rng, syllables):
+    return ''.join(rng.choice(SYLLABLES) for _ in range(syllables)).capitalize()
+
+
+def make_people(count, seed=7):
+    """Employees with varied names and addresses; every 100th is a typo'd copy of the one before"""
+    rng = random.Random(seed)
+    people = []
+    for i in range(count):
+        if i % 100 == 99:
+            name, address = people[-1][0], people[-1][6]
+            position = rng.randrange(1, len(name))
+            name = name[:position] + rng.choice('aeiou') + name[position + 1:]
+        else:
+            name = f"{word(rng, 2)} {word(rng, 3)}"
+            address = f"{rng.randint(1, 999)} {word(rng, 2)} St, {rng.choice(CITIES)}"
+        people.append((name, str(rng.randint(18, 65)), 'Engineer', f"p{i}@example.com",
+                       rng.choice(['Male', 'Female']), f"555-{rng.randint(100, 999)}-{rng.randint(0, 9999):04d}",
+                       address))
+    return people
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or DEFAULT_SIZES
+    cores = os.cpu_count() or 1
+    print(f"{'rows':>9} {'path':<22} {'time (s)':>9} {'pairs found':>12}")
+    for size in sizes:
+        with temp_database() as db:
+            db.insert_employees(Employee(None, *person) for person in make_people(size))
+            service = EmployeeService(db)
+
+            if size == min(sizes):
+                rows = [row[1:] for row in db.iter_by_blocking_key('address_key')]
+                result = []
+                seconds = timed(lambda: result.append(compare_block(0, rows, 0.85)))
+                print(f"{size:>9,} {'all pairs':<22} {seconds:>9.2f} {len(result[0][0]):>12,}")
+
+            for processes in sorted({0, cores if cores > 1 else 0}):
+                result = []
+                seconds = timed(lambda: result.append(service.find_similar_employees(processes=processes)[2]))
+                label = f"blocked, {processes} processes" if processes else "blocked"
+                print(f"{size:>9,} {label:<22} {seconds:>9.2f} {len(result[0]['pairs']):>12,}")
+
+
+if __name__ == '__main__':
+    main()
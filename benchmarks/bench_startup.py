@@ -0,0 +1,46 @@
+"""
+Startup cost of importing the service layer.
+
+Export backends (openpyxl, reportlab) are imported by the exporter registry
+the first time a format is used. This measures, with python -X importtime
+in fresh interpreters, what importing the service costs now and what it
+cost when both backends were imported eagerly.
+
+Run from the project root:
+    python -m benchmarks.bench_startup
+"""
+import statistics
+import subprocess
+import sys
+
+RUNS = 10
+CASES = [
+    ('lazy (current)', 'import services.employee_service'),
+    ('eager backends', 'import services.employee_service, openpyxl, reportlab.platypus, reportlab.lib.styles'),
+    ('first PDF export', 'import services.employee_service, services.exporters.pdf_exporter'),
+]
+
+
+def import_time_ms(statement):
+    """Total cumulative import time of one fresh interpreter, in milliseconds"""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', statement],
+                            capture_output=True, text=True, check=True)
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        _, cumulative, name = line.split('|')
+        if cumulative.strip().isdigit() and not name.startswith('  '):  # top-level imports only
+            total += int(cumulative)
+    return total / 1000
+
+
+def main():
+    print(f"{'case':<18} {'median (ms)':>12} {'min (ms)':>10}")
+    for label, statement in CASES:
+        times = [import_time_ms(statement) for _ in range(RUNS)]
+        print(f"{label:<18} {statistics.median(times):>12.1f} {min(times):>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
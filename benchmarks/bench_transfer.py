@@ -0,0 +1,103 @@
+"""
+Machine-to-machine transfer: NDJSON export/import and stepped database snapshots.
+
+Times CSV and NDJSON exports of the same table, parsing both files back
+into typed rows, the NDJSON import, and export_snapshot at several step
+sizes while another thread keeps inserting (reporting that writer's
+worst-case latency).
+
+Run from the project root:
+    python -m benchmarks.bench_transfer [rows]
+"""
+import csv
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from benchmarks.common import temp_database, timed
+from models.employee import Employee
+from services.employee_service import EmployeeService
+
+DEFAULT_ROWS = 200_000
+STEP_SIZES = [64, 256, 1024, -1]
+
+
+def parse_csv(filename):
+    """Read a CSV export back into typed rows"""
+    with open(filename, newline='', encoding='utf-8') as f:
+        reader = csv.reader(f)
+        next(reader)
+        return sum(1 for row in reader if (int(row[0]), int(row[2]) if row[2] else None))
+
+
+def parse_ndjson(filename):
+    """Read an NDJSON export back into typed records"""
+    decode = json.JSONDecoder().decode
+    with open(filename, 'rb') as f:
+        return sum(1 for line in f if decode(line.decode('utf-8')))
+
+
+def report(label, rows, seconds, size=None):
+    extra = f"  {size / 2**20 / seconds:>8,.1f} MiB/s" if size else ""
+    print(f"{label:<28}{rows / seconds:>12,.0f} rows/s{extra}")
+
+
+def snapshot_with_writer(db, filename, pages):
+    """Snapshot while a thread inserts employees; return (seconds, worst insert latency)"""
+    stop = threading.Event()
+    latencies = []
+
+    def writer():
+        employee = Employee(None, 'Writer', '30', 'Tester', 'w@example.com', 'Male', '555-000-0000', 'x')
+        while not stop.is_set():
+            start = time.perf_counter()
+            db.insert_employee(employee)
+            latencies.append(time.perf_counter() - start)
+            time.sleep(0.001)
+        db.release_connection()
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        service = EmployeeService(db)
+        seconds = timed(lambda: service.export_snapshot(filename, pages_per_step=pages))
+    finally:
+        stop.set()
+        thread.join()
+    return seconds, max(latencies) if latencies else 0.0
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    with tempfile.TemporaryDirectory(prefix="ems-bench-") as directory:
+        csv_file = os.path.join(directory, "out.csv")
+        ndjson_file = os.path.join(directory, "out.ndjson")
+
+        with temp_database(rows) as db:
+            service = EmployeeService(db)
+            report("CSV export", rows, timed(lambda: service.export('csv', csv_file)), os.path.getsize(csv_file))
+            report("NDJSON export", rows, timed(lambda: service.export('ndjson', ndjson_file)),
+                   os.path.getsize(ndjson_file))
+            report("CSV parse (typed)", rows, timed(lambda: parse_csv(csv_file)), os.path.getsize(csv_file))
+            report("NDJSON parse", rows, timed(lambda: parse_ndjson(ndjson_file)), os.path.getsize(ndjson_file))
+
+        with temp_database() as db:
+            service = EmployeeService(db)
+            report("NDJSON import", rows, timed(lambda: service.import_ndjson(ndjson_file)),
+                   os.path.getsize(ndjson_file))
+
+        with temp_database(rows) as db:
+            size = os.path.getsize(db.db_path)
+            for pages in STEP_SIZES:
+                snapshot = os.path.join(directory, "snapshot.db")
+                seconds, worst = snapshot_with_writer(db, snapshot, pages)
+                label = "one step" if pages < 0 else f"{pages} pages/step"
+                print(f"{'snapshot, ' + label:<28}{size / 2**20 / seconds:>12,.1f} MiB/s"
+                      f"  worst concurrent insert {worst * 1000:.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Validation cost per row: per-row dict validation versus validate_rows.
+
+The old validate_employee_data looked its patterns up by string on every
+call, ran re.sub before the phone pattern, and needed a dict per row.
+It is compared with today's per-row function and with the batch
+validate_rows used by the imports, on the same rows (one in a hundred
+invalid).
+
+Run from the project root:
+    python -m benchmarks.bench_validate [rows]
+"""
+import re
+import sys
+
+from benchmarks.common import make_employee_rows, timed
+from models.employee import GENDERS, MIN_AGE, MAX_AGE
+from utils.validators import REQUIRED_FIELDS, validate_employee_data, validate_rows
+
+DEFAULT_ROWS = 200_000
+
+
+def legacy_validate(employee_data):
+    """The validator before precompiled patterns, first error only"""
+    for field in REQUIRED_FIELDS:
+        if field not in employee_data or not employee_data[field]:
+            return False, f"Field '{field}' is required"
+    if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', employee_data['email']):
+        return False, "Invalid email format"
+    phone = employee_data['phone']
+    if len(re.sub(r'[\s\-\(\)]', '', phone)) < 10 or not re.match(r'^[0-9\s\-\(\)]{10,15}$', phone):
+        return False, "Invalid phone number format"
+    if not employee_data['age'].isdigit() or not employee_data['age'].isascii():
+        return False, "Age must be a number"
+    if not MIN_AGE <= int(employee_data['age']) <= MAX_AGE:
+        return False, f"Age must be between {MIN_AGE} and {MAX_AGE}"
+    if employee_data['gender'] not in GENDERS:
+        return False, f"Gender must be one of: {', '.join(GENDERS)}"
+    return True, ""
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS
+    rows = [row if i % 100 else (row[0], 'n/a') + row[2:] for i, row in enumerate(make_employee_rows(count))]
+
+    def per_row(validate):
+        return lambda: sum(1 for row in rows if not validate(dict(zip(REQUIRED_FIELDS, row)))[0])
+
+    paths = [
+        ("legacy per-row", per_row(legacy_validate)),
+        ("per-row", per_row(validate_employee_data)),
+        ("validate_rows", lambda: len(validate_rows(rows))),
+    ]
+    print(f"{'path':<16} {'time (s)':>9} {'rows/s':>12}")
+    for label, func in paths:
+        seconds = timed(func, repeat=3)
+        print(f"{label:<16} {seconds:>9.3f} {count / seconds:>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
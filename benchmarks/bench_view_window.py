@@ -0,0 +1,52 @@
+"""
+Cost of filling the employee list versus table size.
+
+The View tab used to fetch every employee and insert each one into the
+treeview. The virtualized list counts the employees and fetches only the
+rows on screen, by position: scrolling walks the key from the top row,
+and a scrollbar jump computes the first ID directly while the IDs have
+no gaps, or walks the key with OFFSET once some employees are deleted.
+Only the database side is timed; inserting every row into a Tk treeview
+costs far more than fetching it.
+
+Run from the project root:
+    python -m benchmarks.bench_view_window [rows ...]
+"""
+import sys
+
+from benchmarks.common import temp_database, timed
+from services.employee_service import EmployeeService
+
+DEFAULT_SIZES = [1_000, 100_000, 1_000_000]
+# Rows on screen in a maximized window
+VISIBLE = 40
+
+
+def open_list(service):
+    service.count_employees()
+    service.get_employees_at(0, VISIBLE)
+
+
+def main():
+    sizes = [int(size) for size in sys.argv[1:]] or DEFAULT_SIZES
+    print(f"{'rows':>9} {'path':<24} {'time (ms)':>10}")
+    for size in sizes:
+        with temp_database(size) as db:
+            service = EmployeeService(db)
+            middle = db.fetch_employees_at(size // 2, 1)[0][0]
+            paths = [
+                ("fetch all (old)", lambda: db.fetch_all_employees(), 1),
+                ("open virtual list", lambda: open_list(service), 100),
+                ("scroll one page", lambda: service.get_employees_at(VISIBLE, VISIBLE, middle), 100),
+                ("jump to middle", lambda: service.get_employees_at(size // 2, VISIBLE), 100),
+            ]
+            for label, func, repeat in paths:
+                print(f"{size:>9,} {label:<24} {timed(func, repeat) * 1000:>10.3f}")
+
+            db.remove_employee(size // 4)
+            seconds = timed(lambda: service.get_employees_at(size // 2, VISIBLE), 10)
+            print(f"{size:>9,} {'jump, IDs with gaps':<24} {seconds * 1000:>10.3f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+import os
+import random
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Tuple
+
+from db.database import Database
+from models.employee import Employee
+
+FIRST_NAMES = ['John', 'Jane', 'Omar', 'Sara', 'Eman', 'Ali', 'Mona', 'Osama', 'Lina', 'Karim']
+LAST_NAMES = ['Smith', 'Doe', 'Hassan', 'Ahmed', 'Yilmaz', 'Kaya', 'Brown', 'Nasser']
+JOBS = ['Engineer', 'Developer', 'Writer', 'Designer', 'Manager', 'Accountant', 'Pilot']
+CITIES = ['Istanbul', 'Cairo', 'Ankara', 'Alexandria', 'London', 'Berlin']
+
+
+def make_employee_rows(count: int, seed: int = 42) -> List[Tuple]:
+    """
+    Generate synthetic employee rows in Employee.to_tuple() order (without id).
+
+    Args:
+        count: Number of rows to generate
+        seed: Random seed so runs are repeatable
+    """
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES)
+        rows.append((
+            f"{first} {last}",
+            str(rng.randint(18, 65)),
+            rng.choice(JOBS),
+            f"{first.lower()}.{last.lower()}{i}@example.com",
+            rng.choice(['Male', 'Female']),
+            f"555-{rng.randint(100, 999)}-{i % 10000:04d}",
+            f"{rng.randint(1, 999)} Main St, {rng.choice(CITIES)}",
+        ))
+    return rows
+
+
+@contextmanager
+def temp_database(rows: int = 0, **options) -> Iterator[Database]:
+    """
+    Create a throw-away on-disk database, optionally pre-filled with rows.
+
+    Args:
+        rows: Number of synthetic employees to load before yielding
+        options: Extra keyword arguments passed to Database
+    """
+    directory = tempfile.mkdtemp(prefix="ems-bench-")
+    path = os.path.join(directory, "bench.db")
+    db = Database(path, **options)
+    try:
+        if rows:
+            db.insert_employees(Employee(None, *row) for row in make_employee_rows(rows))
+        yield db
+    finally:
+        db.close()
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+        os.rmdir(directory)
+
+
+def timed(func, repeat: int = 1) -> float:
+    """Return the mean wall-clock seconds of calling func() repeat times"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
@@ -1,87 +1,1029 @@
+import heapq
+import json
+import re
 import sqlite3
-from typing import List, Tuple, Optional
-from models.employee import Employee
+import threading
+import time
+from contextlib import contextmanager
+from itertools import count
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple, Optional, Union
+from models.employee import Employee, EMPLOYEE_COLUMNS
+from db.migrations import (migrate, get_schema_version, STATS_REBUILD_SQL, STATS_ACTUAL_SQL,
+                           DEFERRED_INSERT_SQL, NOW_SQL, TRACKED_COLUMNS, EMAIL_KEY_SQL, PHONE_KEY_SQL,
+                           BLOCKING_KEYS)
+from db.query import compile_query
+
+# Fields checked for duplicates: field -> (indexed key column, SQL template normalizing a value to that key)
+DUPLICATE_KEYS = {
+    'email': ('email_key', EMAIL_KEY_SQL),
+    'phone': ('phone_key', PHONE_KEY_SQL),
+}
+
+# Column order shared by every SELECT so rows always map onto Employee.from_tuple
+SELECT_EMPLOYEES = "SELECT " + ", ".join(EMPLOYEE_COLUMNS) + " FROM Employees"
+
+class PooledConnection(sqlite3.Connection):
+    """
+    SQLite connection that also carries its own transaction state.
+
+    Transaction depth and batched-commit bookkeeping belong to a connection,
+    not to the Database object, because every thread writes through its own
+    connection.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.tx_depth = 0
+        self.pending_writes = 0
+        self.first_pending_at: Optional[float] = None
+        self.write_lock_owner: Optional[int] = None
+        # Serializes batched writes with the timer that flushes them
+        self.batch_lock = threading.RLock()
+        self.flush_timer: Optional[threading.Timer] = None
+
+class ConnectionPool:
+    """
+    Hands out one SQLite connection per thread.
+
+    File databases are opened in WAL mode (by default) so readers on other
+    threads keep working while one writer commits. Writers are serialized by
+    a single process-wide lock instead of racing for SQLite's lock and
+    hitting SQLITE_BUSY. In-memory databases only exist inside the
+    connection that created them, so they share a single connection.
+    """
+    def __init__(self, db_path: str, journal_mode: str = "WAL", synchronous: str = "NORMAL",
+                 busy_timeout_ms: int = 5000, cached_statements: int = 256):
+        """
+        Initialize the pool. Connections are opened lazily, per thread.
+
+        Args:
+            db_path: Path to the SQLite file (or ":memory:")
+            journal_mode: SQLite journal mode for file databases
+            synchronous: SQLite synchronous setting
+            busy_timeout_ms: How long a connection waits on a locked database
+            cached_statements: Size of each connection's prepared statement cache
+        """
+        self.db_path = db_path
+        self.journal_mode = journal_mode
+        self.synchronous = synchronous
+        self.busy_timeout_ms = busy_timeout_ms
+        self.cached_statements = cached_statements
+        self.in_memory = db_path == ":memory:" or "mode=memory" in db_path
+        # A plain lock, as re-entry is tracked per connection: a batch's
+        # flush timer must be able to release it for the writing thread
+        self.write_lock = threading.Lock()
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[PooledConnection] = []
+
+    def connection(self) -> PooledConnection:
+        """Return the calling thread's connection, opening it on first use"""
+        con = getattr(self._local, "con", None)
+        if con is None:
+            with self._lock:
+                if self.in_memory and self._connections:
+                    con = self._connections[0]
+                else:
+                    con = self._connect()
+                    self._connections.append(con)
+            self._local.con = con
+        return con
+
+    def _connect(self) -> PooledConnection:
+        """Open and configure a new connection"""
+        con = sqlite3.connect(
+            self.db_path,
+            timeout=self.busy_timeout_ms / 1000,
+            factory=PooledConnection,
+            check_same_thread=False,
+            cached_statements=self.cached_statements,
+            uri=self.db_path.startswith("file:")
+        )
+        if not self.in_memory:
+            con.execute(f"PRAGMA journal_mode={self.journal_mode}")
+        con.execute(f"PRAGMA synchronous={self.synchronous}")
+        return con
+
+    def release(self) -> None:
+        """Close the calling thread's connection (e.g. when a worker thread finishes)"""
+        con = getattr(self._local, "con", None)
+        if con is None or self.in_memory:
+            return
+        with self._lock:
+            self._connections.remove(con)
+        self._local.con = None
+        con.close()
+
+    def close_all(self) -> None:
+        """Close every connection opened by the pool"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for con in connections:
+            if con.flush_timer is not None:
+                con.flush_timer.cancel()
+            con.close()
+        self._local = threading.local()
 
 class Database:
     """
     Database class for handling SQLite operations.
+
+    A Database object may be shared between threads; each thread reads and
+    writes through its own pooled connection.
     """
-    def __init__(self, db_path: str):
-        
-        self.con = sqlite3.connect(db_path)
-        self.cur = self.con.cursor()
-
-        # Create employees table if it doesn't exist
-        sql = """
-        CREATE TABLE IF NOT EXISTS Employees(
-            id INTEGER PRIMARY KEY,
-            name TEXT,
-            age TEXT,
-            job TEXT,
-            email TEXT,
-            gender TEXT,
-            phone TEXT,
-            address TEXT
-        )
+
+    # Searches matching more rows than this are returned unranked
+    SEARCH_RANK_LIMIT = 5000
+    def __init__(self, db_path: str, commit_every: Optional[int] = None,
+                 commit_interval_ms: Optional[float] = None, journal_mode: str = "WAL",
+                 synchronous: str = "NORMAL", busy_timeout_ms: int = 5000):
         """
-        self.cur.execute(sql)
-        self.con.commit()
+        Open the database and create the schema if needed.
+
+        Args:
+            db_path: Path to the SQLite file (or ":memory:")
+            commit_every: Batch autocommits, flushing after this many writes
+            commit_interval_ms: Batch autocommits, flushing once the oldest
+                pending write is this many milliseconds old
+            journal_mode: SQLite journal mode for file databases
+            synchronous: SQLite synchronous setting
+            busy_timeout_ms: How long to wait on a locked database
+        """
+        self.db_path = db_path
+        self.pool = ConnectionPool(db_path, journal_mode=journal_mode, synchronous=synchronous,
+                                   busy_timeout_ms=busy_timeout_ms)
+        self.commit_every = commit_every
+        self.commit_interval_ms = commit_interval_ms
+
+        # Bumped on every write made through this object (see data_version)
+        self._write_counter = count(1)
+        self.write_count = 0
+
+        # Create or upgrade the schema in one transaction
+        with self.transaction() as con:
+            migrate(con)
+
+    @property
+    def con(self) -> PooledConnection:
+        """The calling thread's connection"""
+        return self.pool.connection()
+
+    def schema_version(self) -> int:
+        """Get the schema version this database file is at"""
+        return get_schema_version(self.con)
 
     def insert_employee(self, employee: Employee) -> int:
         """
         Insert a new employee record into the database.
-        
+
         Args:
             employee: Employee object containing data to insert
-        
+
         """
-        self.cur.execute(
-            "INSERT INTO Employees VALUES (NULL,?,?,?,?,?,?,?)",
-            employee.to_tuple()
-        )
-        self.con.commit()
-        return self.cur.lastrowid
+        with self._writing() as con:
+            cur = con.execute(
+                "INSERT INTO Employees(" + ", ".join(TRACKED_COLUMNS) + ") VALUES (?,?,?,?,?,?,?)",
+                employee.to_tuple()
+            )
+        return cur.lastrowid
+
+    def insert_employees(self, employees: Iterable[Employee]) -> List[int]:
+        """
+        Insert many employee records in a single transaction.
+
+        Rows are written with one executemany call and one commit, so the
+        cost of a batch is dominated by SQLite rather than per-row fsyncs.
+        The search index and statistics are updated once for the whole
+        batch instead of by the per-row triggers, and the rows are stamped
+        with their change numbers as they are written.
+        Any id already set on the Employee objects is ignored.
+
+        Args:
+            employees: Iterable of Employee objects to insert
+
+        Returns:
+            List of the new employee IDs, in input order
+        """
+        with self.transaction() as con:
+            first_id = con.execute("SELECT COALESCE(MAX(id), 0) FROM Employees").fetchone()[0] + 1
+            next_id = count(first_id)
+
+            # Ids and change numbers are both consecutive, so row id gets
+            # change number base + (id - first_id) + 1
+            now, base = con.execute(f"SELECT {NOW_SQL}, seq FROM change_counter").fetchone()
+            offset = base - first_id + 1
+
+            def rows():
+                for e in employees:
+                    employee_id = next(next_id)
+                    yield (employee_id, e.name, e.age, e.job, e.email, e.gender, e.phone, e.address,
+                           now, now, employee_id + offset, employee_id + offset)
+
+            # Skip the per-row insert triggers and update the search index and
+            # statistics for the whole batch afterwards (see TRIGGER_GUARD)
+            con.execute("UPDATE trigger_control SET bulk_load = 1")
+            con.executemany(
+                "INSERT INTO Employees(id, " + ", ".join(TRACKED_COLUMNS) +
+                ", created_at, updated_at, created_seq, change_seq) VALUES (?,?,?,?,?,?,?,?,?,?,?,?)",
+                rows()
+            )
+            last_id = next(next_id) - 1
+            if last_id >= first_id:
+                for statement in DEFERRED_INSERT_SQL:
+                    con.execute(statement, (first_id, last_id))
+                con.execute("UPDATE change_counter SET seq = ?", (last_id + offset,))
+            con.execute("UPDATE trigger_control SET bulk_load = 0")
+        return list(range(first_id, last_id + 1))
 
     def fetch_all_employees(self) -> List[Tuple]:
-        self.cur.execute("SELECT * FROM Employees")
-        rows = self.cur.fetchall()
-        return rows
+        return self.con.execute(SELECT_EMPLOYEES).fetchall()
+
+    def fetch_employees_page(self, after_id: int = 0, limit: int = 100) -> List[Tuple]:
+        """
+        Fetch one page of employees ordered by ID using keyset pagination.
+
+        Each page starts from the last ID of the previous one, so fetching
+        page N costs the same as fetching page 1 (no OFFSET scan).
+
+        Args:
+            after_id: Return employees with an ID greater than this
+            limit: Maximum number of rows in the page
+
+        Returns:
+            List of employee rows; pass the last row's ID to get the next page
+        """
+        return self.con.execute(
+            SELECT_EMPLOYEES + " WHERE id > ? ORDER BY id LIMIT ?", (after_id, limit)
+        ).fetchall()
+
+    def fetch_employees_at(self, position: int, limit: int = 100, from_id: Optional[int] = None) -> List[Tuple]:
+        """
+        Fetch one page of employees starting a number of rows into ID order.
+
+        With from_id the position counts from that employee, so moving a
+        few rows costs a short walk of the primary key from there. Without
+        it the position counts from the first employee: when the IDs have
+        no gaps the starting ID is computed directly, otherwise OFFSET
+        walks the key from the start.
+
+        Args:
+            position: Rows to move before the page starts; negative values
+                move back from from_id
+            limit: Maximum number of rows in the page
+            from_id: Employee to count from; need not exist any more
+
+        Returns:
+            List of employee rows; moving back past the first employee
+            starts from it, moving past the last one returns no rows
+        """
+        con = self.con
+        if from_id is not None:
+            if position >= 0:
+                row = con.execute("SELECT id FROM Employees WHERE id >= ? ORDER BY id LIMIT 1 OFFSET ?",
+                                  (from_id, position)).fetchone()
+            else:
+                row = con.execute("SELECT id FROM Employees WHERE id < ? ORDER BY id DESC LIMIT 1 OFFSET ?",
+                                  (from_id, -position - 1)).fetchone()
+                row = row or (0,)
+            return self.fetch_employees_page(row[0] - 1, limit) if row else []
+
+        if position <= 0:
+            return self.fetch_employees_page(0, limit)
+        # Each subquery is answered from one end of the primary key or the smallest index
+        lowest, highest, count = con.execute(
+            "SELECT (SELECT min(id) FROM Employees), (SELECT max(id) FROM Employees), "
+            "(SELECT count(*) FROM Employees)"
+        ).fetchone()
+        if not count or position >= count:
+            return []
+        if highest - lowest + 1 == count:
+            return self.fetch_employees_page(lowest + position - 1, limit)
+        row = con.execute("SELECT id FROM Employees ORDER BY id LIMIT 1 OFFSET ?", (position,)).fetchone()
+        return self.fetch_employees_page(row[0] - 1, limit)
+
+    def iter_employees(self, chunk_size: int = 1000, filters: Optional[Dict[str, Any]] = None,
+                       order_by: Union[None, str, Sequence[str]] = None) -> Iterator[Tuple]:
+        """
+        Stream employee rows without loading the table.
+
+        Rows are pulled from a single cursor with fetchmany, so at most
+        chunk_size rows are held in memory and the whole iteration reads
+        one consistent snapshot.
+
+        Args:
+            chunk_size: Number of rows fetched from SQLite at a time
+            filters: Optional filter spec (see db.query)
+            order_by: Optional sort spec; defaults to ID order
+        """
+        sql, params = compile_query(filters, order_by)
+        cur = self.con.execute(sql, params)
+        try:
+            while True:
+                rows = cur.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cur.close()
+
+    def query_employees(self, filters: Optional[Dict[str, Any]] = None,
+                        order_by: Union[None, str, Sequence[str]] = None,
+                        limit: Optional[int] = None, offset: Optional[int] = None) -> List[Tuple]:
+        """
+        Filter, sort and limit employees in SQL.
+
+        Args:
+            filters: Filter spec, e.g. {'job': 'Engineer', 'age': {'gte': 30}}
+            order_by: Column name or list of names; prefix with '-' for descending
+            limit: Maximum number of rows
+            offset: Number of rows to skip
+
+        Returns:
+            List of matching employee rows
+
+        Raises:
+            ValueError: If the spec names an unknown column or operator
+        """
+        sql, params = compile_query(filters, order_by, limit, offset)
+        return self.con.execute(sql, params).fetchall()
+
+    def count_employees(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count employees matching a filter spec (all employees by default).
+
+        Args:
+            filters: Filter spec, as for query_employees
+        """
+        sql, params = compile_query(filters, count_only=True)
+        return self.con.execute(sql, params).fetchone()[0]
+
+    def max_value_lengths(self, filters: Optional[Dict[str, Any]] = None) -> List[int]:
+        """
+        Longest text length of each column over the matching employees.
+
+        Computed by SQLite in one aggregate query, so callers can size
+        output columns without walking the rows in Python.
+
+        Args:
+            filters: Filter spec, as for query_employees
+
+        Returns:
+            One length per column, in EMPLOYEE_COLUMNS order (0 if no rows)
+        """
+        sql, params = compile_query(filters, aggregate=", ".join(
+            f"MAX(LENGTH({column}))" for column in EMPLOYEE_COLUMNS))
+        return [length or 0 for length in self.con.execute(sql, params).fetchone()]
+
+    def fetch_employee_by_id(self, employee_id: int) -> Optional[Tuple]:
+        """
+        Fetch a single employee record by primary key.
+
+        Args:
+            employee_id: ID of the employee to fetch
+
+        Returns:
+            The employee row, or None if no such employee exists
+        """
+        return self.con.execute(SELECT_EMPLOYEES + " WHERE id=?", (employee_id,)).fetchone()
+
+    def fetch_employees_by_email(self, email: str) -> List[Tuple]:
+        """
+        Fetch employee records with the given email using the email index.
+
+        Args:
+            email: Email address to look up
+
+        Returns:
+            List of matching employee rows
+        """
+        return self.con.execute(SELECT_EMPLOYEES + " WHERE email=? ORDER BY id", (email,)).fetchall()
+
+    def find_duplicate(self, email: str, phone: str, exclude_id: Optional[int] = None) -> Optional[Tuple[int, str]]:
+        """
+        Find an employee with the same email or phone number, as normalized
+        by migration 6 (email case and spaces, phone formatting ignored).
+        Empty values match nothing.
+
+        Each field is one lookup on its key index. With exclude_id, a field
+        is only checked if the value differs from that employee's current
+        one, so records saved twice before the check existed can still be
+        edited as long as the edit does not add a duplicate.
+
+        Args:
+            email: Email address to look for
+            phone: Phone number to look for
+            exclude_id: Employee to leave out, e.g. the one being updated
+
+        Returns:
+            (employee_id, field) of the lowest matching id, checking email
+            first, or None if there is no match
+        """
+        for field, value in (('email', email), ('phone', phone)):
+            column, template = DUPLICATE_KEYS[field]
+            key = template.format('?')
+            row = self.con.execute(
+                f"SELECT id FROM Employees WHERE {column} = {key} AND {column} != '' AND id IS NOT ? "
+                f"AND {key} IS NOT (SELECT {column} FROM Employees WHERE id = ?) ORDER BY id LIMIT 1",
+                (value, exclude_id, value, exclude_id)
+            ).fetchone()
+            if row:
+                return row[0], field
+        return None
+
+    def find_duplicates(self, values: Sequence[Tuple[str, str]]) -> Dict[str, List[Tuple[str, Optional[int]]]]:
+        """
+        Look up many (email, phone) pairs at once, as find_duplicate does one.
+
+        Each field is one query over the whole list, passed as a JSON
+        array: every value is normalized in SQL, exactly as the key
+        columns are, and looked up on its key index.
+
+        Args:
+            values: (email, phone) pairs
+
+        Returns:
+            For 'email' and 'phone', one (key, employee_id) pair per input
+            pair: the normalized value and the lowest id of an employee
+            with that key, or None if there is none or the key is empty
+        """
+        matches = {}
+        for position, field in enumerate(('email', 'phone')):
+            column, template = DUPLICATE_KEYS[field]
+            key = template.format('value')
+            matches[field] = self.con.execute(
+                f"SELECT {key}, (SELECT MIN(id) FROM Employees WHERE {column} = {key} AND {column} != '') "
+                f"FROM json_each(?) ORDER BY json_each.key",
+                (json.dumps([pair[position] for pair in values]),)
+            ).fetchall()
+        return matches
+
+    def fetch_duplicate_groups(self, field: str) -> List[Tuple[str, List[int]]]:
+        """
+        Find every set of employees sharing a normalized email or phone number.
+
+        One GROUP BY over the key index, so the cost is a single ordered
+        scan of the index rather than a comparison of every pair of rows.
+        Empty values are not reported.
+
+        Args:
+            field: 'email' or 'phone'
+
+        Returns:
+            (key, employee_ids) per group of two or more, ordered by key,
+            with the ids in ascending order
+        """
+        column, _ = DUPLICATE_KEYS[field]
+        rows = self.con.execute(
+            f"SELECT {column}, group_concat(id) FROM Employees WHERE {column} != '' "
+            f"GROUP BY {column} HAVING COUNT(*) > 1 ORDER BY {column}"
+        ).fetchall()
+        return [(key, sorted(map(int, ids.split(',')))) for key, ids in rows]
+
+    def refresh_name_keys(self, name_key: Callable[[str], str], chunk_size: int = 5000) -> int:
+        """
+        Fill in name_key for employees that do not have one yet.
+
+        New rows and renamed rows have a NULL name_key (see migration 7),
+        found through its index, so the cost follows the number of
+        changed rows. Each chunk is committed on its own.
+
+        Args:
+            name_key: Computes the key from a name
+            chunk_size: Rows updated per transaction
+
+        Returns:
+            Number of rows updated
+        """
+        updated = 0
+        while True:
+            with self.transaction() as con:
+                rows = con.execute(
+                    "SELECT id, name FROM Employees WHERE name_key IS NULL LIMIT ?", (chunk_size,)
+                ).fetchall()
+                con.executemany("UPDATE Employees SET name_key = ? WHERE id = ?",
+                                [(name_key(name or ''), employee_id) for employee_id, name in rows])
+            updated += len(rows)
+            if len(rows) < chunk_size:
+                return updated
+
+    def iter_by_blocking_key(self, key: str, chunk_size: int = 1000) -> Iterator[Tuple]:
+        """
+        Stream employees ordered by one blocking key, skipping empty keys.
+
+        Args:
+            key: One of BLOCKING_KEYS
+            chunk_size: Rows fetched at a time
+
+        Returns:
+            Iterator of (key, id, name, address, name_key, address_key,
+            phone_tail) tuples
+        """
+        if key not in BLOCKING_KEYS:
+            raise ValueError(f"Unknown blocking key '{key}'")
+        cur = self.con.execute(
+            f"SELECT {key}, id, name, address, {', '.join(BLOCKING_KEYS)} "
+            f"FROM Employees WHERE {key} != '' ORDER BY {key}, id"
+        )
+        try:
+            while True:
+                rows = cur.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cur.close()
+
+    def fetch_employees_by_name(self, name: str) -> List[Tuple]:
+        """
+        Fetch employee records with the given name using the name index.
+
+        Args:
+            name: Employee name to look up
+
+        Returns:
+            List of matching employee rows
+        """
+        return self.con.execute(SELECT_EMPLOYEES + " WHERE name=? ORDER BY id", (name,)).fetchall()
+
+    def search_employees(self, query: str, limit: int = 100) -> List[Tuple]:
+        """
+        Full-text search over name, job, email and address.
+
+        Every word in the query is matched as a prefix and all words must
+        match, so "jo dev" finds "John Doe, Developer". Results are ordered
+        by relevance, unless more than SEARCH_RANK_LIMIT rows match, in
+        which case they come back in ID order. A purely numeric query also matches that employee ID.
+
+        Args:
+            query: Free-text search string
+            limit: Maximum number of rows to return
+
+        Returns:
+            List of matching employee rows, best match first
+        """
+        rows: List[Tuple] = []
+        # Only ASCII digits: str.isdigit() also accepts '²', which int() rejects
+        number = query.strip()
+        if number.isascii() and number.isdigit():
+            row = self.fetch_employee_by_id(int(number))
+            if row is not None:
+                rows.append(row)
+
+        # Quote each word so user input can never be parsed as FTS5 syntax
+        words = re.findall(r"\w+", query.lower())
+        if not words or len(rows) >= limit:
+            return rows[:limit]
+        match = " ".join(f'"{word}"*' for word in words)
+
+        # Ranking has to score every match, so only rank when the query is
+        # selective enough; very broad prefixes (the first keystroke or two)
+        # return matches in ID order instead of stalling on millions of rows
+        con = self.con
+        candidates = con.execute(
+            "SELECT rowid FROM employees_fts WHERE employees_fts MATCH ? LIMIT ?",
+            (match, self.SEARCH_RANK_LIMIT)
+        ).fetchall()
+        order = "rank" if len(candidates) < self.SEARCH_RANK_LIMIT else "rowid"
+
+        cur = con.execute(
+            "SELECT " + ", ".join("e." + column for column in EMPLOYEE_COLUMNS) + f"""
+            FROM (SELECT rowid, {order} AS ordering FROM employees_fts
+                  WHERE employees_fts MATCH ? ORDER BY {order} LIMIT ?) AS hits
+            JOIN Employees e ON e.id = hits.rowid
+            ORDER BY hits.ordering
+            """,
+            (match, limit)
+        )
+        seen = {row[0] for row in rows}
+        rows.extend(row for row in cur if row[0] not in seen)
+        return rows[:limit]
+
+    def fetch_statistics(self) -> List[Tuple]:
+        """
+        Read the trigger-maintained headcount summaries.
+
+        Cost is proportional to the number of distinct jobs, genders and
+        age bands, not to the number of employees.
+
+        Returns:
+            List of (dimension, value, headcount) rows; dimension is 'job',
+            'gender' or 'age_band' and a missing value is stored as ''
+        """
+        return self.con.execute(
+            "SELECT dimension, value, headcount FROM employee_stats ORDER BY dimension, value"
+        ).fetchall()
+
+    def rebuild_statistics(self) -> None:
+        """Recompute the headcount summaries from scratch in one transaction"""
+        with self.transaction() as con:
+            for statement in STATS_REBUILD_SQL:
+                con.execute(statement)
+
+    def verify_statistics(self) -> List[Tuple]:
+        """
+        Compare the headcount summaries against a live GROUP BY of Employees.
+
+        Returns:
+            List of (dimension, value, stored, actual) rows that disagree;
+            empty when the summaries are consistent
+        """
+        return self.con.execute(f"""
+            WITH actual AS ({STATS_ACTUAL_SQL})
+            SELECT s.dimension, s.value, s.headcount, COALESCE(a.headcount, 0)
+            FROM employee_stats s
+            LEFT JOIN actual a ON a.dimension = s.dimension AND a.value = s.value
+            WHERE s.headcount != COALESCE(a.headcount, 0)
+            UNION ALL
+            SELECT a.dimension, a.value, 0, a.headcount
+            FROM actual a
+            WHERE NOT EXISTS (SELECT 1 FROM employee_stats s
+                              WHERE s.dimension = a.dimension AND s.value = a.value)
+        """).fetchall()
+
+    def change_position(self) -> int:
+        """Number of the latest insert, update or delete (see db.migrations change tracking)"""
+        return self.con.execute("SELECT seq FROM change_counter").fetchone()[0]
+
+    def iter_changes(self, since: int, until: Optional[int] = None,
+                     chunk_size: int = 1000) -> Iterator[Tuple[str, int, str, Optional[Tuple]]]:
+        """
+        Stream the employees inserted, updated or deleted after a change number.
+
+        Both the rows and the tombstones are read through their change_seq
+        index, so the cost depends on how much changed, not on the size of
+        the table. Each employee appears once, with its latest values; a
+        row inserted and then updated in the range is one insert. A
+        delete may be reported for an employee that was also inserted in
+        the range.
+
+        Changes made while iterating have numbers above until and are left
+        for the next call that starts from until.
+
+        Args:
+            since: Report changes with a number greater than this
+            until: ...and not greater than this; defaults to change_position()
+            chunk_size: Number of rows fetched from SQLite at a time
+
+        Returns:
+            Iterator of (op, employee_id, changed_at, row) in change order,
+            where op is 'insert', 'update' or 'delete' and row is the
+            employee row (None for deletes)
+        """
+        if until is None:
+            until = self.change_position()
+        con = self.con
+
+        def upserts():
+            cur = con.execute(
+                "SELECT " + ", ".join(EMPLOYEE_COLUMNS) + ", created_seq, updated_at, change_seq "
+                "FROM Employees WHERE change_seq > ? AND change_seq <= ? ORDER BY change_seq",
+                (since, until)
+            )
+            try:
+                while True:
+                    rows = cur.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    for *row, created_seq, updated_at, change_seq in rows:
+                        op = 'insert' if created_seq > since else 'update'
+                        yield change_seq, (op, row[0], updated_at, tuple(row))
+            finally:
+                cur.close()
+
+        def deletes():
+            cur = con.execute(
+                "SELECT id, deleted_at, change_seq FROM employee_tombstones "
+                "WHERE change_seq > ? AND change_seq <= ? ORDER BY change_seq",
+                (since, until)
+            )
+            try:
+                while True:
+                    rows = cur.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    for employee_id, deleted_at, change_seq in rows:
+                        yield change_seq, ('delete', employee_id, deleted_at, None)
+            finally:
+                cur.close()
+
+        for _, change in heapq.merge(upserts(), deletes(), key=lambda item: item[0]):
+            yield change
+
+    def count_changes(self, since: int, until: Optional[int] = None) -> int:
+        """Number of changes iter_changes(since, until) reports, counted through the indexes"""
+        if until is None:
+            until = self.change_position()
+        return self.con.execute("""
+            SELECT (SELECT COUNT(*) FROM Employees WHERE change_seq > ?1 AND change_seq <= ?2)
+                 + (SELECT COUNT(*) FROM employee_tombstones WHERE change_seq > ?1 AND change_seq <= ?2)
+        """, (since, until)).fetchone()[0]
+
+    def get_checkpoint(self, name: str) -> Optional[int]:
+        """
+        Get the change number an export checkpoint was left at.
+
+        Args:
+            name: Checkpoint name, e.g. 'payroll'
+
+        Returns:
+            The change number, or None if the checkpoint does not exist
+        """
+        row = self.con.execute("SELECT change_seq FROM export_checkpoints WHERE name=?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def set_checkpoint(self, name: str, change_seq: int) -> None:
+        """
+        Create or move an export checkpoint.
+
+        Args:
+            name: Checkpoint name
+            change_seq: Change number the next delta export starts after
+        """
+        with self._writing() as con:
+            con.execute(f"""
+                INSERT INTO export_checkpoints(name, change_seq, updated_at) VALUES (?, ?, {NOW_SQL})
+                ON CONFLICT(name) DO UPDATE SET change_seq = excluded.change_seq, updated_at = excluded.updated_at
+            """, (name, change_seq))
+
+    def fetch_checkpoints(self) -> List[Tuple]:
+        """List every export checkpoint as (name, change_seq, updated_at) rows"""
+        return self.con.execute(
+            "SELECT name, change_seq, updated_at FROM export_checkpoints ORDER BY name"
+        ).fetchall()
 
     def remove_employee(self, employee_id: int) -> bool:
         """
         Remove an employee record from the database.
-        
+
         Args:
             employee_id: ID of the employee to remove
-            
+
         Returns:
             True if successful, False otherwise
         """
-        self.cur.execute("DELETE FROM Employees WHERE id=?", (employee_id,))
-        self.con.commit()
-        return self.cur.rowcount > 0
+        with self._writing() as con:
+            cur = con.execute("DELETE FROM Employees WHERE id=?", (employee_id,))
+        return cur.rowcount > 0
 
     def update_employee(self, employee: Employee) -> bool:
         """
         Update an employee record in the database.
-        
+
         Args:
             employee: Employee object containing updated data
-            
+
         Returns:
             True if successful, False otherwise
         """
         if employee.id is None:
             return False
-            
-        self.cur.execute(
-            "UPDATE Employees SET name=?, age=?, job=?, email=?, gender=?, phone=?, address=? WHERE id=?",
-            employee.to_tuple()
-        )
-        self.con.commit()
-        return self.cur.rowcount > 0
-        
+
+        with self._writing() as con:
+            cur = con.execute(
+                "UPDATE Employees SET name=?, age=?, job=?, email=?, gender=?, phone=?, address=? WHERE id=?",
+                employee.to_tuple()
+            )
+        return cur.rowcount > 0
+
+    @contextmanager
+    def transaction(self) -> Iterator[PooledConnection]:
+        """
+        Group any number of writes into one atomic commit.
+
+        Usage:
+            with db.transaction():
+                db.insert_employee(...)
+                db.remove_employee(...)
+
+        The outermost block commits on success and rolls back if an
+        exception escapes. Nested blocks use savepoints, so an inner block
+        that fails is undone without aborting the outer one. The block
+        belongs to the calling thread's connection and holds the writer
+        lock until it ends.
+        """
+        con = self.con
+        if con.tx_depth == 0:
+            # Commit anything left over from autocommit batching first so
+            # a rollback here only discards this block's writes
+            self.flush()
+            self._acquire_write_lock(con)
+            try:
+                con.execute("BEGIN IMMEDIATE")
+            except BaseException:
+                self._release_write_lock(con)
+                raise
+        else:
+            con.execute(f"SAVEPOINT tx_{con.tx_depth}")
+
+        con.tx_depth += 1
+        try:
+            yield con
+        except BaseException:
+            self.write_count = next(self._write_counter)
+            con.tx_depth -= 1
+            if con.tx_depth == 0:
+                con.rollback()
+                self._release_write_lock(con)
+            else:
+                con.execute(f"ROLLBACK TO tx_{con.tx_depth}")
+                con.execute(f"RELEASE tx_{con.tx_depth}")
+            raise
+        else:
+            self.write_count = next(self._write_counter)
+            con.tx_depth -= 1
+            if con.tx_depth == 0:
+                try:
+                    con.commit()
+                finally:
+                    self._release_write_lock(con)
+            else:
+                con.execute(f"RELEASE tx_{con.tx_depth}")
+
+    def data_version(self) -> Tuple[int, int]:
+        """
+        Token that changes whenever the data may have changed.
+
+        Combines a counter of writes made through this Database object with
+        SQLite's PRAGMA data_version, which changes when another connection
+        (e.g. another process) commits. Compare tokens taken on the same
+        thread; each thread's connection has its own PRAGMA counter.
+        """
+        return self.write_count, self.con.execute("PRAGMA data_version").fetchone()[0]
+
+    def backup(self, path: str, pages: int = -1,
+               progress: Optional[Callable[[int, int], None]] = None, sleep: float = 0.0) -> None:
+        """
+        Copy a consistent snapshot of the database to another file.
+
+        Uses SQLite's online backup API, so other connections can keep
+        reading and writing while the copy is made. With pages > 0 the
+        copy is made in steps of that many pages, pausing between steps.
+
+        A stepped backup restarts from the first page whenever another
+        connection commits, which under steady writes means it never
+        finishes. So the steps read from one read transaction held on this
+        thread's connection; in WAL mode writers are not blocked by it and
+        the copy is the database as of the first step.
+
+        Args:
+            path: Destination database file (overwritten)
+            pages: Pages copied per step; -1 copies everything in one step
+            progress: Called as progress(pages_copied, total_pages) after
+                each step; an exception raised here aborts the copy
+            sleep: Seconds to pause between steps
+        """
+        self.flush()
+        con = self.con
+        def report(status, remaining, total):
+            progress(total - remaining, total)
+
+        # The shared in-memory connection may be in use by other threads,
+        # and writes through the source connection itself do not restart
+        # a backup, so only file databases need the read transaction
+        hold = not self.pool.in_memory and not con.in_transaction
+        target = sqlite3.connect(path)
+        try:
+            if hold:
+                con.execute("BEGIN")
+                con.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+            con.backup(target, pages=pages, progress=report if progress is not None else None, sleep=sleep)
+        finally:
+            if hold:
+                con.commit()
+            target.close()
+
+    def set_commit_batching(self, commit_every: Optional[int] = None,
+                            commit_interval_ms: Optional[float] = None) -> None:
+        """
+        Configure autocommit batching for high-rate ingestion.
+
+        Outside of transaction(), writes are normally committed one by one.
+        With batching enabled they are committed together once commit_every
+        writes are pending or the oldest pending write is older than
+        commit_interval_ms. A timer flushes the batch once the interval
+        has passed even if no further write arrives, so a quiet tail is
+        committed and the writer lock released on its own. Passing no
+        limits turns batching off.
+
+        A thread with pending batched writes holds the writer lock until
+        they are flushed, so other threads wait for the batch: set an
+        interval when they may need to write too.
+
+        Args:
+            commit_every: Flush after this many pending writes
+            commit_interval_ms: Flush once pending writes are this old
+        """
+        self.flush()
+        self.commit_every = commit_every
+        self.commit_interval_ms = commit_interval_ms
+
+    def flush(self) -> None:
+        """Commit any writes held back by autocommit batching on this thread"""
+        self._flush(self.con)
+
+    def _flush(self, con: PooledConnection, owner: Optional[int] = None) -> None:
+        """Commit a connection's batched writes and release the writer lock held for owner"""
+        with con.batch_lock:
+            if con.tx_depth:
+                return
+            if con.flush_timer is not None:
+                con.flush_timer.cancel()
+                con.flush_timer = None
+            try:
+                if con.in_transaction:
+                    con.commit()
+            finally:
+                con.pending_writes = 0
+                con.first_pending_at = None
+                self._release_write_lock(con, owner)
+
+    def _flush_when_due(self, con: PooledConnection) -> None:
+        """Flush timer callback: commit the batch it was started for"""
+        with con.batch_lock:
+            # The batch was flushed, and maybe a new one started, meanwhile
+            if con.flush_timer is not threading.current_thread():
+                return
+            try:
+                self._flush(con, con.write_lock_owner)
+            except sqlite3.ProgrammingError:
+                # The database was closed
+                pass
+
+    @contextmanager
+    def _writing(self) -> Iterator[PooledConnection]:
+        """
+        Run a single write on this thread's connection under the writer lock.
+
+        The write is committed afterwards unless a transaction or commit
+        batch is collecting it. A failed write with nothing else pending is
+        rolled back so the writer lock is not left held.
+        """
+        con = self.con
+        thread_id = threading.get_ident()
+        self._acquire_write_lock(con)
+        con.batch_lock.acquire()
+        # A flush timer may have committed the batch, and released the
+        # lock, while this thread waited for batch_lock
+        while con.write_lock_owner != thread_id:
+            con.batch_lock.release()
+            self._acquire_write_lock(con)
+            con.batch_lock.acquire()
+        try:
+            try:
+                yield con
+            except BaseException:
+                if con.tx_depth == 0 and con.pending_writes == 0:
+                    con.rollback()
+                    self._release_write_lock(con)
+                raise
+            finally:
+                self.write_count = next(self._write_counter)
+            self._write_done(con)
+        finally:
+            con.batch_lock.release()
+
+    def _write_done(self, con: PooledConnection, writes: int = 1) -> None:
+        """Commit after a write unless a transaction or batch is collecting it"""
+        if con.tx_depth:
+            return
+        if self.commit_every is None and self.commit_interval_ms is None:
+            self._flush(con)
+            return
+
+        now = time.monotonic()
+        if con.first_pending_at is None:
+            con.first_pending_at = now
+            if self.commit_interval_ms is not None and self.commit_interval_ms > 0:
+                con.flush_timer = threading.Timer(self.commit_interval_ms / 1000, self._flush_when_due, (con,))
+                con.flush_timer.daemon = True
+                con.flush_timer.start()
+        con.pending_writes += writes
+
+        if ((self.commit_every is not None and con.pending_writes >= self.commit_every) or
+                (self.commit_interval_ms is not None and
+                 (now - con.first_pending_at) * 1000 >= self.commit_interval_ms)):
+            self._flush(con)
+
+    def _acquire_write_lock(self, con: PooledConnection) -> None:
+        """Take the single-writer lock for this thread if not already held"""
+        thread_id = threading.get_ident()
+        if con.write_lock_owner != thread_id:
+            self.pool.write_lock.acquire()
+            con.write_lock_owner = thread_id
+
+    def _release_write_lock(self, con: PooledConnection, owner: Optional[int] = None) -> None:
+        """Give up the single-writer lock if this thread (or owner) holds it"""
+        if con.write_lock_owner == (owner or threading.get_ident()):
+            con.write_lock_owner = None
+            self.pool.write_lock.release()
+
+    def release_connection(self) -> None:
+        """Close the calling thread's connection; call from worker threads when done"""
+        self.flush()
+        self.pool.release()
+
     def close(self):
         """Close the database connection"""
-        if self.con:
-            self.con.close()
+        if self.pool:
+            self.flush()
+            self.pool.close_all()
@@ -0,0 +1,444 @@
+import sqlite3
+from typing import Callable, List, Optional, Tuple
+from models.employee import GENDERS, MIN_AGE, MAX_AGE
+
+# Every schema change is a numbered migration. A database records the
+# versions it has applied in schema_version, and migrate() applies whatever
+# is missing, in order. Migrations are never edited once released; changes
+# go into a new one.
+
+SCHEMA_VERSION_SQL = """
+CREATE TABLE IF NOT EXISTS schema_version(
+    version INTEGER PRIMARY KEY,
+    description TEXT NOT NULL,
+    applied_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+# Full-text index over the searchable columns, kept in sync with Employees by triggers.
+# It is an external-content table, so it stores only the index, not a copy of the rows.
+FTS_TABLE_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS employees_fts USING fts5(
+    name, job, email, address,
+    content='Employees', content_rowid='id', prefix='1 2 3'
+)
+"""
+
+FTS_TRIGGERS_SQL = [
+    """
+    CREATE TRIGGER IF NOT EXISTS employees_fts_ai AFTER INSERT ON Employees BEGIN
+        INSERT INTO employees_fts(rowid, name, job, email, address)
+        VALUES (new.id, new.name, new.job, new.email, new.address);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS employees_fts_ad AFTER DELETE ON Employees BEGIN
+        INSERT INTO employees_fts(employees_fts, rowid, name, job, email, address)
+        VALUES ('delete', old.id, old.name, old.job, old.email, old.address);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS employees_fts_au AFTER UPDATE OF name, job, email, address ON Employees BEGIN
+        INSERT INTO employees_fts(employees_fts, rowid, name, job, email, address)
+        VALUES ('delete', old.id, old.name, old.job, old.email, old.address);
+        INSERT INTO employees_fts(rowid, name, job, email, address)
+        VALUES (new.id, new.name, new.job, new.email, new.address);
+    END
+    """,
+]
+
+def _baseline(con: sqlite3.Connection) -> None:
+    """
+    Version 1: the original untyped Employees table, lookup indexes and FTS.
+
+    Every statement is IF NOT EXISTS so files created before versioning
+    existed are adopted as-is.
+    """
+    con.execute("""
+        CREATE TABLE IF NOT EXISTS Employees(
+            id INTEGER PRIMARY KEY,
+            name TEXT,
+            age TEXT,
+            job TEXT,
+            email TEXT,
+            gender TEXT,
+            phone TEXT,
+            address TEXT
+        )
+    """)
+
+    # Secondary indexes for single-record lookups (id is already the rowid)
+    con.execute("CREATE INDEX IF NOT EXISTS idx_employees_email ON Employees(email)")
+    con.execute("CREATE INDEX IF NOT EXISTS idx_employees_name ON Employees(name)")
+
+    # Full-text search index; populate it once if this file predates it
+    fts_exists = con.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='employees_fts'"
+    ).fetchone()
+    con.execute(FTS_TABLE_SQL)
+    for statement in FTS_TRIGGERS_SQL:
+        con.execute(statement)
+    if not fts_exists:
+        con.execute("INSERT INTO employees_fts(employees_fts) VALUES ('rebuild')")
+
+def _typed_columns(con: sqlite3.Connection) -> None:
+    """
+    Version 2: rebuild Employees with typed, constrained columns.
+
+    age becomes an INTEGER in [MIN_AGE, MAX_AGE] and gender is limited to
+    GENDERS. The copy is one set-based INSERT ... SELECT, and the indexes
+    are built after the data is in place, which is far cheaper than
+    maintaining them row by row. Legacy values that do not fit (a
+    non-numeric age, an unknown gender) are stored as NULL; the original
+    rows are kept in employees_v1_nonconforming for review.
+    """
+    genders = ", ".join(f"'{gender}'" for gender in GENDERS)
+    age_ok = (f"(trim(age) != '' AND trim(age) NOT GLOB '*[^0-9]*' "
+              f"AND CAST(trim(age) AS INTEGER) BETWEEN {MIN_AGE} AND {MAX_AGE})")
+    gender_case = "CASE lower(trim(gender)) " + " ".join(
+        f"WHEN '{gender.lower()}' THEN '{gender}'" for gender in GENDERS
+    ) + " END"
+
+    # Keep the original text of any row whose values cannot be converted
+    con.execute(f"""
+        CREATE TABLE employees_v1_nonconforming AS
+        SELECT * FROM Employees WHERE NOT {age_ok} OR ({gender_case}) IS NULL
+    """)
+    if con.execute("SELECT COUNT(*) FROM employees_v1_nonconforming").fetchone()[0] == 0:
+        con.execute("DROP TABLE employees_v1_nonconforming")
+
+    con.execute(f"""
+        CREATE TABLE Employees_new(
+            id INTEGER PRIMARY KEY,
+            name TEXT NOT NULL DEFAULT '',
+            age INTEGER CHECK (age IS NULL OR (typeof(age) = 'integer' AND age BETWEEN {MIN_AGE} AND {MAX_AGE})),
+            job TEXT NOT NULL DEFAULT '',
+            email TEXT NOT NULL DEFAULT '',
+            gender TEXT CHECK (gender IS NULL OR gender IN ({genders})),
+            phone TEXT NOT NULL DEFAULT '',
+            address TEXT NOT NULL DEFAULT ''
+        )
+    """)
+    con.execute(f"""
+        INSERT INTO Employees_new(id, name, age, job, email, gender, phone, address)
+        SELECT id, COALESCE(name, ''),
+               CASE WHEN {age_ok} THEN CAST(trim(age) AS INTEGER) END,
+               COALESCE(job, ''), COALESCE(email, ''), {gender_case},
+               COALESCE(phone, ''), COALESCE(address, '')
+        FROM Employees
+    """)
+
+    # Dropping the old table also drops its indexes and the FTS triggers.
+    # Ids and text columns are unchanged, so the FTS index itself stays valid.
+    con.execute("DROP TABLE Employees")
+    con.execute("ALTER TABLE Employees_new RENAME TO Employees")
+
+    con.execute("CREATE INDEX idx_employees_email ON Employees(email)")
+    con.execute("CREATE INDEX idx_employees_name ON Employees(name)")
+    con.execute("CREATE INDEX idx_employees_age ON Employees(age)")
+    for statement in FTS_TRIGGERS_SQL:
+        con.execute(statement)
+
+def _filter_indexes(con: sqlite3.Connection) -> None:
+    """Version 3: index the job column, the most common equality filter"""
+    con.execute("CREATE INDEX IF NOT EXISTS idx_employees_job ON Employees(job)")
+
+# Headcount summaries maintained by triggers, so statistics are read from a
+# few rows per group instead of a scan of Employees. Each dimension stores
+# one row per distinct value; NULL is stored as '' so it can be a key.
+STATS_KEYS = {
+    'job': "COALESCE({row}.job, '')",
+    'gender': "COALESCE({row}.gender, '')",
+    'age_band': "COALESCE({row}.age / 10 * 10, '')",
+}
+
+def _stats_increment(row: str) -> str:
+    """SQL that adds the given row (new/old) to every dimension"""
+    values = ", ".join(f"('{dimension}', {key.format(row=row)}, 1)" for dimension, key in STATS_KEYS.items())
+    return (f"INSERT INTO employee_stats(dimension, value, headcount) VALUES {values} "
+            f"ON CONFLICT(dimension, value) DO UPDATE SET headcount = headcount + 1;")
+
+def _stats_decrement(row: str) -> str:
+    """SQL that removes the given row (new/old) from every dimension"""
+    statements = []
+    for dimension, key in STATS_KEYS.items():
+        where = f"WHERE dimension = '{dimension}' AND value = {key.format(row=row)}"
+        statements.append(f"UPDATE employee_stats SET headcount = headcount - 1 {where};")
+        statements.append(f"DELETE FROM employee_stats {where} AND headcount <= 0;")
+    return "\n".join(statements)
+
+# Recomputes every summary row from Employees
+STATS_REBUILD_SQL = [
+    "DELETE FROM employee_stats",
+] + [
+    f"INSERT INTO employee_stats(dimension, value, headcount) "
+    f"SELECT '{dimension}', {key.format(row='Employees')}, COUNT(*) FROM Employees GROUP BY 2"
+    for dimension, key in STATS_KEYS.items()
+]
+
+# Live GROUP BY over Employees producing the same rows as employee_stats
+STATS_ACTUAL_SQL = " UNION ALL ".join(
+    f"SELECT '{dimension}' AS dimension, {key.format(row='Employees')} AS value, COUNT(*) AS headcount "
+    f"FROM Employees GROUP BY 2"
+    for dimension, key in STATS_KEYS.items()
+)
+
+# Per-row AFTER INSERT triggers are guarded by this flag. Bulk inserts set it
+# inside their transaction, insert the batch, then maintain the derived
+# tables for the whole id range at once with DEFERRED_INSERT_SQL (several
+# times faster than firing the triggers row by row) and clear it again
+# before committing, so other connections never see it set.
+TRIGGER_GUARD = "WHEN (SELECT bulk_load FROM trigger_control) = 0"
+
+# Derived-table maintenance for rows inserted with id BETWEEN ? AND ?
+DEFERRED_INSERT_SQL = [
+    "INSERT INTO employees_fts(rowid, name, job, email, address) "
+    "SELECT id, name, job, email, address FROM Employees WHERE id BETWEEN ? AND ?",
+] + [
+    f"INSERT INTO employee_stats(dimension, value, headcount) "
+    f"SELECT '{dimension}', {key.format(row='Employees')}, COUNT(*) FROM Employees "
+    f"WHERE id BETWEEN ? AND ? GROUP BY 2 "
+    f"ON CONFLICT(dimension, value) DO UPDATE SET headcount = headcount + excluded.headcount"
+    for dimension, key in STATS_KEYS.items()
+]
+
+def _statistics(con: sqlite3.Connection) -> None:
+    """
+    Version 4: trigger-maintained headcount summaries by job, gender and age band.
+
+    Also adds the trigger_control flag and guards the insert triggers with
+    it so bulk inserts can maintain derived tables set-based.
+    """
+    con.execute("""
+        CREATE TABLE trigger_control(
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            bulk_load INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+    con.execute("INSERT INTO trigger_control(id, bulk_load) VALUES (1, 0)")
+
+    con.execute("DROP TRIGGER employees_fts_ai")
+    con.execute(f"""
+        CREATE TRIGGER employees_fts_ai AFTER INSERT ON Employees {TRIGGER_GUARD} BEGIN
+            INSERT INTO employees_fts(rowid, name, job, email, address)
+            VALUES (new.id, new.name, new.job, new.email, new.address);
+        END
+    """)
+
+    con.execute("""
+        CREATE TABLE employee_stats(
+            dimension TEXT NOT NULL,
+            value NOT NULL,
+            headcount INTEGER NOT NULL,
+            PRIMARY KEY (dimension, value)
+        ) WITHOUT ROWID
+    """)
+    con.execute(f"""
+        CREATE TRIGGER employee_stats_ai AFTER INSERT ON Employees {TRIGGER_GUARD} BEGIN
+            {_stats_increment('new')}
+        END
+    """)
+    con.execute(f"""
+        CREATE TRIGGER employee_stats_ad AFTER DELETE ON Employees BEGIN
+            {_stats_decrement('old')}
+        END
+    """)
+    con.execute(f"""
+        CREATE TRIGGER employee_stats_au AFTER UPDATE OF job, gender, age ON Employees BEGIN
+            {_stats_decrement('old')}
+            {_stats_increment('new')}
+        END
+    """)
+    for statement in STATS_REBUILD_SQL:
+        con.execute(statement)
+
+# Change tracking. Every insert, update and delete takes the next number from
+# change_counter and stamps it on the row (Employees.change_seq) or on its
+# tombstone, so "everything since checkpoint N" is an index range scan over
+# change_seq. created_seq records the number a row was inserted with, which
+# tells inserts apart from updates. Timestamps are UTC ISO 8601.
+NOW_SQL = "strftime('%Y-%m-%dT%H:%M:%fZ', 'now')"
+
+# Columns whose changes are tracked; writing only the tracking columns is not a change
+TRACKED_COLUMNS = ('name', 'age', 'job', 'email', 'gender', 'phone', 'address')
+
+def _change_tracking(con: sqlite3.Connection) -> None:
+    """
+    Version 5: created/updated timestamps, change sequence numbers,
+    delete tombstones and named export checkpoints.
+
+    Existing rows are stamped as created now, in id order.
+    """
+    for column in ("created_at TEXT", "updated_at TEXT", "created_seq INTEGER", "change_seq INTEGER"):
+        con.execute(f"ALTER TABLE Employees ADD COLUMN {column}")
+    con.execute(f"""
+        UPDATE Employees
+        SET created_at = {NOW_SQL}, updated_at = {NOW_SQL}, created_seq = id, change_seq = id
+    """)
+    con.execute("CREATE INDEX idx_employees_change_seq ON Employees(change_seq)")
+
+    con.execute("""
+        CREATE TABLE change_counter(
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            seq INTEGER NOT NULL
+        )
+    """)
+    con.execute("INSERT INTO change_counter(id, seq) SELECT 1, COALESCE(MAX(id), 0) FROM Employees")
+
+    # One tombstone per id; a reused id that is deleted again replaces it
+    con.execute("""
+        CREATE TABLE employee_tombstones(
+            id INTEGER PRIMARY KEY,
+            deleted_at TEXT NOT NULL,
+            change_seq INTEGER NOT NULL
+        )
+    """)
+    con.execute("CREATE INDEX idx_tombstones_change_seq ON employee_tombstones(change_seq)")
+
+    con.execute("""
+        CREATE TABLE export_checkpoints(
+            name TEXT PRIMARY KEY,
+            change_seq INTEGER NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+    """)
+
+    # Inserts that did not stamp themselves (bulk inserts do) get the next number
+    con.execute(f"""
+        CREATE TRIGGER employees_change_ai AFTER INSERT ON Employees WHEN new.change_seq IS NULL BEGIN
+            UPDATE change_counter SET seq = seq + 1;
+            UPDATE Employees
+            SET created_at = COALESCE(new.created_at, {NOW_SQL}),
+                updated_at = COALESCE(new.updated_at, {NOW_SQL}),
+                created_seq = (SELECT seq FROM change_counter),
+                change_seq = (SELECT seq FROM change_counter)
+            WHERE id = new.id;
+        END
+    """)
+    columns = ", ".join(TRACKED_COLUMNS)
+    changed = " OR ".join(f"new.{column} IS NOT old.{column}" for column in TRACKED_COLUMNS)
+    con.execute(f"""
+        CREATE TRIGGER employees_change_au AFTER UPDATE OF {columns} ON Employees WHEN {changed} BEGIN
+            UPDATE change_counter SET seq = seq + 1;
+            UPDATE Employees
+            SET updated_at = {NOW_SQL}, change_seq = (SELECT seq FROM change_counter)
+            WHERE id = new.id;
+        END
+    """)
+    con.execute(f"""
+        CREATE TRIGGER employees_change_ad AFTER DELETE ON Employees BEGIN
+            UPDATE change_counter SET seq = seq + 1;
+            INSERT OR REPLACE INTO employee_tombstones(id, deleted_at, change_seq)
+            VALUES (old.id, {NOW_SQL}, (SELECT seq FROM change_counter));
+        END
+    """)
+
+# How emails and phone numbers are compared for duplicates, as SQL over {}:
+# emails ignore case and surrounding spaces, phone numbers keep only their
+# digits (valid numbers contain nothing but digits, spaces, tabs, dashes
+# and parentheses). Lookups apply the same expression to the searched value.
+EMAIL_KEY_SQL = "lower(trim({}))"
+PHONE_KEY_SQL = ("replace(replace(replace(replace(replace({}, ' ', ''), char(9), ''), "
+                 "'-', ''), '(', ''), ')', '')")
+
+def _duplicate_keys(con: sqlite3.Connection) -> None:
+    """
+    Version 6: normalized email and phone columns, indexed for duplicate checks.
+
+    They are virtual generated columns, so they can never disagree with
+    email and phone and take no space in the table; only their indexes
+    are stored. The indexes are not UNIQUE because existing files may
+    already contain duplicates (see Database.fetch_duplicate_groups).
+    """
+    for column, expression in (("email_key", EMAIL_KEY_SQL.format("email")), ("phone_key", PHONE_KEY_SQL.format("phone"))):
+        con.execute(f"ALTER TABLE Employees ADD COLUMN {column} TEXT GENERATED ALWAYS AS ({expression}) VIRTUAL")
+    con.execute("CREATE INDEX idx_employees_email_key ON Employees(email_key)")
+    con.execute("CREATE INDEX idx_employees_phone_key ON Employees(phone_key)")
+
+# Blocking keys for the similar-employee finder, in the order it uses them.
+# Only employees sharing a key are compared with each other. name_key is a
+# phonetic key computed in Python (services.duplicates.name_key); the
+# others are generated from the row.
+BLOCKING_KEYS = ('name_key', 'address_key', 'phone_tail')
+ADDRESS_KEY_SQL = "lower(substr(trim({}), 1, 8))"
+PHONE_TAIL_SQL = "substr({}, -7)"
+
+def _blocking_keys(con: sqlite3.Connection) -> None:
+    """
+    Version 7: indexed blocking keys for finding similar employees.
+
+    name_key starts out NULL and is filled in by the finder before each
+    run; a trigger clears it whenever the name changes, so it is never
+    stale however the row was written.
+    """
+    con.execute("ALTER TABLE Employees ADD COLUMN name_key TEXT")
+    con.execute(f"ALTER TABLE Employees ADD COLUMN address_key TEXT "
+                f"GENERATED ALWAYS AS ({ADDRESS_KEY_SQL.format('address')}) VIRTUAL")
+    con.execute(f"ALTER TABLE Employees ADD COLUMN phone_tail TEXT "
+                f"GENERATED ALWAYS AS ({PHONE_TAIL_SQL.format(PHONE_KEY_SQL.format('phone'))}) VIRTUAL")
+    for column in BLOCKING_KEYS:
+        con.execute(f"CREATE INDEX idx_employees_{column} ON Employees({column})")
+    con.execute("""
+        CREATE TRIGGER employees_name_key_au AFTER UPDATE OF name ON Employees WHEN new.name IS NOT old.name BEGIN
+            UPDATE Employees SET name_key = NULL WHERE id = new.id;
+        END
+    """)
+
+# (version, description, function) in the order they must be applied
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, "Baseline schema with lookup indexes and full-text search", _baseline),
+    (2, "Typed Employees columns with CHECK constraints", _typed_columns),
+    (3, "Index for job filters", _filter_indexes),
+    (4, "Trigger-maintained workforce statistics", _statistics),
+    (5, "Change tracking, delete tombstones and export checkpoints", _change_tracking),
+    (6, "Normalized email and phone keys for duplicate detection", _duplicate_keys),
+    (7, "Blocking keys for finding similar employees", _blocking_keys),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+def get_schema_version(con: sqlite3.Connection) -> int:
+    """
+    Get the schema version recorded in the database.
+
+    Args:
+        con: Open database connection
+
+    Returns:
+        The highest applied migration version, or 0 for an unversioned file
+    """
+    exists = con.execute(
+        "SELECT 1 FROM sqlite_master WHERE type='table' AND name='schema_version'"
+    ).fetchone()
+    if not exists:
+        return 0
+    return con.execute("SELECT COALESCE(MAX(version), 0) FROM schema_version").fetchone()[0]
+
+def migrate(con: sqlite3.Connection, target: Optional[int] = None) -> List[int]:
+    """
+    Apply all pending migrations up to target (default: the latest).
+
+    The caller owns the transaction; Database runs this inside a single
+    transaction so a failed migration leaves the file untouched.
+
+    Args:
+        con: Open database connection, inside a transaction
+        target: Stop after this version
+
+    Returns:
+        List of the versions that were applied
+    """
+    target = LATEST_VERSION if target is None else target
+    current = get_schema_version(con)
+    con.execute(SCHEMA_VERSION_SQL)
+
+    applied = []
+    for version, description, apply in MIGRATIONS:
+        if current < version <= target:
+            apply(con)
+            con.execute(
+                "INSERT INTO schema_version(version, description) VALUES (?, ?)",
+                (version, description)
+            )
+            applied.append(version)
+    return applied
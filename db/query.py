@@ -0,0 +1,183 @@
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from models.employee import EMPLOYEE_COLUMNS
+
+# Filter specs are compiled into parameterized SQL against Employees.
+#
+#   filters = {
+#       'job': 'Engineer',                       # equality
+#       'gender': ['Male', 'Female'],            # IN
+#       'age': {'gte': 25, 'lt': 40},            # range
+#       'name': {'prefix': 'Jo'},                # prefix (index friendly)
+#   }
+#   order_by = ['-age', 'name']                  # '-' means descending
+#
+# Values never end up in the SQL text. The SQL only depends on the *shape*
+# of the query (which columns, which operators, how many IN values), so it
+# is built once per shape and cached; SQLite's per-connection statement
+# cache then reuses the prepared statement for the identical SQL string.
+
+TEXT_COLUMNS = frozenset(('name', 'job', 'email', 'gender', 'phone', 'address'))
+
+COMPARISONS = {
+    'eq': '=',
+    'ne': '!=',
+    'gt': '>',
+    'gte': '>=',
+    'lt': '<',
+    'lte': '<=',
+}
+OPERATORS = frozenset(COMPARISONS) | {'in', 'prefix'}
+
+# A compiled shape: ((column, operator, arity), ...), ((column, descending), ...), has_limit, has_offset, aggregate
+QueryShape = Tuple[Tuple[Tuple[str, str, int], ...], Tuple[Tuple[str, bool], ...], bool, bool, Optional[str]]
+
+def _prefix_upper_bound(prefix: str) -> Optional[str]:
+    """Smallest string greater than every string starting with prefix"""
+    while prefix:
+        last = ord(prefix[-1])
+        if last < 0x10FFFF:
+            return prefix[:-1] + chr(last + 1)
+        prefix = prefix[:-1]
+    return None
+
+def _normalize_filters(filters: Optional[Dict[str, Any]]) -> Tuple[List[Tuple[str, str, int]], List[Any]]:
+    """Split a filter spec into its shape and its parameter values"""
+    shape: List[Tuple[str, str, int]] = []
+    params: List[Any] = []
+
+    for column in sorted(filters or {}):
+        if column not in EMPLOYEE_COLUMNS:
+            raise ValueError(f"Unknown filter column '{column}'")
+        spec = filters[column]
+
+        if isinstance(spec, dict):
+            conditions = spec
+        elif isinstance(spec, (list, tuple, set, frozenset)):
+            conditions = {'in': spec}
+        else:
+            conditions = {'eq': spec}
+
+        for operator in sorted(conditions):
+            if operator not in OPERATORS:
+                raise ValueError(f"Unknown filter operator '{operator}' for column '{column}'")
+            value = conditions[operator]
+
+            if operator == 'in':
+                values = sorted(value, key=repr) if isinstance(value, (set, frozenset)) else list(value)
+                shape.append((column, operator, len(values)))
+                params.extend(values)
+            elif operator == 'prefix':
+                if column not in TEXT_COLUMNS:
+                    raise ValueError(f"Prefix filter is only supported on text columns, not '{column}'")
+                upper = _prefix_upper_bound(value)
+                shape.append((column, operator, 1 if upper is None else 2))
+                params.append(value)
+                if upper is not None:
+                    params.append(upper)
+            elif value is None and operator in ('eq', 'ne'):
+                shape.append((column, operator, 0))
+            else:
+                shape.append((column, operator, 1))
+                params.append(value)
+
+    return shape, params
+
+def _normalize_order(order_by: Union[None, str, Sequence[str]]) -> List[Tuple[str, bool]]:
+    """Turn 'name' / '-age' / ['job', '-age'] into (column, descending) pairs"""
+    if order_by is None:
+        order_by = []
+    elif isinstance(order_by, str):
+        order_by = [order_by]
+
+    order: List[Tuple[str, bool]] = []
+    for term in order_by:
+        descending = term.startswith('-')
+        column = term[1:] if descending else term
+        if column not in EMPLOYEE_COLUMNS:
+            raise ValueError(f"Unknown sort column '{term}'")
+        order.append((column, descending))
+
+    # Always end on the primary key so paging through results is stable
+    if 'id' not in (column for column, _ in order):
+        order.append(('id', False))
+    return order
+
+@lru_cache(maxsize=256)
+def _compile_shape(shape: QueryShape) -> str:
+    """Build the SQL text for one query shape (cached)"""
+    conditions, order, has_limit, has_offset, aggregate = shape
+
+    clauses = []
+    for column, operator, arity in conditions:
+        if operator == 'in':
+            if arity == 0:
+                clauses.append("0")
+            else:
+                clauses.append(f"{column} IN ({', '.join('?' * arity)})")
+        elif operator == 'prefix':
+            clauses.append(f"{column} >= ?" if arity == 1 else f"{column} >= ? AND {column} < ?")
+        elif arity == 0:
+            clauses.append(f"{column} IS {'NOT ' if operator == 'ne' else ''}NULL")
+        else:
+            clauses.append(f"{column} {COMPARISONS[operator]} ?")
+
+    if aggregate:
+        sql = f"SELECT {aggregate} FROM Employees"
+    else:
+        sql = f"SELECT {', '.join(EMPLOYEE_COLUMNS)} FROM Employees"
+    if clauses:
+        sql += " WHERE " + " AND ".join(clauses)
+    if aggregate:
+        return sql
+
+    sql += " ORDER BY " + ", ".join(f"{column}{' DESC' if descending else ''}" for column, descending in order)
+    if has_limit or has_offset:
+        sql += " LIMIT ?"
+    if has_offset:
+        sql += " OFFSET ?"
+    return sql
+
+def compile_query(filters: Optional[Dict[str, Any]] = None,
+                  order_by: Union[None, str, Sequence[str]] = None,
+                  limit: Optional[int] = None,
+                  offset: Optional[int] = None,
+                  count_only: bool = False,
+                  aggregate: Optional[str] = None) -> Tuple[str, List[Any]]:
+    """
+    Compile a filter/sort/limit spec into parameterized SQL.
+
+    Args:
+        filters: Mapping of column to value, list of values, or operator dict
+        order_by: Column name or list of names; prefix with '-' for descending
+        limit: Maximum number of rows
+        offset: Number of rows to skip
+        count_only: Build a COUNT(*) query instead of a row query
+        aggregate: Build a single-row query selecting this SQL select list
+            (e.g. 'MAX(age)') instead of a row query; must not contain values
+
+    Returns:
+        Tuple of (sql, params)
+
+    Raises:
+        ValueError: If the spec names an unknown column or operator
+    """
+    if count_only:
+        aggregate = "COUNT(*)"
+    conditions, params = _normalize_filters(filters)
+    order = _normalize_order(order_by) if not aggregate else []
+    has_limit = limit is not None and not aggregate
+    has_offset = offset is not None and not aggregate
+
+    shape: QueryShape = (tuple(conditions), tuple(order), has_limit, has_offset, aggregate)
+    sql = _compile_shape(shape)
+
+    if has_limit or has_offset:
+        params.append(-1 if limit is None else limit)
+    if has_offset:
+        params.append(offset)
+    return sql, params
+
+def query_cache_info():
+    """Hit/miss statistics of the compiled-SQL cache"""
+    return _compile_shape.cache_info()
@@ -3,13 +3,15 @@ from db.database import Database
 from services.employee_service import EmployeeService
 from ui.employee_ui import EmployeeUI
 from utils.config import AppConfig
+from utils.validators import set_validation_rules
 
 def main():
     """
     Main entry point for the Employee Management System application.
     """
-    # Load configuration
+    # Load configuration; validation rules are compiled once, here
     config = AppConfig()
+    set_validation_rules(config.get_validation_rules())
 
     # Create the root window
     root = tk.Tk()
@@ -21,8 +23,8 @@ def main():
         # Get database path from config
         db_path = config.get_db_path()
 
-        # Initialize database
-        db = Database(db_path)
+        # Initialize database (journal mode and pool options come from config)
+        db = Database(db_path, **config.get_database_options())
 
         # Initialize service with database
         employee_service = EmployeeService(db)
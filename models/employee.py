@@ -1,10 +1,25 @@
 from dataclasses import dataclass
 from typing import Optional
 
+# Column order of an employee row, as returned by the database
+EMPLOYEE_COLUMNS = ('id', 'name', 'age', 'job', 'email', 'gender', 'phone', 'address')
+
+# Values accepted by the typed Employees schema
+GENDERS = ('Male', 'Female')
+MIN_AGE = 0
+MAX_AGE = 150
+
+# Columns the schema allows to be NULL: the migration to typed columns
+# stores a nonconforming age or gender as NULL
+NULLABLE_FIELDS = ('age', 'gender')
+
 @dataclass
 class Employee:
     """
     Employee data model representing an employee record.
+
+    age is kept as a string, as entered in the UI; the database stores it
+    as an INTEGER and from_tuple converts it back.
     """
     id: Optional[int] = None
     name: str = ""
@@ -29,7 +44,7 @@ class Employee:
             return cls(
                 id=data_tuple[0],
                 name=data_tuple[1],
-                age=data_tuple[2],
+                age="" if data_tuple[2] is None else str(data_tuple[2]),
                 job=data_tuple[3],
                 email=data_tuple[4],
                 gender=data_tuple[5],
@@ -0,0 +1,73 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache with hit/miss metrics.
+
+    Holds at most max_size entries; adding one more evicts the entry that
+    was used longest ago.
+    """
+    MISSING = object()
+
+    def __init__(self, max_size: int = 1024):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of entries kept
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Return the cached value, or LRUCache.MISSING if the key is not cached"""
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return self.MISSING
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache a value, evicting the least recently used entry if full"""
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop one entry if it is cached"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry (metrics are kept)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss/eviction counters and current size"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'size': len(self._entries),
+                'max_size': self.max_size,
+            }
@@ -0,0 +1,159 @@
+# Finding employees that are probably the same person
+#
+# Comparing every pair of employees is quadratic, so the finder uses
+# blocking: employees are grouped by a few cheap keys (a phonetic key of
+# the name, the start of the address, the last seven digits of the phone) that
+# are stored in indexed columns, and string similarity is only computed
+# between employees sharing a key. Each key is one ordered index scan, so
+# the cost grows with the table size plus the size of the blocks.
+import re
+from difflib import SequenceMatcher
+from functools import partial
+from itertools import combinations, groupby
+from typing import Collection, Iterable, Iterator, List, Sequence, Set, Tuple
+from services.workers import map_in_order
+
+# Soundex digit for each consonant; vowels, h, w and y have none
+_SOUNDEX_CODES = {letter: digit for digit, letters in (
+    ('1', 'bfpv'), ('2', 'cgjkqsxz'), ('3', 'dt'), ('4', 'l'), ('5', 'mn'), ('6', 'r'),
+) for letter in letters}
+
+_WORD_PATTERN = re.compile(r"[^\W\d_]+")
+
+# Weight of the name in a pair's score; the address has the rest
+NAME_WEIGHT = 0.6
+
+# A row as read by Database.iter_by_blocking_key, without the leading key:
+# (id, name, address, name_key, address_key, phone_tail)
+Row = Tuple
+# (score, lower id, higher id)
+Pair = Tuple[float, int, int]
+# A block to compare: (key_index, rows, oversized), as passed to compare_block
+Block = Tuple[int, List[Row], Sequence[Collection[str]]]
+
+def soundex(word: str) -> str:
+    """
+    American Soundex code of a word: 'Robert' and 'Rupert' -> 'R163'.
+
+    Words without ASCII letters (e.g. names in Arabic script) fall back to
+    their first four characters, lower-cased.
+    """
+    letters = [letter for letter in word.lower() if 'a' <= letter <= 'z']
+    if not letters:
+        return word[:4].lower()
+    code = letters[0].upper()
+    last = _SOUNDEX_CODES.get(letters[0], '')
+    for letter in letters[1:]:
+        digit = _SOUNDEX_CODES.get(letter, '')
+        if digit and digit != last:
+            code += digit
+            if len(code) == 4:
+                break
+        # h and w do not separate two letters with the same code
+        if letter not in 'hw':
+            last = digit
+    return code.ljust(4, '0')
+
+def name_key(name: str) -> str:
+    """
+    Phonetic blocking key of a name: Soundex of its first and last words.
+
+    'Jon Smith', 'John Smith' and 'John A. Smyth' all give 'J500 S530'.
+    """
+    words = _WORD_PATTERN.findall(name)
+    if not words:
+        return ''
+    if len(words) == 1:
+        return soundex(words[0])
+    return f"{soundex(words[0])} {soundex(words[-1])}"
+
+def _normalize(text: str) -> str:
+    """Lower-case text with runs of spaces collapsed, for comparison"""
+    return ' '.join(text.lower().split())
+
+def compare_block(key_index: int, rows: Sequence[Row], threshold: float,
+                  oversized: Sequence[Collection[str]] = ()) -> Tuple[List[Pair], int]:
+    """
+    Score every pair of rows in one block.
+
+    A pair that also shares an earlier blocking key was already scored in
+    that key's block and is skipped, unless that block was too big and
+    never compared (its key is in oversized). The score weighs the name similarity
+    by NAME_WEIGHT and the address similarity by the rest; cheap upper
+    bounds are checked before the full ratios. A module-level function so
+    it can run in a worker process.
+
+    Args:
+        key_index: Position of the block's key in BLOCKING_KEYS
+        rows: The block's rows
+        threshold: Lowest score reported
+        oversized: For each earlier blocking key, the values whose blocks
+            were skipped as too big (see group_blocks)
+
+    Returns:
+        Tuple of (pairs scoring at least threshold, number of pairs compared)
+    """
+    def earlier_keys(row: Row) -> Tuple:
+        # A key whose block was skipped does not mean the pair was scored
+        keys = row[3:3 + key_index]
+        if not any(oversized):
+            return keys
+        return tuple('' if key in skipped else key for key, skipped in zip(keys, oversized))
+
+    prepared = [(row[0], _normalize(row[1] or ''), _normalize(row[2] or ''), earlier_keys(row))
+                for row in rows]
+    matcher = SequenceMatcher(autojunk=False)
+    pairs: List[Pair] = []
+    compared = 0
+    for (id_a, name_a, address_a, earlier_a), (id_b, name_b, address_b, earlier_b) in combinations(prepared, 2):
+        if any(key_a and key_a == key_b for key_a, key_b in zip(earlier_a, earlier_b)):
+            continue
+        compared += 1
+        matcher.set_seqs(name_a, name_b)
+        if NAME_WEIGHT * matcher.real_quick_ratio() + (1 - NAME_WEIGHT) < threshold:
+            continue
+        if NAME_WEIGHT * matcher.quick_ratio() + (1 - NAME_WEIGHT) < threshold:
+            continue
+        name_score = NAME_WEIGHT * matcher.ratio()
+        if name_score + (1 - NAME_WEIGHT) < threshold:
+            continue
+        matcher.set_seqs(address_a, address_b)
+        score = name_score + (1 - NAME_WEIGHT) * matcher.ratio()
+        if score >= threshold:
+            pairs.append((round(score, 3), min(id_a, id_b), max(id_a, id_b)))
+    return pairs, compared
+
+def compare_blocks(blocks: List[Block], threshold: float) -> Tuple[List[Pair], int]:
+    """Run compare_block over several blocks, summing the results"""
+    pairs: List[Pair] = []
+    compared = 0
+    for key_index, rows, oversized in blocks:
+        block_pairs, block_compared = compare_block(key_index, rows, threshold, oversized)
+        pairs += block_pairs
+        compared += block_compared
+    return pairs, compared
+
+def group_blocks(rows: Iterable[Tuple], max_block_size: int, skipped: Set[str]) -> Iterator[List[Row]]:
+    """
+    Group rows ordered by their leading key into blocks of 2 to max_block_size.
+
+    Blocks above max_block_size would cost too many comparisons (a
+    placeholder address, a very common name); their keys are added to
+    skipped instead.
+    """
+    for key, group in groupby(rows, key=lambda row: row[0]):
+        block = [row[1:] for row in group]
+        if len(block) > max_block_size:
+            skipped.add(key)
+        elif len(block) > 1:
+            yield block
+
+def run_comparisons(tasks: Iterable[List[Block]], threshold: float,
+                    processes: int = 0) -> Iterator[Tuple[List[Pair], int]]:
+    """
+    Run compare_blocks over tasks, optionally across a process pool.
+
+    With processes > 0 the tasks go through services.workers.map_in_order,
+    so the index scans overlap the comparisons while memory stays bounded.
+    """
+    return map_in_order(partial(compare_blocks, threshold=threshold), tasks, processes)
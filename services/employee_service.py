@@ -1,23 +1,129 @@
-import csv
 import os
-from typing import List, Tuple, Dict, Any, Optional
-from models.employee import Employee
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import replace
+from itertools import islice
+from typing import Callable, List, Set, Tuple, Dict, Any, Iterator, Optional, Sequence, Union
+from models.employee import Employee, NULLABLE_FIELDS
 from db.database import Database
+from db.migrations import BLOCKING_KEYS
 from utils.validators import validate_employee_data
+from services.cache import LRUCache
+from services.duplicates import group_blocks, name_key, run_comparisons
+from services.workers import process_pool
 
-# Import libraries for PDF and Excel export
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter, landscape
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
-from reportlab.lib.styles import getSampleStyleSheet
-import openpyxl
+# Export backends (openpyxl, reportlab) are imported lazily by the registry
+from services.exporters import ExportCancelled, ExporterSpec, export_formats, get_exporter_spec
+from services.exporters.changes_exporter import write_changes
+from services.importers import IMPORT_CHUNK_SIZE, IMPORT_ERROR_SAMPLE, ImportSource, map_headers, open_input
+from services.importers.csv_importer import default_error_file, error_file_writer, open_csv, validate_batches
+from services.importers.ndjson_importer import read_records
+
+# Pages copied per step by export_snapshot (1 MiB with SQLite's default 4 KiB pages)
+SNAPSHOT_PAGES_PER_STEP = 256
+
+# Rows of blocks compared per task by find_similar_employees
+SIMILARITY_TASK_ROWS = 2000
+
+# How often export_bundle polls should_cancel while its workers run, in seconds
+BUNDLE_CANCEL_POLL = 0.2
+
+def _export_snapshot(snapshot_path: str, spec: ExporterSpec, filename: str,
+                     filters: Optional[Dict[str, Any]],
+                     order_by: Union[None, str, Sequence[str]]) -> Tuple[bool, str, float]:
+    """Export one format from a database snapshot (runs in a worker process)"""
+    start = time.perf_counter()
+    db = Database(snapshot_path)
+    try:
+        success, message, _ = spec.load()(EmployeeService(db), filename, filters=filters, order_by=order_by)
+    finally:
+        db.close()
+    return success, message, time.perf_counter() - start
 
 class EmployeeService:
 
-    def __init__(self, database: Database):
-    
+    def __init__(self, database: Database, cache_size: int = 1024):
+        """
+        Initialize the service.
+
+        Args:
+            database: Database to read from and write to
+            cache_size: Maximum number of Employee objects kept in the by-ID cache
+        """
         self.db = database
 
+        # Read-through caches. Entries are tagged with Database.data_version();
+        # the service's own writes evict just the rows they touch, any other
+        # change (another thread or process) drops the caches on the next read.
+        self._employee_cache = LRUCache(cache_size)
+        self._snapshot: Optional[List[Tuple]] = None
+        self._snapshot_version = None
+        self._snapshot_hits = 0
+        self._snapshot_misses = 0
+        self._cache_version = None
+        self._cache_lock = threading.Lock()
+
+    def _check_cache(self):
+        """Drop cached employees if the data changed behind our back; return the data version"""
+        version = self.db.data_version()
+        with self._cache_lock:
+            if version != self._cache_version:
+                self._employee_cache.clear()
+                self._cache_version = version
+        return version
+
+    @contextmanager
+    def _invalidating(self, *employee_ids: int) -> Iterator[None]:
+        """Wrap one of the service's own writes: evict the rows it touches, keep the rest"""
+        before = self.db.data_version()
+        try:
+            yield
+        finally:
+            after = self.db.data_version()
+            with self._cache_lock:
+                # Evicted under the lock so a read that fetched the old row
+                # cannot cache it in between (see get_employee_by_id)
+                for employee_id in employee_ids:
+                    self._employee_cache.invalidate(employee_id)
+                # Only adopt the new version if nothing else changed first
+                if self._cache_version == before:
+                    self._cache_version = after
+
+    def get_cache_stats(self) -> Tuple[bool, str, Dict[str, Dict[str, int]]]:
+        """
+        Get hit/miss metrics for the service caches.
+
+        Returns:
+            Tuple of (success, message, stats) with an 'employees' entry for
+            the by-ID LRU cache and an 'all_employees' entry for the snapshot
+        """
+        with self._cache_lock:
+            snapshot = {'hits': self._snapshot_hits, 'misses': self._snapshot_misses}
+        return True, "Cache statistics retrieved", {
+            'employees': self._employee_cache.stats(),
+            'all_employees': snapshot,
+        }
+
+    @contextmanager
+    def transaction(self) -> Iterator["EmployeeService"]:
+        """
+        Run several service calls as one atomic unit of work.
+
+        Usage:
+            with service.transaction():
+                service.add_employee(...)
+                service.delete_employee(...)
+
+        Everything inside the block is committed once at the end. Service
+        methods report failures through their return value, so raise an
+        exception inside the block to roll all of it back.
+        """
+        with self.db.transaction():
+            yield self
+
     def add_employee(self, employee_data: Dict[str, Any]) -> Tuple[bool, str, Optional[int]]:
         """
         Add a new employee to the database after validation.
@@ -44,9 +150,122 @@ class EmployeeService:
             address=employee_data['address']
         )
 
-        # Insert into database
-        employee_id = self.db.insert_employee(employee)
-        return True, "Employee added successfully", employee_id
+        try:
+            # Check and insert in one transaction so no duplicate can slip in between
+            with self._invalidating(), self.db.transaction():
+                duplicate = self.db.find_duplicate(employee.email, employee.phone)
+                if duplicate:
+                    return False, self._duplicate_message(*duplicate), None
+                employee_id = self.db.insert_employee(employee)
+            return True, "Employee added successfully", employee_id
+        except Exception as e:
+            return False, f"Error adding employee: {str(e)}", None
+
+    def add_employees(self, employees_data: List[Dict[str, Any]],
+                      nullable: Sequence[str] = ()) -> Tuple[bool, str, List[Tuple[bool, str, Optional[int]]]]:
+        """
+        Add many employees at once.
+
+        The whole batch is validated first and the valid rows are inserted
+        in a single transaction. Invalid rows are skipped, not fatal, and
+        so are rows with the email or phone number of a stored employee or
+        of an earlier row, as add_employee would refuse them.
+
+        Args:
+            employees_data: List of dictionaries containing employee data
+            nullable: Fields that may be None and are then stored as NULL,
+                to re-import employees saved without them
+
+        Returns:
+            Tuple of (success, message, results) where results holds one
+            (success, message, employee_id) tuple per input row
+        """
+        results: List[Tuple[bool, str, Optional[int]]] = []
+        valid_rows: List[int] = []
+        employees: List[Employee] = []
+
+        # Validate the whole batch before touching the database
+        for index, employee_data in enumerate(employees_data):
+            is_valid, error_message = validate_employee_data(employee_data, nullable)
+            if not is_valid:
+                results.append((False, error_message, None))
+                continue
+            results.append((True, "Employee added successfully", None))
+            valid_rows.append(index)
+            employees.append(Employee(
+                name=employee_data['name'],
+                age=employee_data['age'],
+                job=employee_data['job'],
+                email=employee_data['email'],
+                gender=employee_data['gender'],
+                phone=employee_data['phone'],
+                address=employee_data['address']
+            ))
+
+        try:
+            inserted = self._insert_unique(employees)
+        except Exception as e:
+            return False, f"Error adding employees: {str(e)}", [
+                result if not result[0] else (False, "Batch insert failed", None)
+                for result in results
+            ]
+
+        added = 0
+        for index, (employee_id, duplicate) in zip(valid_rows, inserted):
+            if duplicate:
+                results[index] = (False, duplicate, None)
+            else:
+                results[index] = (True, results[index][1], employee_id)
+                added += 1
+
+        return True, f"Added {added} of {len(results)} employees", results
+
+    def _insert_unique(self, employees: List[Employee]) -> List[Tuple[Optional[int], Optional[str]]]:
+        """
+        Insert the employees that duplicate neither a stored employee nor an earlier one.
+
+        The duplicate lookup (one indexed query per field for the whole
+        list, see Database.find_duplicates) and the insert run in one
+        transaction. Email is checked before phone, like add_employee.
+
+        Returns:
+            One (employee_id, None) per inserted employee, or (None,
+            message) naming the employee it duplicates, in input order
+        """
+        if not employees:
+            return []
+        with self._invalidating(), self.db.transaction():
+            keys = self.db.find_duplicates([(employee.email, employee.phone) for employee in employees])
+            # Keys of the employees being added -> position of the first one
+            seen: Dict[str, Dict[str, int]] = {field: {} for field in keys}
+            stored: Dict[int, Tuple[int, str]] = {}
+            earlier: Dict[int, Tuple[int, str]] = {}
+            new: List[int] = []
+            for position in range(len(employees)):
+                for field in ('email', 'phone'):
+                    key, employee_id = keys[field][position]
+                    if employee_id is not None:
+                        stored[position] = (employee_id, field)
+                        break
+                    if key and key in seen[field]:
+                        earlier[position] = (seen[field][key], field)
+                        break
+                else:
+                    new.append(position)
+                    for field in ('email', 'phone'):
+                        seen[field][keys[field][position][0]] = position
+            new_ids = dict(zip(new, self.db.insert_employees(employees[position] for position in new)))
+
+        inserted: List[Tuple[Optional[int], Optional[str]]] = []
+        for position in range(len(employees)):
+            if position in new_ids:
+                inserted.append((new_ids[position], None))
+            elif position in stored:
+                inserted.append((None, self._duplicate_message(*stored[position])))
+            else:
+                first, field = earlier[position]
+                inserted.append((None, self._duplicate_message(new_ids[first], field)))
+        return inserted
 
     def update_employee(self, employee_id: int, employee_data: Dict[str, Any]) -> Tuple[bool, str, Optional[int]]:
         """
@@ -77,8 +296,12 @@ class EmployeeService:
         )
 
         try:
-            # Update in database
-            success = self.db.update_employee(employee)
+            # Update in database, unless another employee has this email or phone
+            with self._invalidating(employee_id), self.db.transaction():
+                duplicate = self.db.find_duplicate(employee.email, employee.phone, exclude_id=employee_id)
+                if duplicate:
+                    return False, self._duplicate_message(*duplicate), None
+                success = self.db.update_employee(employee)
             if success:
                 return True, "Employee updated successfully", employee_id
             else:
@@ -86,6 +309,93 @@ class EmployeeService:
         except Exception as e:
             return False, f"Error updating employee: {str(e)}", None
 
+    @staticmethod
+    def _duplicate_message(employee_id: int, field: str) -> str:
+        """The result message for an add or update matching another employee"""
+        return f"Duplicate of employee #{employee_id} (same {field})"
+
+    def get_duplicate_report(self) -> Tuple[bool, str, Dict[str, List[Tuple[str, List[int]]]]]:
+        """
+        Find employees already stored twice with the same email or phone number.
+
+        add_employee and update_employee refuse new duplicates; this report
+        is for records saved before that check existed. Each field is one
+        GROUP BY over its normalized key index.
+
+        Returns:
+            Tuple of (success, message, report) where report maps 'email'
+            and 'phone' to (key, employee_ids) groups
+        """
+        try:
+            report = {field: self.db.fetch_duplicate_groups(field) for field in ('email', 'phone')}
+        except Exception as e:
+            return False, f"Error finding duplicates: {str(e)}", {}
+        groups = sum(len(groups) for groups in report.values())
+        if not groups:
+            return True, "No duplicate employees found", report
+        return True, f"Found {groups} group(s) of employees with the same email or phone number", report
+
+    def find_similar_employees(self, threshold: float = 0.85, max_block_size: int = 500,
+                               processes: int = 0) -> Tuple[bool, str, Dict[str, Any]]:
+        """
+        Find pairs of employees that are probably the same person, such as
+        'Jon Smith' and 'John Smith' at the same address.
+
+        Only employees sharing a blocking key are compared: the phonetic
+        key of the name, the first characters of the address or the last
+        seven digits of the phone (see services.duplicates). Each key is one
+        scan of its index, so the run time grows about linearly with the
+        table instead of with the number of pairs.
+
+            service.find_similar_employees(processes=4)
+
+        Args:
+            threshold: Lowest similarity reported, from 0 to 1
+            max_block_size: Blocks with more employees than this (a shared
+                placeholder address, say) are skipped and counted
+            processes: Compare blocks in this many worker processes; 0
+                compares them here
+
+        Returns:
+            Tuple of (success, message, summary) where summary holds
+            'pairs' ((score, id, other_id), best first), 'blocks',
+            'compared' (pairs scored), 'skipped_blocks' and 'seconds'
+        """
+        start = time.perf_counter()
+        summary: Dict[str, Any] = {'pairs': [], 'blocks': 0, 'compared': 0, 'skipped_blocks': 0, 'seconds': 0.0}
+        # Keys of the blocks skipped as too big, per blocking key
+        skipped: List[Set[str]] = [set() for _ in BLOCKING_KEYS]
+
+        def tasks():
+            # Small blocks are sent to the workers together
+            for key_index, key in enumerate(BLOCKING_KEYS):
+                task, rows = [], 0
+                for block in group_blocks(self.db.iter_by_blocking_key(key), max_block_size, skipped[key_index]):
+                    summary['blocks'] += 1
+                    # Only the skipped earlier keys this block's rows have
+                    oversized = [{row[3 + index] for row in block} & skipped[index] for index in range(key_index)]
+                    task.append((key_index, block, oversized))
+                    rows += len(block)
+                    if rows >= SIMILARITY_TASK_ROWS:
+                        yield task
+                        task, rows = [], 0
+                if task:
+                    yield task
+
+        try:
+            self.db.refresh_name_keys(name_key)
+            for pairs, compared in run_comparisons(tasks(), threshold, processes):
+                summary['pairs'] += pairs
+                summary['compared'] += compared
+        except Exception as e:
+            return False, f"Error finding similar employees: {str(e)}", summary
+        finally:
+            summary['skipped_blocks'] = sum(len(keys) for keys in skipped)
+            summary['seconds'] = time.perf_counter() - start
+
+        summary['pairs'].sort(key=lambda pair: (-pair[0], pair[1], pair[2]))
+        return True, f"Found {len(summary['pairs']):,} pair(s) of similar employees", summary
+
     def delete_employee(self, employee_id: int) -> Tuple[bool, str, Optional[int]]:
         """
         Delete an employee from the database.
@@ -97,7 +407,8 @@ class EmployeeService:
             Tuple of (success, message, employee_id)
         """
         try:
-            success = self.db.remove_employee(employee_id)
+            with self._invalidating(employee_id):
+                success = self.db.remove_employee(employee_id)
             if success:
                 return True, "Employee deleted successfully", employee_id
             else:
@@ -109,15 +420,146 @@ class EmployeeService:
         """
         Get all employees from the database.
 
+        The list is cached and served again until the data changes.
+
         Returns:
             Tuple of (success, message, employee_data)
         """
         try:
+            version = self._check_cache()
+            with self._cache_lock:
+                if self._snapshot is not None and self._snapshot_version == version:
+                    self._snapshot_hits += 1
+                    return True, "Employees retrieved successfully", list(self._snapshot)
+                self._snapshot_misses += 1
+
             employees = self.db.fetch_all_employees()
+            with self._cache_lock:
+                self._snapshot = employees
+                self._snapshot_version = version
+            return True, "Employees retrieved successfully", list(employees)
+        except Exception as e:
+            return False, f"Error retrieving employees: {str(e)}", []
+
+    def get_employees_page(self, after_id: int = 0, limit: int = 100) -> Tuple[bool, str, List[Tuple]]:
+        """
+        Get one page of employees ordered by ID (keyset pagination).
+
+        Args:
+            after_id: Return employees with an ID greater than this
+            limit: Maximum number of rows in the page
+
+        Returns:
+            Tuple of (success, message, employee_data)
+        """
+        try:
+            employees = self.db.fetch_employees_page(after_id, limit)
+            return True, "Employees retrieved successfully", employees
+        except Exception as e:
+            return False, f"Error retrieving employees: {str(e)}", []
+
+    def get_employees_at(self, position: int, limit: int = 100,
+                         from_id: Optional[int] = None) -> Tuple[bool, str, List[Tuple]]:
+        """
+        Get one page of employees starting a number of rows into ID order.
+
+        Used by the virtualized employee list: scrolling passes the ID of
+        the top row so only the rows scrolled over are walked.
+
+        Args:
+            position: Rows to move before the page starts; negative values
+                move back from from_id
+            limit: Maximum number of rows in the page
+            from_id: Employee to count from; the first one if None
+
+        Returns:
+            Tuple of (success, message, employee_data)
+        """
+        try:
+            employees = self.db.fetch_employees_at(position, limit, from_id)
             return True, "Employees retrieved successfully", employees
         except Exception as e:
             return False, f"Error retrieving employees: {str(e)}", []
 
+    def iter_employees(self, chunk_size: int = 1000, filters: Optional[Dict[str, Any]] = None,
+                       order_by: Union[None, str, Sequence[str]] = None) -> Iterator[Tuple]:
+        """
+        Stream employees with bounded memory, optionally filtered and sorted.
+
+        Unlike the other service methods this is a generator, so database
+        errors are raised to the caller rather than returned.
+
+        Args:
+            chunk_size: Number of rows fetched from the database at a time
+            filters: Optional filter spec (see query())
+            order_by: Optional sort spec; defaults to ID order
+        """
+        return self.db.iter_employees(chunk_size, filters, order_by)
+
+    def query(self, filters: Optional[Dict[str, Any]] = None,
+              order_by: Union[None, str, Sequence[str]] = None,
+              limit: Optional[int] = None, offset: Optional[int] = None) -> Tuple[bool, str, List[Tuple]]:
+        """
+        Select employees with filtering, sorting and paging done by SQLite.
+
+        Filters map a column to a value (equality), a list of values (IN),
+        or a dict of operators: eq, ne, gt, gte, lt, lte, in, prefix.
+
+            service.query(filters={'job': 'Engineer', 'age': {'gte': 30, 'lt': 40},
+                                   'name': {'prefix': 'Jo'}},
+                          order_by=['-age', 'name'], limit=50)
+
+        Args:
+            filters: Filter spec
+            order_by: Column name or list of names; prefix with '-' for descending
+            limit: Maximum number of rows
+            offset: Number of rows to skip
+
+        Returns:
+            Tuple of (success, message, employee_data)
+        """
+        try:
+            employees = self.db.query_employees(filters, order_by, limit, offset)
+            return True, f"{len(employees)} employee(s) found", employees
+        except ValueError as e:
+            return False, f"Invalid query: {str(e)}", []
+        except Exception as e:
+            return False, f"Error querying employees: {str(e)}", []
+
+    def count_employees(self, filters: Optional[Dict[str, Any]] = None) -> Tuple[bool, str, int]:
+        """
+        Count employees, optionally matching a filter spec.
+
+        Args:
+            filters: Filter spec, as for query()
+
+        Returns:
+            Tuple of (success, message, count)
+        """
+        try:
+            return True, "Employees counted successfully", self.db.count_employees(filters)
+        except ValueError as e:
+            return False, f"Invalid query: {str(e)}", 0
+        except Exception as e:
+            return False, f"Error counting employees: {str(e)}", 0
+
+    def search_employees(self, query: str, limit: int = 100) -> Tuple[bool, str, List[Tuple]]:
+        """
+        Search employees by name, job, email or address (prefix matching).
+
+        Args:
+            query: Free-text search string
+            limit: Maximum number of rows to return
+
+        Returns:
+            Tuple of (success, message, employee_data), best match first
+        """
+        try:
+            employees = self.db.search_employees(query, limit)
+            return True, f"{len(employees)} employee(s) found", employees
+        except Exception as e:
+            return False, f"Error searching employees: {str(e)}", []
+
     def get_employee_by_id(self, employee_id: int) -> Tuple[bool, str, Optional[Employee]]:
         """
         Get an employee by ID.
@@ -126,148 +568,593 @@ class EmployeeService:
             employee_id: ID of the employee to retrieve
         """
         try:
-            employees = self.db.fetch_all_employees()
-            for emp in employees:
-                if emp[0] == employee_id:
-                    return True, "Employee found", Employee.from_tuple(emp)
-            return False, f"Employee with ID {employee_id} not found", None
+            version = self._check_cache()
+            employee = self._employee_cache.get(employee_id)
+            if employee is LRUCache.MISSING:
+                row = self.db.fetch_employee_by_id(employee_id)
+                if row is None:
+                    return False, f"Employee with ID {employee_id} not found", None
+                employee = Employee.from_tuple(row)
+                with self._cache_lock:
+                    # A write since the version was read may have changed the row
+                    if self._cache_version == version:
+                        self._employee_cache.put(employee_id, employee)
+            # Hand out a copy so callers cannot modify the cached object
+            return True, "Employee found", replace(employee)
         except Exception as e:
             return False, f"Error retrieving employee: {str(e)}", None
 
-    def export_to_csv(self, filename: str) -> Tuple[bool, str, Optional[str]]:
+    def get_employees_by_email(self, email: str) -> Tuple[bool, str, List[Employee]]:
         """
-        Export all employee data to a CSV file.
+        Get all employees with the given email address.
 
         Args:
-            filename: Path to save the CSV file
+            email: Email address to look up
+        """
+        try:
+            rows = self.db.fetch_employees_by_email(email)
+            return True, f"{len(rows)} employee(s) found", [Employee.from_tuple(row) for row in rows]
+        except Exception as e:
+            return False, f"Error retrieving employees: {str(e)}", []
 
+    def get_employees_by_name(self, name: str) -> Tuple[bool, str, List[Employee]]:
+        """
+        Get all employees with the given name.
+
+        Args:
+            name: Employee name to look up
         """
         try:
-            # Get all employees
-            success, _, employees = self.get_all_employees()
-            if not success:
-                return False, "Failed to retrieve employee data", None
+            rows = self.db.fetch_employees_by_name(name)
+            return True, f"{len(rows)} employee(s) found", [Employee.from_tuple(row) for row in rows]
+        except Exception as e:
+            return False, f"Error retrieving employees: {str(e)}", []
 
-            # Write to CSV file
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.writer(csvfile)
+    def get_statistics(self) -> Tuple[bool, str, Dict[str, Any]]:
+        """
+        Get workforce statistics: headcount by job, gender split and age histogram.
 
-                # Write header
-                writer.writerow(['ID', 'Name', 'Age', 'Job', 'Email', 'Gender', 'Phone', 'Address'])
+        Read from summary tables kept up to date by database triggers, so
+        this costs the same for 100 or 1,000,000 employees.
 
-                # Write data
-                writer.writerows(employees)
+        Returns:
+            Tuple of (success, message, statistics) where statistics holds
+            'total', 'by_job', 'by_gender' and 'by_age_band' ('30-39': n)
+        """
+        try:
+            statistics = {'total': 0, 'by_job': {}, 'by_gender': {}, 'by_age_band': {}}
+            for dimension, value, headcount in self.db.fetch_statistics():
+                if value == '':
+                    label = "Unknown"
+                elif dimension == 'age_band':
+                    label = f"{value}-{value + 9}"
+                else:
+                    label = value
+                statistics['by_' + dimension][label] = headcount
+                if dimension == 'gender':
+                    statistics['total'] += headcount
+            return True, "Statistics retrieved successfully", statistics
+        except Exception as e:
+            return False, f"Error retrieving statistics: {str(e)}", {}
 
-            return True, "Data exported to CSV successfully", filename
+    def rebuild_statistics(self) -> Tuple[bool, str, None]:
+        """
+        Recompute the statistics summary tables from the Employees table.
+
+        Returns:
+            Tuple of (success, message, None)
+        """
+        try:
+            self.db.rebuild_statistics()
+            return True, "Statistics rebuilt successfully", None
         except Exception as e:
-            error_msg = f"Error exporting to CSV: {e}"
-            print(error_msg)
-            return False, error_msg, None
+            return False, f"Error rebuilding statistics: {str(e)}", None
+
+    def check_statistics(self) -> Tuple[bool, str, List[Tuple]]:
+        """
+        Check the statistics summary tables against the Employees table.
+
+        Returns:
+            Tuple of (consistent, message, mismatches) where each mismatch is
+            (dimension, value, stored, actual)
+        """
+        try:
+            mismatches = self.db.verify_statistics()
+            if mismatches:
+                return False, f"{len(mismatches)} statistics row(s) out of date", mismatches
+            return True, "Statistics are consistent", []
+        except Exception as e:
+            return False, f"Error checking statistics: {str(e)}", []
 
-    def export_to_excel(self, filename: str) -> Tuple[bool, str, Optional[str]]:
+    def export(self, export_format: str, filename: str, filters: Optional[Dict[str, Any]] = None,
+               order_by: Union[None, str, Sequence[str]] = None, **options) -> Tuple[bool, str, Optional[str]]:
         """
-        Export all employee data to an Excel file.
+        Export employee data in a registered format (see services.exporters).
+
+        The format's backend is imported the first time it is used.
 
         Args:
-            filename: Path to save the Excel file
+            export_format: Registered format name, e.g. 'csv', 'xlsx' or 'pdf'
+            filename: Path to save the file
+            filters: Optional filter spec selecting which employees to export
+            order_by: Optional sort spec; defaults to ID order
+            options: Format-specific options, plus progress and should_cancel hooks
+
+        Returns:
+            Tuple of (success, message, filename)
+        """
+        try:
+            exporter = get_exporter_spec(export_format).load()
+        except ValueError as e:
+            return False, str(e), None
+        except ImportError as e:
+            return False, f"Export to {export_format} is not available: {e}", None
+        return exporter(self, filename, filters=filters, order_by=order_by, **options)
+
+    def export_to_csv(self, filename: str, filters: Optional[Dict[str, Any]] = None,
+                      order_by: Union[None, str, Sequence[str]] = None, **options) -> Tuple[bool, str, Optional[str]]:
+        """
+        Export employee data to a CSV file (all employees unless filtered).
+
+        Options (see services.exporters.csv_exporter): compress, progress,
+        should_cancel, chunk_size.
+        """
+        return self.export('csv', filename, filters, order_by, **options)
+
+    def export_to_excel(self, filename: str, filters: Optional[Dict[str, Any]] = None,
+                        order_by: Union[None, str, Sequence[str]] = None, **options) -> Tuple[bool, str, Optional[str]]:
+        """
+        Export employee data to an Excel file (all employees unless filtered).
+
+        Options (see services.exporters.excel_exporter): progress,
+        should_cancel, chunk_size, max_rows_per_sheet.
+        """
+        return self.export('xlsx', filename, filters, order_by, **options)
+
+    def export_to_pdf(self, filename: str, filters: Optional[Dict[str, Any]] = None,
+                      order_by: Union[None, str, Sequence[str]] = None, **options) -> Tuple[bool, str, Optional[str]]:
+        """
+        Export employee data to a PDF file (all employees unless filtered).
+
+        Options (see services.exporters.pdf_exporter): progress,
+        should_cancel, column_widths, chunk_size.
+        """
+        return self.export('pdf', filename, filters, order_by, **options)
+
+    def export_bundle(self, formats: Sequence[str], directory: str, basename: str = "employees",
+                      filters: Optional[Dict[str, Any]] = None,
+                      order_by: Union[None, str, Sequence[str]] = None,
+                      max_workers: Optional[int] = None,
+                      should_cancel: Optional[Callable[[], bool]] = None) -> Tuple[bool, str, Dict[str, Dict[str, Any]]]:
         """
+        Export the same data to several formats at once.
+
+        The database is copied once with SQLite's backup API, so every file
+        is written from the same consistent snapshot, and each format is
+        rendered in its own process so PDF and Excel generation run on
+        separate cores.
+
+            service.export_bundle(['csv', 'xlsx', 'pdf'], 'reports/2024-01')
+
+        Args:
+            formats: Registered format names, e.g. 'csv', 'xlsx', 'pdf'
+            directory: Directory to write the files to (created if missing)
+            basename: File name without extension
+            filters: Optional filter spec selecting which employees to export
+            order_by: Optional sort spec; defaults to ID order
+            max_workers: Number of worker processes; defaults to one per format
+            should_cancel: Polled before the snapshot, before each format is
+                started and while the workers run; returning True skips the
+                formats not started yet, waits for the running ones and
+                removes every file written
+
+        Returns:
+            Tuple of (success, message, results) where results maps each
+            format to a dict with 'success', 'message', 'filename' and
+            'seconds', plus a 'snapshot' entry timing the copy
+        """
+        unknown = [export_format for export_format in formats if export_format not in export_formats()]
+        if unknown or not formats:
+            supported = ", ".join(export_formats())
+            return False, f"Unknown export format(s): {', '.join(unknown)} (supported: {supported})", {}
+
+        start = time.perf_counter()
+        snapshot_dir = None
         try:
-            # Get all employees
-            success, _, employees = self.get_all_employees()
-            if not success:
-                return False, "Failed to retrieve employee data", None
-
-            # Create a new workbook and select the active sheet
-            workbook = openpyxl.Workbook()
-            sheet = workbook.active
-            sheet.title = "Employees"
-
-            # Write header
-            headers = ['ID', 'Name', 'Age', 'Job', 'Email', 'Gender', 'Phone', 'Address']
-            for col_num, header in enumerate(headers, 1):
-                sheet.cell(row=1, column=col_num).value = header
-
-            # Write data
-            for row_num, employee in enumerate(employees, 2):
-                for col_num, value in enumerate(employee, 1):
-                    sheet.cell(row=row_num, column=col_num).value = value
-
-            # Auto-adjust column widths
-            for column in sheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                adjusted_width = (max_length + 2) * 1.2
-                sheet.column_dimensions[column_letter].width = adjusted_width
-
-            # Save the workbook
-            workbook.save(filename)
-            return True, "Data exported to Excel successfully", filename
+            os.makedirs(directory, exist_ok=True)
+            if should_cancel and should_cancel():
+                return False, "Export cancelled", {}
+            snapshot_dir = tempfile.mkdtemp(prefix="employees-snapshot-")
+            snapshot_path = os.path.join(snapshot_dir, "snapshot.db")
+            self.db.backup(snapshot_path)
+            # Open it once here so it is already migrated and in WAL mode;
+            # workers switching the journal mode at the same time can fail
+            # with "database is locked"
+            Database(snapshot_path).close()
+            results: Dict[str, Dict[str, Any]] = {
+                'snapshot': {'seconds': time.perf_counter() - start},
+            }
+
+            # Imported here to keep it off the startup path, like the export backends
+            from concurrent.futures import wait
+
+            with process_pool(max_workers or len(formats)) as pool:
+                futures = {}
+                cancelled = False
+                for export_format in formats:
+                    if should_cancel and should_cancel():
+                        cancelled = True
+                        break
+                    spec = get_exporter_spec(export_format)
+                    filename = os.path.join(directory, basename + spec.extension)
+                    futures[export_format] = (filename, pool.submit(
+                        _export_snapshot, snapshot_path, spec, filename, filters, order_by))
+
+                pending = {future for _, future in futures.values()}
+                while pending and not cancelled:
+                    _, pending = wait(pending, timeout=BUNDLE_CANCEL_POLL)
+                    cancelled = bool(pending) and bool(should_cancel and should_cancel())
+                if cancelled:
+                    # Formats already running cannot be interrupted; the pool waits for them
+                    for future in pending:
+                        future.cancel()
+
+            if cancelled:
+                for filename, _ in futures.values():
+                    if os.path.exists(filename):
+                        os.remove(filename)
+                return False, "Export cancelled", results
+
+            for export_format, (filename, future) in futures.items():
+                try:
+                    success, message, seconds = future.result()
+                except Exception as e:
+                    success, message, seconds = False, f"Error exporting to {export_format}: {e}", 0.0
+                results[export_format] = {
+                    'success': success,
+                    'message': message,
+                    'filename': filename if success else None,
+                    'seconds': seconds,
+                }
+
+            exported = [export_format for export_format in formats if results[export_format]['success']]
+            timings = ", ".join(f"{export_format} {results[export_format]['seconds']:.1f}s"
+                                for export_format in formats)
+            message = (f"Exported {len(exported)} of {len(formats)} format(s) in "
+                       f"{time.perf_counter() - start:.1f}s ({timings})")
+            return len(exported) == len(formats), message, results
         except Exception as e:
-            error_msg = f"Error exporting to Excel: {e}"
-            print(error_msg)
-            return False, error_msg, None
+            return False, f"Error exporting bundle: {str(e)}", {}
+        finally:
+            if snapshot_dir:
+                shutil.rmtree(snapshot_dir, ignore_errors=True)
 
-    def export_to_pdf(self, filename: str) -> Tuple[bool, str, Optional[str]]:
+    def export_snapshot(self, filename: str, progress: Optional[Callable[[int, int], None]] = None,
+                        should_cancel: Optional[Callable[[], bool]] = None,
+                        pages_per_step: int = SNAPSHOT_PAGES_PER_STEP,
+                        sleep: float = 0.0) -> Tuple[bool, str, Optional[str]]:
         """
-        Export all employee data to a PDF file.
+        Save a consistent copy of the whole database file.
+
+        The copy is made with SQLite's backup API in steps of
+        pages_per_step pages, so progress can be reported and the export
+        cancelled between steps. Other threads keep reading and writing
+        meanwhile; the copy is the database as of when it started. It is
+        written next to filename and renamed into place when complete.
 
         Args:
-            filename: Path to save the PDF file
+            filename: Path of the SQLite file to create (replaced if it exists)
+            progress: Called as progress(pages_copied, total_pages) after each step
+            should_cancel: Polled after each step; returning True stops the
+                export and removes the partial copy
+            pages_per_step: Database pages copied per step
+            sleep: Seconds to pause between steps
+
+        Returns:
+            Tuple of (success, message, filename)
         """
+        partial = filename + ".partial"
+
+        def on_step(copied, total):
+            if progress:
+                progress(copied, total)
+            if should_cancel and should_cancel():
+                raise ExportCancelled()
+
         try:
-            # Get all employees
-            success, _, employees = self.get_all_employees()
-            if not success:
-                return False, "Failed to retrieve employee data", None
-
-            # Create PDF document
-            doc = SimpleDocTemplate(filename, pagesize=landscape(letter))
-            elements = []
-
-            # Add title
-            styles = getSampleStyleSheet()
-            title = Paragraph("Employee Management System - Employee Report", styles['Title'])
-            elements.append(title)
-            elements.append(Paragraph("<br/><br/>", styles['Normal']))
-
-            # Prepare data for table
-            headers = ['ID', 'Name', 'Age', 'Job', 'Email', 'Gender', 'Phone', 'Address']
-            data = [headers]  # First row is the header
-            for employee in employees:
-                data.append(employee)
-
-            # Create table
-            table = Table(data)
-
-            # Style the table
-            style = TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ])
-
-            # Add alternating row colors
-            for i in range(1, len(data)):
-                if i % 2 == 0:
-                    style.add('BACKGROUND', (0, i), (-1, i), colors.lightgrey)
-
-            table.setStyle(style)
-            elements.append(table)
-
-            # Build PDF
-            doc.build(elements)
-            return True, "Data exported to PDF successfully", filename
+            self.db.backup(partial, pages=pages_per_step, progress=on_step, sleep=sleep)
+            os.replace(partial, filename)
+            return True, "Database snapshot saved successfully", filename
+        except ExportCancelled:
+            return False, "Export cancelled", None
         except Exception as e:
-            error_msg = f"Error exporting to PDF: {e}"
+            error_msg = f"Error saving database snapshot: {e}"
             print(error_msg)
             return False, error_msg, None
+        finally:
+            if os.path.exists(partial):
+                os.remove(partial)
+
+    def import_ndjson(self, filename: str, chunk_size: int = IMPORT_CHUNK_SIZE,
+                      progress: Optional[Callable[[int, int], None]] = None,
+                      should_cancel: Optional[Callable[[], bool]] = None) -> Tuple[bool, str, Dict[str, Any]]:
+        """
+        Import employees from a newline-delimited JSON file (e.g. from the 'ndjson' export).
+
+        The file is read line by line and each chunk is inserted through
+        add_employees in its own transaction, like import_csv, so memory
+        stays bounded, other writers are not held up for the whole file
+        and an interrupted import keeps the chunks already committed.
+        Records that fail to parse or validate, or duplicate an employee,
+        are skipped and reported. Imported employees get new ids. A null
+        age or gender is stored as NULL again, as the export wrote it.
+
+        Args:
+            filename: Path to the file; '.gz' files are decompressed
+            chunk_size: Records validated and inserted at a time
+            progress: Called as progress(bytes_read, file_size) after each chunk
+            should_cancel: Polled after each chunk; returning True stops the
+                import, keeping the chunks already committed
+
+        Returns:
+            Tuple of (success, message, summary) where summary holds
+            'imported' (number of employees added) and 'errors', a list
+            of (line_number, message) for the skipped records
+        """
+        imported = 0
+        errors: List[Tuple[int, str]] = []
+        cancelled = False
+        try:
+            stream, raw = open_input(filename)
+            with stream, raw:
+                total = os.fstat(raw.fileno()).st_size
+                records = read_records(stream)
+                while True:
+                    chunk = list(islice(records, chunk_size))
+                    if not chunk:
+                        break
+                    errors.extend((line, error) for line, data, error in chunk if data is None)
+                    valid = [(line, data) for line, data, _ in chunk if data is not None]
+                    success, message, results = self.add_employees([data for _, data in valid], NULLABLE_FIELDS)
+                    if not success:
+                        raise RuntimeError(message)
+                    for (line, _), (added, result_message, _) in zip(valid, results):
+                        if added:
+                            imported += 1
+                        else:
+                            errors.append((line, result_message))
+                    if progress:
+                        progress(raw.tell(), total)
+                    if should_cancel and should_cancel():
+                        cancelled = True
+                        break
+        except Exception as e:
+            errors.sort()
+            return False, f"Error importing NDJSON: {str(e)}", {'imported': imported, 'errors': errors}
+
+        errors.sort()
+        message = f"Imported {imported:,} employee(s)"
+        if errors:
+            message += f"; {len(errors):,} record(s) rejected"
+        if cancelled:
+            return False, f"Import cancelled. {message}", {'imported': imported, 'errors': errors}
+        return True, message, {'imported': imported, 'errors': errors}
+
+    def import_csv(self, filename: str, error_file: Optional[str] = None,
+                   chunk_size: int = IMPORT_CHUNK_SIZE, processes: int = 0,
+                   progress: Optional[Callable[[int, int], None]] = None,
+                   should_cancel: Optional[Callable[[], bool]] = None) -> Tuple[bool, str, Dict[str, Any]]:
+        """
+        Import employees from a CSV file, such as one written by export_to_csv.
+
+        The file is streamed in chunks of chunk_size rows. Each chunk is
+        validated with utils.validators and its valid rows are inserted
+        in one transaction, so memory stays bounded and an interrupted
+        import keeps the chunks already committed. Columns are matched by
+        header name, in any order; an ID column is ignored and imported
+        employees get new ids. Rejected rows are written to error_file
+        with their line number and the reason.
+
+            service.import_csv('roster.csv', processes=4)
+
+        Args:
+            filename: Path to the CSV file; '.gz' files are decompressed
+            error_file: Where to write rejected rows; defaults to
+                '<name>.errors.csv' next to the input, written only if
+                there are rejected rows
+            chunk_size: Rows validated and committed at a time
+            processes: Validate in this many worker processes (worth it for
+                very large files on multi-core machines); 0 validates here
+            progress: Called as progress(bytes_read, file_size) after each chunk
+            should_cancel: Polled after each chunk; returning True stops the
+                import, keeping the chunks already committed
+
+        Returns:
+            Tuple of (success, message, summary) where summary holds
+            'imported', 'rejected', 'errors' ((line, reason) for the first
+            IMPORT_ERROR_SAMPLE rejected rows), 'error_file' (None if
+            nothing was rejected) and 'seconds'
+        """
+        return self._import_rows("CSV", lambda: open_csv(filename, chunk_size), error_file or default_error_file(filename),
+                                 processes, progress, should_cancel)
+
+    def import_excel(self, filename: str, error_file: Optional[str] = None,
+                     chunk_size: int = IMPORT_CHUNK_SIZE, processes: int = 0,
+                     progress: Optional[Callable[[int, int], None]] = None,
+                     should_cancel: Optional[Callable[[], bool]] = None) -> Tuple[bool, str, Dict[str, Any]]:
+        """
+        Import employees from an Excel workbook, such as one written by export_to_excel.
+
+        The workbook is read in openpyxl's read-only mode, one row at a
+        time, so memory stays bounded however large it is. Every sheet is
+        read (export_to_excel continues large exports on 'Employees (2)'
+        and so on); each sheet's header row is matched like import_csv's.
+        Numbers are converted to text before validation, so an age stored
+        as 30 or 30.0 imports as '30'. Otherwise rows are validated,
+        inserted and reported like import_csv's, with rejected rows located
+        as 'Sheet!row'.
+
+        Args:
+            filename: Path to the .xlsx file
+            error_file: Where to write rejected rows; defaults to
+                '<name>.errors.csv' next to the input, written only if
+                there are rejected rows
+            chunk_size: Rows validated and committed at a time
+            processes: Validate in this many worker processes; 0 validates here
+            progress: Called as progress(rows_read, total_rows) after each chunk
+            should_cancel: Polled after each chunk; returning True stops the
+                import, keeping the chunks already committed
+
+        Returns:
+            Tuple of (success, message, summary) like import_csv's
+        """
+        # Imported here so openpyxl is only loaded when a workbook is imported
+        from services.importers.excel_importer import open_excel
+        return self._import_rows("Excel", lambda: open_excel(filename, chunk_size), error_file or default_error_file(filename),
+                                 processes, progress, should_cancel)
+
+    def _import_rows(self, label: str, open_source: Callable[[], ImportSource], error_file: str, processes: int,
+                     progress: Optional[Callable[[int, int], None]],
+                     should_cancel: Optional[Callable[[], bool]]) -> Tuple[bool, str, Dict[str, Any]]:
+        """Validate and insert the rows of an import source chunk by chunk; see import_csv"""
+        start = time.perf_counter()
+        summary: Dict[str, Any] = {'imported': 0, 'rejected': 0, 'errors': [], 'error_file': None, 'seconds': 0.0}
+        errors_out = None
+        cancelled = False
+        try:
+            source = open_source()
+            try:
+                positions = map_headers(source.headers)
+
+                validated = validate_batches(source.batches, positions, processes)
+                try:
+                    for batch, (kept, valid, rejected) in validated:
+                        if valid:
+                            inserted = self._insert_unique([Employee(None, *values) for values in valid])
+                            duplicates = [(index, duplicate) for index, (_, duplicate) in zip(kept, inserted)
+                                          if duplicate]
+                            if duplicates:
+                                rejected = sorted(rejected + duplicates)
+                            summary['imported'] += len(valid) - len(duplicates)
+                        if rejected:
+                            if errors_out is None:
+                                errors_out = open(error_file, 'w', newline='', encoding='utf-8')
+                                errors = error_file_writer(errors_out, source.headers, source.line_header)
+                                summary['error_file'] = error_file
+                            errors.writerows(batch[index][1] + [batch[index][0], reason] for index, reason in rejected)
+                            room = IMPORT_ERROR_SAMPLE - len(summary['errors'])
+                            summary['errors'].extend((batch[index][0], reason) for index, reason in rejected[:max(room, 0)])
+                            summary['rejected'] += len(rejected)
+                        if progress:
+                            progress(source.position(), source.total)
+                        if should_cancel and should_cancel():
+                            cancelled = True
+                            break
+                finally:
+                    validated.close()
+            finally:
+                source.close()
+        except Exception as e:
+            return False, f"Error importing {label}: {str(e)}", summary
+        finally:
+            if errors_out is not None:
+                errors_out.close()
+            summary['seconds'] = time.perf_counter() - start
+
+        message = f"Imported {summary['imported']:,} employee(s)"
+        if summary['rejected']:
+            message += f"; {summary['rejected']:,} row(s) rejected, see {error_file}"
+        if cancelled:
+            return False, f"Import cancelled. {message}", summary
+        return True, message, summary
+
+    def export_changes(self, filename: str, checkpoint: str, export_format: str = 'csv',
+                       advance: bool = True,
+                       progress: Optional[Callable[[int, int], None]] = None,
+                       should_cancel: Optional[Callable[[], bool]] = None) -> Tuple[bool, str, Dict[str, Any]]:
+        """
+        Export only the employees inserted, updated or deleted since a named checkpoint.
+
+        The first export for a new checkpoint contains every employee as an
+        insert. Afterwards the checkpoint is moved to the end of what was
+        exported, so the next call picks up where this one stopped. Changes
+        are found through indexes on their change numbers, so the cost
+        follows the number of changes rather than the size of the table.
+
+            service.export_changes('payroll-delta.csv', 'payroll')
+
+        Args:
+            filename: Path to save the file
+            checkpoint: Checkpoint name, one per consumer (e.g. 'payroll')
+            export_format: 'csv' or 'json'
+            advance: Move the checkpoint after a successful export; pass
+                False to preview the changes without consuming them
+            progress: Called as progress(changes_written, total_changes)
+            should_cancel: Polled while writing; returning True stops the
+                export, removes the file and leaves the checkpoint alone
+
+        Returns:
+            Tuple of (success, message, summary) where summary holds
+            'filename', 'since', 'until' (change numbers) and the number
+            of 'insert', 'update' and 'delete' changes written
+        """
+        try:
+            since = self.db.get_checkpoint(checkpoint) or 0
+            until = self.db.change_position()
+            total = self.db.count_changes(since, until) if progress else 0
+            counts = write_changes(
+                self.db.iter_changes(since, until), filename, export_format,
+                header={'checkpoint': checkpoint, 'since': since, 'until': until},
+                progress=progress, total=total, should_cancel=should_cancel
+            )
+            if advance:
+                self.db.set_checkpoint(checkpoint, until)
+            summary = {'filename': filename, 'since': since, 'until': until, **counts}
+            message = (f"Exported {sum(counts.values())} change(s) since checkpoint '{checkpoint}': "
+                       f"{counts['insert']} inserted, {counts['update']} updated, {counts['delete']} deleted")
+            return True, message, summary
+        except ExportCancelled:
+            return False, "Export cancelled", {}
+        except ValueError as e:
+            return False, str(e), {}
+        except Exception as e:
+            return False, f"Error exporting changes: {str(e)}", {}
+
+    def mark_export_checkpoint(self, checkpoint: str) -> Tuple[bool, str, Optional[int]]:
+        """
+        Create or move a checkpoint to the current state, without exporting.
+
+        Use this when the consumer already has everything (e.g. after a full
+        export), so the next delta only contains later changes.
+
+        Args:
+            checkpoint: Checkpoint name
+
+        Returns:
+            Tuple of (success, message, change number the checkpoint is at)
+        """
+        try:
+            position = self.db.change_position()
+            self.db.set_checkpoint(checkpoint, position)
+            return True, f"Checkpoint '{checkpoint}' set", position
+        except Exception as e:
+            return False, f"Error setting checkpoint: {str(e)}", None
 
+    def get_export_checkpoints(self) -> Tuple[bool, str, List[Dict[str, Any]]]:
+        """
+        List the export checkpoints with how many changes each has pending.
 
+        Returns:
+            Tuple of (success, message, checkpoints) where each checkpoint is a
+            dict with 'name', 'change_seq', 'updated_at' and 'pending'
+        """
+        try:
+            position = self.db.change_position()
+            checkpoints = [
+                {'name': name, 'change_seq': change_seq, 'updated_at': updated_at,
+                 'pending': self.db.count_changes(change_seq, position)}
+                for name, change_seq, updated_at in self.db.fetch_checkpoints()
+            ]
+            return True, f"Found {len(checkpoints)} checkpoint(s)", checkpoints
+        except Exception as e:
+            return False, f"Error retrieving checkpoints: {str(e)}", []
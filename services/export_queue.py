@@ -0,0 +1,163 @@
+import threading
+from collections import deque
+from typing import Callable, Deque, List, Optional, Tuple
+
+# An export callable takes (filename, progress=..., should_cancel=...) and
+# returns (success, message, data), like the EmployeeService.export_to_*
+# methods.
+ExportFunc = Callable[..., Tuple[bool, str, Optional[str]]]
+
+class ExportJob:
+    """One queued export and its live progress, shared between threads"""
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    DONE = 'done'
+    FAILED = 'failed'
+    CANCELLED = 'cancelled'
+
+    def __init__(self, label: str, export: ExportFunc, filename: str, unit: str = "employees",
+                 action: str = "Export"):
+        """
+        Initialize a job.
+
+        Args:
+            label: Human-readable format name, e.g. "CSV"
+            export: Function that performs the export
+            filename: Path to export to
+            unit: What the export's progress counts, for display
+            action: "Export", or "Import" for an import run on the same worker
+        """
+        self.label = label
+        self.export = export
+        self.filename = filename
+        self.unit = unit
+        self.action = action
+        self.status = self.QUEUED
+        self.message = ""
+        self.rows_done = 0
+        self.rows_total = 0
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        """Ask the job to stop; a queued job is skipped, a running one stops at its next chunk"""
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def _progress(self, rows_done: int, rows_total: int) -> None:
+        self.rows_done = rows_done
+        self.rows_total = rows_total
+
+    def _run(self) -> None:
+        if self.cancelled:
+            self.status, self.message = self.CANCELLED, f"{self.action} cancelled"
+            return
+        self.status = self.RUNNING
+        try:
+            success, message, _ = self.export(self.filename, progress=self._progress,
+                                              should_cancel=self._cancel.is_set)
+        except Exception as e:
+            success, message = False, f"Error during {self.label} {self.action.lower()}: {e}"
+        if success:
+            self.status = self.DONE
+        elif self.cancelled:
+            self.status = self.CANCELLED
+        else:
+            self.status = self.FAILED
+        self.message = message
+
+class ExportQueue:
+    """
+    Runs exports one after another on a background thread.
+
+    The worker never touches the UI. Callers poll current(), waiting() and
+    finished() from their own thread (e.g. with Tk's root.after).
+    """
+
+    def __init__(self):
+        self._waiting: Deque[ExportJob] = deque()
+        self._finished: Deque[ExportJob] = deque()
+        self._current: Optional[ExportJob] = None
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, label: str, export: ExportFunc, filename: str, unit: str = "employees",
+               action: str = "Export") -> ExportJob:
+        """
+        Queue an export behind any that are already waiting.
+
+        Args:
+            label: Human-readable format name, e.g. "CSV"
+            export: Function that performs the export
+            filename: Path to export to
+            unit: What the export's progress counts, for display
+            action: "Export", or "Import" for an import run on the same worker
+
+        Returns:
+            The queued job
+        """
+        job = ExportJob(label, export, filename, unit, action)
+        with self._condition:
+            self._waiting.append(job)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._work, name="export-worker", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+        return job
+
+    def _work(self) -> None:
+        while True:
+            with self._condition:
+                while not self._waiting:
+                    self._condition.wait()
+                job = self._current = self._waiting.popleft()
+            job._run()
+            with self._condition:
+                self._finished.append(job)
+                self._current = None
+                self._condition.notify_all()
+
+    def current(self) -> Optional[ExportJob]:
+        """The job being exported right now, if any"""
+        with self._condition:
+            return self._current
+
+    def waiting(self) -> List[ExportJob]:
+        """Jobs queued behind the current one, in the order they will run"""
+        with self._condition:
+            return list(self._waiting)
+
+    def busy(self) -> bool:
+        """True while a job is running or waiting"""
+        with self._condition:
+            return self._current is not None or bool(self._waiting)
+
+    def cancel_all(self) -> None:
+        """Cancel the running job and every waiting one"""
+        with self._condition:
+            for job in [self._current, *self._waiting]:
+                if job is not None:
+                    job.cancel()
+
+    def finished(self) -> List[ExportJob]:
+        """Jobs completed since the last call, oldest first"""
+        with self._condition:
+            jobs = list(self._finished)
+            self._finished.clear()
+            return jobs
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every submitted job has finished.
+
+        Args:
+            timeout: Maximum number of seconds to wait
+
+        Returns:
+            True if the queue is idle, False on timeout
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._current is None and not self._waiting, timeout)
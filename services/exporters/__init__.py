@@ -0,0 +1,93 @@
+# Exporters package initialization
+#
+# Export formats are looked up by name in a registry. Built-in formats are
+# registered by module path only, so their backends (openpyxl, reportlab)
+# are imported the first time that format is used rather than whenever
+# the service is imported. Other formats can register themselves:
+#
+#   register_exporter('yaml', '.yaml', 'YAML', module='mypackage.yaml_exporter')
+#
+# An exporter is a function
+#
+#   export(service, filename, filters=None, order_by=None,
+#          progress=None, should_cancel=None, **options) -> (success, message, filename)
+#
+# that reads rows through the EmployeeService streaming API.
+import importlib
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+
+EXPORT_HEADERS = ['ID', 'Name', 'Age', 'Job', 'Email', 'Gender', 'Phone', 'Address']
+
+# Rows fetched from the database and written per step by the streaming exports
+EXPORT_CHUNK_SIZE = 1000
+
+class ExportCancelled(Exception):
+    """Raised inside an export when the caller asked to stop"""
+
+@dataclass(frozen=True)
+class ExporterSpec:
+    """A registered export format"""
+    name: str
+    extension: str
+    label: str
+    module: Optional[str] = None
+    function: str = 'export'
+    export: Optional[Callable] = None
+
+    def load(self) -> Callable:
+        """Return the export function, importing its module on first use"""
+        if self.export is not None:
+            return self.export
+        return getattr(importlib.import_module(self.module), self.function)
+
+_REGISTRY: Dict[str, ExporterSpec] = {}
+
+def register_exporter(name: str, extension: str, label: str, module: Optional[str] = None,
+                      function: str = 'export', export: Optional[Callable] = None) -> ExporterSpec:
+    """
+    Register (or replace) an export format.
+
+    Args:
+        name: Format name used by EmployeeService.export, e.g. 'csv'
+        extension: File extension including the dot
+        label: Human-readable name for menus and messages
+        module: Module providing the export function, imported on first use
+        function: Name of the export function in module
+        export: The export function itself, instead of module/function
+
+    Returns:
+        The registered spec
+
+    Raises:
+        ValueError: If neither module nor export is given
+    """
+    if module is None and export is None:
+        raise ValueError(f"Exporter '{name}' needs a module or an export function")
+    spec = ExporterSpec(name, extension, label, module, function, export)
+    _REGISTRY[name] = spec
+    return spec
+
+def get_exporter_spec(name: str) -> ExporterSpec:
+    """
+    Look up a registered export format.
+
+    Raises:
+        ValueError: If no format with this name is registered
+    """
+    try:
+        return _REGISTRY[name]
+    except KeyError:
+        raise ValueError(f"Unknown export format '{name}' (supported: {', '.join(_REGISTRY)})") from None
+
+def export_formats() -> List[str]:
+    """Names of all registered export formats, in registration order"""
+    return list(_REGISTRY)
+
+register_exporter('csv', '.csv', 'CSV', module='services.exporters.csv_exporter')
+register_exporter('xlsx', '.xlsx', 'Excel', module='services.exporters.excel_exporter')
+register_exporter('pdf', '.pdf', 'PDF', module='services.exporters.pdf_exporter')
+register_exporter('ndjson', '.ndjson', 'NDJSON', module='services.exporters.ndjson_exporter')
+
+__all__ = ['EXPORT_HEADERS', 'EXPORT_CHUNK_SIZE', 'ExportCancelled', 'ExporterSpec',
+           'register_exporter', 'get_exporter_spec', 'export_formats']
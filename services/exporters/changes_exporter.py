@@ -0,0 +1,97 @@
+import csv
+import json
+import os
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+from services.exporters import EXPORT_HEADERS, EXPORT_CHUNK_SIZE, ExportCancelled
+from models.employee import EMPLOYEE_COLUMNS
+
+# Delta exports: one line (CSV) or object (JSON) per changed employee
+CHANGE_HEADERS = ['Change'] + EXPORT_HEADERS + ['Changed At']
+CHANGE_FORMATS = ('csv', 'json')
+
+def _write_csv(changes: Iterator[Tuple], out, on_chunk: Callable[[list], None], chunk_size: int) -> None:
+    """Write changes as CSV; a delete only fills in Change, ID and Changed At"""
+    writer = csv.writer(out)
+    writer.writerow(CHANGE_HEADERS)
+    blank = [''] * (len(EXPORT_HEADERS) - 1)
+    while True:
+        chunk = list(islice(changes, chunk_size))
+        if not chunk:
+            break
+        writer.writerows([op, *row, changed_at] if row is not None else [op, employee_id, *blank, changed_at]
+                         for op, employee_id, changed_at, row in chunk)
+        on_chunk(chunk)
+
+def _write_json(changes: Iterator[Tuple], out, on_chunk: Callable[[list], None], chunk_size: int,
+                header: Dict) -> None:
+    """Write changes as one JSON document, streaming the changes array"""
+    # The header's fields, then the array: '{"a": 1, "changes": [' or '{"changes": ['
+    fields = json.dumps(header)[1:-1]
+    out.write("{" + (fields + ", " if fields else "") + '"changes": [')
+    first = True
+    while True:
+        chunk = list(islice(changes, chunk_size))
+        if not chunk:
+            break
+        for op, employee_id, changed_at, row in chunk:
+            record = {'change': op}
+            record.update(zip(EMPLOYEE_COLUMNS, row) if row is not None else {'id': employee_id})
+            record['changed_at'] = changed_at
+            out.write(("\n" if first else ",\n") + json.dumps(record))
+            first = False
+        on_chunk(chunk)
+    out.write("\n]}\n")
+
+def write_changes(changes: Iterable[Tuple], filename: str, export_format: str = 'csv',
+                  header: Optional[Dict] = None,
+                  progress: Optional[Callable[[int, int], None]] = None, total: int = 0,
+                  should_cancel: Optional[Callable[[], bool]] = None,
+                  chunk_size: int = EXPORT_CHUNK_SIZE) -> Dict[str, int]:
+    """
+    Write (op, employee_id, changed_at, row) changes from Database.iter_changes to a file.
+
+    Args:
+        changes: Changes in the order they happened
+        filename: Path to write
+        export_format: 'csv' or 'json'
+        header: Extra top-level fields for the JSON document (checkpoint range)
+        progress: Called as progress(changes_written, total) after each chunk
+        total: Expected number of changes, for progress
+        should_cancel: Polled after each chunk; returning True stops the
+            export and removes the partial file
+        chunk_size: Number of changes written at a time
+
+    Returns:
+        Number of changes written per op: {'insert': n, 'update': n, 'delete': n}
+
+    Raises:
+        ValueError: If export_format is not supported
+        ExportCancelled: If should_cancel asked to stop
+    """
+    if export_format not in CHANGE_FORMATS:
+        raise ValueError(f"Unknown change export format '{export_format}' (supported: {', '.join(CHANGE_FORMATS)})")
+
+    counts = {'insert': 0, 'update': 0, 'delete': 0}
+
+    def on_chunk(chunk):
+        for change in chunk:
+            counts[change[0]] += 1
+        if progress:
+            written = sum(counts.values())
+            progress(written, max(total, written))
+        if should_cancel and should_cancel():
+            raise ExportCancelled()
+
+    changes = iter(changes)
+    try:
+        with open(filename, 'w', newline='', encoding='utf-8') as out:
+            if export_format == 'csv':
+                _write_csv(changes, out, on_chunk, chunk_size)
+            else:
+                _write_json(changes, out, on_chunk, chunk_size, header or {})
+    except BaseException:
+        if os.path.exists(filename):
+            os.remove(filename)
+        raise
+    return counts
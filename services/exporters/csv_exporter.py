@@ -0,0 +1,72 @@
+import csv
+import gzip
+import os
+from itertools import islice
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+from services.exporters import EXPORT_HEADERS, EXPORT_CHUNK_SIZE
+
+def export(service, filename: str, filters: Optional[Dict[str, Any]] = None,
+           order_by: Union[None, str, Sequence[str]] = None,
+           progress: Optional[Callable[[int, int], None]] = None,
+           should_cancel: Optional[Callable[[], bool]] = None,
+           compress: Optional[bool] = None,
+           chunk_size: int = EXPORT_CHUNK_SIZE) -> Tuple[bool, str, Optional[str]]:
+    """
+    Export employee data to a CSV file (all employees unless filtered).
+
+    Rows are streamed from the database and written chunk by chunk, so
+    memory use does not depend on the number of employees.
+
+    Args:
+        service: EmployeeService to read employees from
+        filename: Path to save the CSV file
+        filters: Optional filter spec selecting which employees to export
+        order_by: Optional sort spec; defaults to ID order
+        progress: Called as progress(rows_written, total_rows) after each chunk
+        should_cancel: Polled after each chunk; returning True stops the
+            export and removes the partial file
+        compress: Write gzip-compressed CSV; defaults to True for '.gz' filenames
+        chunk_size: Number of rows fetched and written at a time
+    """
+    if compress is None:
+        compress = filename.lower().endswith('.gz')
+
+    try:
+        total = service.db.count_employees(filters) if progress else 0
+        written = 0
+        cancelled = False
+
+        # Write to CSV file
+        if compress:
+            csvfile = gzip.open(filename, 'wt', newline='', encoding='utf-8')
+        else:
+            csvfile = open(filename, 'w', newline='', encoding='utf-8')
+        with csvfile:
+            writer = csv.writer(csvfile)
+
+            # Write header
+            writer.writerow(EXPORT_HEADERS)
+
+            # Write data, streamed from the database
+            rows = service.iter_employees(chunk_size, filters, order_by)
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                writer.writerows(chunk)
+                written += len(chunk)
+                if progress:
+                    progress(written, max(total, written))
+                if should_cancel and should_cancel():
+                    cancelled = True
+                    rows.close()
+                    break
+
+        if cancelled:
+            os.remove(filename)
+            return False, "Export cancelled", None
+        return True, "Data exported to CSV successfully", filename
+    except Exception as e:
+        error_msg = f"Error exporting to CSV: {e}"
+        print(error_msg)
+        return False, error_msg, None
@@ -0,0 +1,90 @@
+from itertools import islice
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import openpyxl
+from openpyxl.utils import get_column_letter
+from services.exporters import EXPORT_HEADERS, EXPORT_CHUNK_SIZE
+
+# Excel's row limit per worksheet
+EXCEL_MAX_ROWS = 1_048_576
+
+def _new_sheet(workbook, number: int, widths: List[float]):
+    """Add sheet number `number` to a write-only workbook, with column widths and header"""
+    sheet = workbook.create_sheet("Employees" if number == 1 else f"Employees ({number})")
+    for col_num, width in enumerate(widths, 1):
+        sheet.column_dimensions[get_column_letter(col_num)].width = width
+    sheet.append(EXPORT_HEADERS)
+    return sheet
+
+def export(service, filename: str, filters: Optional[Dict[str, Any]] = None,
+           order_by: Union[None, str, Sequence[str]] = None,
+           progress: Optional[Callable[[int, int], None]] = None,
+           should_cancel: Optional[Callable[[], bool]] = None,
+           chunk_size: int = EXPORT_CHUNK_SIZE,
+           max_rows_per_sheet: int = EXCEL_MAX_ROWS) -> Tuple[bool, str, Optional[str]]:
+    """
+    Export employee data to an Excel file (all employees unless filtered).
+
+    The workbook is built in openpyxl's write-only mode with rows appended
+    straight from the database cursor, so memory use does not depend on
+    the number of employees. When a sheet reaches Excel's row limit the
+    export continues on a new sheet ("Employees (2)", ...) with its own
+    header row.
+
+    Args:
+        service: EmployeeService to read employees from
+        filename: Path to save the Excel file
+        filters: Optional filter spec selecting which employees to export
+        order_by: Optional sort spec; defaults to ID order
+        progress: Called as progress(rows_written, total_rows) after each chunk
+        should_cancel: Polled after each chunk; returning True stops the
+            export without writing the file
+        chunk_size: Number of rows fetched and written at a time
+        max_rows_per_sheet: Rows per sheet, including the header row
+    """
+    try:
+        total = service.db.count_employees(filters) if progress else 0
+
+        # Write-only sheets emit their column definitions before the first
+        # row, so the widths come from one aggregate query up front
+        lengths = service.db.max_value_lengths(filters)
+        widths = [(max(length, len(header)) + 2) * 1.2
+                  for length, header in zip(lengths, EXPORT_HEADERS)]
+
+        workbook = openpyxl.Workbook(write_only=True)
+        sheets = 0
+        sheet = None
+        sheet_rows = max_rows_per_sheet
+        written = 0
+
+        rows = service.iter_employees(chunk_size, filters, order_by)
+        try:
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                for employee in chunk:
+                    if sheet_rows >= max_rows_per_sheet:
+                        sheets += 1
+                        sheet = _new_sheet(workbook, sheets, widths)
+                        sheet_rows = 1
+                    sheet.append(employee)
+                    sheet_rows += 1
+                written += len(chunk)
+                if progress:
+                    progress(written, max(total, written))
+                if should_cancel and should_cancel():
+                    return False, "Export cancelled", None
+        finally:
+            rows.close()
+
+        if sheet is None:
+            _new_sheet(workbook, 1, widths)
+
+        # Save the workbook
+        workbook.save(filename)
+        return True, "Data exported to Excel successfully", filename
+    except Exception as e:
+        error_msg = f"Error exporting to Excel: {e}"
+        print(error_msg)
+        return False, error_msg, None
@@ -0,0 +1,69 @@
+import gzip
+import json
+import os
+from itertools import islice
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+from services.exporters import EXPORT_CHUNK_SIZE
+from models.employee import EMPLOYEE_COLUMNS
+
+def export(service, filename: str, filters: Optional[Dict[str, Any]] = None,
+           order_by: Union[None, str, Sequence[str]] = None,
+           progress: Optional[Callable[[int, int], None]] = None,
+           should_cancel: Optional[Callable[[], bool]] = None,
+           compress: Optional[bool] = None,
+           chunk_size: int = EXPORT_CHUNK_SIZE) -> Tuple[bool, str, Optional[str]]:
+    """
+    Export employee data as newline-delimited JSON (all employees unless filtered).
+
+    Each line is one JSON object keyed by column name, with ids and ages
+    as JSON numbers and a missing age as null, so the file reads back
+    with the same types (see EmployeeService.import_ndjson). Rows are
+    streamed from the database, as for CSV.
+
+    Args:
+        service: EmployeeService to read employees from
+        filename: Path to save the file
+        filters: Optional filter spec selecting which employees to export
+        order_by: Optional sort spec; defaults to ID order
+        progress: Called as progress(rows_written, total_rows) after each chunk
+        should_cancel: Polled after each chunk; returning True stops the
+            export and removes the partial file
+        compress: Write gzip-compressed output; defaults to True for '.gz' filenames
+        chunk_size: Number of rows fetched and written at a time
+    """
+    if compress is None:
+        compress = filename.lower().endswith('.gz')
+
+    try:
+        total = service.db.count_employees(filters) if progress else 0
+        written = 0
+        cancelled = False
+        encode = json.JSONEncoder(ensure_ascii=False).encode
+
+        if compress:
+            out = gzip.open(filename, 'wt', encoding='utf-8')
+        else:
+            out = open(filename, 'w', encoding='utf-8')
+        with out:
+            rows = service.iter_employees(chunk_size, filters, order_by)
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+                out.write("".join(encode(dict(zip(EMPLOYEE_COLUMNS, row))) + "\n" for row in chunk))
+                written += len(chunk)
+                if progress:
+                    progress(written, max(total, written))
+                if should_cancel and should_cancel():
+                    cancelled = True
+                    rows.close()
+                    break
+
+        if cancelled:
+            os.remove(filename)
+            return False, "Export cancelled", None
+        return True, "Data exported to NDJSON successfully", filename
+    except Exception as e:
+        error_msg = f"Error exporting to NDJSON: {e}"
+        print(error_msg)
+        return False, error_msg, None
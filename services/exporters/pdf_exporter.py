@@ -0,0 +1,224 @@
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import letter, landscape
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph
+from reportlab.platypus.flowables import Flowable
+from services.exporters import EXPORT_HEADERS, EXPORT_CHUNK_SIZE, ExportCancelled
+
+# The employee report is laid out as page-sized tables fed from a row
+# iterator, so reportlab never holds or measures more than one page of
+# rows. Column widths are fixed up front (measured with the same fonts
+# reportlab's auto-sizing uses), every table repeats the header row, and
+# striping uses one ROWBACKGROUNDS command instead of a command per row.
+
+REPORT_TITLE = "Employee Management System - Employee Report"
+
+HEADER_FONT = ('Helvetica-Bold', 12)
+BODY_FONT = ('Helvetica', 10)
+CELL_PADDING = 6 + 6  # reportlab's default left + right cell padding
+
+BASE_STYLE = [
+    ('BACKGROUND', (0, 0), (-1, 0), colors.darkblue),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), HEADER_FONT[0]),
+    ('FONTSIZE', (0, 0), (-1, 0), HEADER_FONT[1]),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+]
+
+# Even data rows (counting from 1 over the whole report) are grey. A table
+# that starts on an odd row uses the first style, one that starts on an
+# even row the second.
+STRIPED_STYLES = (
+    TableStyle(BASE_STYLE + [('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.beige, colors.lightgrey])]),
+    TableStyle(BASE_STYLE + [('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.lightgrey, colors.beige])]),
+)
+
+def _cell_text(value) -> str:
+    return '' if value is None else str(value)
+
+def measure_column_widths(headers: Sequence[str], rows: Iterable[Sequence]) -> List[float]:
+    """
+    Compute the column widths reportlab would pick for a table of these rows.
+
+    Args:
+        headers: Header row, drawn in the header font
+        rows: Data rows, drawn in the body font (consumed once)
+
+    Returns:
+        One width in points per column, including cell padding
+    """
+    widths = [max(stringWidth(line, *HEADER_FONT) for line in header.split('\n')) for header in headers]
+    for row in rows:
+        for i, value in enumerate(row):
+            text = _cell_text(value)
+            if '\n' in text:
+                width = max(stringWidth(line, *BODY_FONT) for line in text.split('\n'))
+            else:
+                width = stringWidth(text, *BODY_FONT)
+            if width > widths[i]:
+                widths[i] = width
+    return [width + CELL_PADDING for width in widths]
+
+def _row_metrics(headers: Sequence[str], column_widths: Sequence[float]) -> Tuple[float, float, float]:
+    """Return (header height, one-line row height, extra height per line) as reportlab lays them out"""
+    blank = [''] * (len(headers) - 1)
+    probe = Table([list(headers), ['x'] + blank, ['x\nx'] + blank], colWidths=column_widths)
+    probe.setStyle(STRIPED_STYLES[0])
+    probe.wrap(0, 0)
+    header_height, row_height, two_line_height = probe._rowHeights
+    return header_height, row_height, two_line_height - row_height
+
+class EmployeeTableStream(Flowable):
+    """
+    Flowable that turns a row iterator into page-sized tables.
+
+    It never fits as a whole, so the frame asks it to split; each split
+    returns a table for the rows that fit the space left on the page plus
+    a new stream for the rest.
+    """
+
+    def __init__(self, headers: Sequence[str], rows: Iterator[Sequence], column_widths: Sequence[float],
+                 first_row: Sequence, row_number: int = 1,
+                 on_table: Optional[Callable[[int], None]] = None, metrics=None):
+        super().__init__()
+        self.headers = list(headers)
+        self.rows = rows
+        self.column_widths = list(column_widths)
+        self.first_row = first_row
+        self.row_number = row_number
+        self.on_table = on_table
+        self.metrics = metrics or _row_metrics(headers, column_widths)
+
+    def _row_height(self, row: Sequence) -> float:
+        _, row_height, line_height = self.metrics
+        lines = max(_cell_text(value).count('\n') for value in row) + 1
+        return row_height + (lines - 1) * line_height
+
+    def wrap(self, availWidth, availHeight):
+        # Always too tall, so that the frame calls split()
+        return availWidth, availHeight + 1
+
+    def split(self, availWidth, availHeight):
+        header_height = self.metrics[0]
+        row = self.first_row
+        row_height = self._row_height(row)
+        if header_height + row_height > availHeight:
+            # Not even one row fits; the frame moves us to the next page
+            return []
+
+        data = [self.headers]
+        heights = [header_height]
+        used = header_height
+        while row is not None and used + row_height <= availHeight:
+            data.append(row)
+            heights.append(row_height)
+            used += row_height
+            row = next(self.rows, None)
+            if row is not None:
+                row_height = self._row_height(row)
+
+        table = Table(data, colWidths=self.column_widths, rowHeights=heights)
+        table.setStyle(STRIPED_STYLES[(self.row_number + 1) % 2])
+        written = len(data) - 1
+        if self.on_table:
+            self.on_table(written)
+        if row is None:
+            return [table]
+        return [table, EmployeeTableStream(self.headers, self.rows, self.column_widths, row,
+                                           self.row_number + written, self.on_table, self.metrics)]
+
+    def draw(self):
+        pass
+
+def build_employee_report(filename: str, headers: Sequence[str], rows: Iterator[Sequence],
+                          column_widths: Sequence[float],
+                          on_table: Optional[Callable[[int], None]] = None) -> None:
+    """
+    Write the employee report PDF.
+
+    Args:
+        filename: Path to save the PDF file
+        headers: Header row repeated at the top of every page
+        rows: Iterator of data rows, consumed as pages are laid out
+        column_widths: Width of each column in points (see measure_column_widths)
+        on_table: Called with the number of rows after each page table is laid out;
+            may raise ExportCancelled to stop the build
+    """
+    doc = SimpleDocTemplate(filename, pagesize=landscape(letter))
+    styles = getSampleStyleSheet()
+    elements = [
+        Paragraph(REPORT_TITLE, styles['Title']),
+        Paragraph("<br/><br/>", styles['Normal']),
+    ]
+
+    first_row = next(rows, None)
+    if first_row is None:
+        table = Table([list(headers)], colWidths=column_widths)
+        table.setStyle(STRIPED_STYLES[0])
+        elements.append(table)
+    else:
+        elements.append(EmployeeTableStream(headers, rows, column_widths, first_row, on_table=on_table))
+    doc.build(elements)
+
+def export(service, filename: str, filters: Optional[Dict[str, Any]] = None,
+           order_by: Union[None, str, Sequence[str]] = None,
+           progress: Optional[Callable[[int, int], None]] = None,
+           should_cancel: Optional[Callable[[], bool]] = None,
+           column_widths: Optional[Sequence[float]] = None,
+           chunk_size: int = EXPORT_CHUNK_SIZE) -> Tuple[bool, str, Optional[str]]:
+    """
+    Export employee data to a PDF file (all employees unless filtered).
+
+    Rows are streamed from the database into one table per page, each
+    repeating the header row, so memory use and layout time grow
+    linearly with the number of employees.
+
+    Args:
+        service: EmployeeService to read employees from
+        filename: Path to save the PDF file
+        filters: Optional filter spec selecting which employees to export
+        order_by: Optional sort spec; defaults to ID order
+        progress: Called as progress(rows_written, total_rows) after each page
+        should_cancel: Polled after each page; returning True stops the
+            export and removes the partial file
+        column_widths: Column widths in points; measured from the data
+            (one extra streaming pass) when not given
+        chunk_size: Number of rows fetched from the database at a time
+    """
+    total = 0
+    written = 0
+
+    def on_table(rows: int) -> None:
+        nonlocal written
+        written += rows
+        if progress:
+            progress(written, max(total, written))
+        if should_cancel and should_cancel():
+            raise ExportCancelled()
+
+    try:
+        total = service.db.count_employees(filters) if progress else 0
+        if column_widths is None:
+            column_widths = measure_column_widths(
+                EXPORT_HEADERS, service.iter_employees(chunk_size, filters, order_by))
+
+        rows = service.iter_employees(chunk_size, filters, order_by)
+        try:
+            build_employee_report(filename, EXPORT_HEADERS, rows, column_widths, on_table)
+        finally:
+            rows.close()
+        return True, "Data exported to PDF successfully", filename
+    except ExportCancelled:
+        if os.path.exists(filename):
+            os.remove(filename)
+        return False, "Export cancelled", None
+    except Exception as e:
+        error_msg = f"Error exporting to PDF: {e}"
+        print(error_msg)
+        return False, error_msg, None
@@ -0,0 +1,84 @@
+# Importers package initialization
+#
+# Importers read employee records from files in a streaming way and hand
+# them to EmployeeService in chunks; the service validates and inserts
+# them. Records are identified by their line number so rejected ones can
+# be reported back to the user.
+import gzip
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+from models.employee import EMPLOYEE_COLUMNS
+from services.exporters import EXPORT_HEADERS
+
+# Records validated and inserted per step by the streaming imports
+IMPORT_CHUNK_SIZE = 10_000
+
+# Columns read from each record; ids are assigned by the database
+IMPORT_FIELDS = EMPLOYEE_COLUMNS[1:]
+
+# Header names accepted for each field: the export headers and the column names
+HEADER_ALIASES: Dict[str, str] = {
+    **{header.lower(): column for header, column in zip(EXPORT_HEADERS, EMPLOYEE_COLUMNS)},
+    **{column: column for column in EMPLOYEE_COLUMNS},
+}
+
+# Rejected rows listed in an import's summary; all of them go to the error file
+IMPORT_ERROR_SAMPLE = 100
+
+# A chunk of (line, raw_row) pairs; line locates the row in the file for error reports
+Batch = List[Tuple[Any, List[str]]]
+
+@dataclass
+class ImportSource:
+    """An open import file, read as chunks of raw rows under a header row"""
+    headers: List[str]
+    batches: Iterator[Batch]
+    total: int
+    position: Callable[[], int]
+    close: Callable[[], None]
+    line_header: str = 'Line'
+
+def open_input(filename: str, compress: Optional[bool] = None) -> Tuple[BinaryIO, BinaryIO]:
+    """
+    Open an import file for reading in binary mode.
+
+    Args:
+        filename: Path to the file
+        compress: Read gzip-compressed input; defaults to True for '.gz' filenames
+
+    Returns:
+        Tuple of (stream, raw) where raw is the underlying file, whose
+        position tells how far through the file the stream has read
+    """
+    if compress is None:
+        compress = filename.lower().endswith('.gz')
+    raw = open(filename, 'rb')
+    return (gzip.GzipFile(fileobj=raw) if compress else raw), raw
+
+def map_headers(headers: Sequence) -> List[int]:
+    """
+    Find the position of each IMPORT_FIELDS column in a header row.
+
+    Headers match the export headers ('Name', 'Email', ...) or the column
+    names, ignoring case and surrounding spaces; an 'ID' column and
+    unknown columns are ignored.
+
+    Returns:
+        One position per IMPORT_FIELDS entry
+
+    Raises:
+        ValueError: If a column is missing
+    """
+    positions: Dict[str, int] = {}
+    for position, header in enumerate(headers):
+        column = HEADER_ALIASES.get(str(header or '').strip().lower())
+        if column is not None and column not in positions:
+            positions[column] = position
+    missing = [header for header, column in zip(EXPORT_HEADERS, EMPLOYEE_COLUMNS)
+               if column in IMPORT_FIELDS and column not in positions]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}")
+    return [positions[field] for field in IMPORT_FIELDS]
+
+__all__ = ['IMPORT_CHUNK_SIZE', 'IMPORT_FIELDS', 'IMPORT_ERROR_SAMPLE', 'Batch', 'ImportSource',
+           'open_input', 'map_headers']
@@ -0,0 +1,144 @@
+import csv
+import io
+import os
+from collections import deque
+from functools import partial
+from itertools import islice
+from typing import Deque, Iterable, Iterator, List, Optional, Sequence, Tuple
+from services.importers import IMPORT_CHUNK_SIZE, Batch, ImportSource, open_input
+from services.workers import map_in_order
+from utils.validators import ValidationRules, get_validation_rules, set_validation_rules, validate_rows
+
+# Result of validating a chunk: the positions in the chunk of the valid rows,
+# their Employee.to_tuple() values (without id), and (position, reason) for
+# the rejected rows in chunk order. Rows are referred to by position so the
+# workers do not send raw rows back.
+Validated = Tuple[List[int], List[Tuple[str, ...]], List[Tuple[int, str]]]
+
+def open_csv(filename: str, chunk_size: int = IMPORT_CHUNK_SIZE) -> ImportSource:
+    """
+    Open a CSV file for import, streamed as chunks of raw rows.
+
+    The file is decoded as UTF-8 (a byte order mark, as written by Excel,
+    is skipped) and read by csv.reader, so quoted fields may span lines;
+    '.gz' files are decompressed. Each row is paired with the line it
+    ends on, and progress is measured in bytes of the file.
+
+    Args:
+        filename: Path to the file
+        chunk_size: Rows per chunk
+
+    Raises:
+        ValueError: If the file has no header row
+    """
+    stream, raw = open_input(filename)
+
+    def close():
+        stream.close()
+        raw.close()
+
+    try:
+        reader = csv.reader(io.TextIOWrapper(stream, encoding='utf-8-sig', newline=''))
+        headers = next(reader, None)
+        if headers is None:
+            raise ValueError("The file is empty")
+    except BaseException:
+        close()
+        raise
+
+    def batches():
+        while True:
+            batch = [(reader.line_num, row) for row in islice(reader, chunk_size)]
+            if not batch:
+                break
+            yield batch
+
+    return ImportSource(headers, batches(), os.fstat(raw.fileno()).st_size, raw.tell, close)
+
+def validate_batch(batch: Batch, positions: Sequence[int], rules: Optional[ValidationRules] = None) -> Validated:
+    """
+    Validate one chunk of raw rows with utils.validators.
+
+    Values are taken from the columns at positions (see map_headers) and
+    stripped of surrounding spaces; blank lines are skipped. The chunk is
+    checked in one validate_rows call, and a rejected row's reason lists
+    all of its errors. A module-level function so it can run in a worker
+    process.
+
+    Args:
+        batch: (line, row) pairs
+        positions: Position of each IMPORT_FIELDS column in a row
+        rules: Validation rules; defaults to the active ones
+    """
+    width = max(positions) + 1
+    rejected: List[Tuple[int, str]] = []
+    kept: List[int] = []
+    values: List[Tuple[str, ...]] = []
+    for index, (_, row) in enumerate(batch):
+        if not any(value.strip() for value in row):
+            continue
+        if len(row) < width:
+            rejected.append((index, f"Expected at least {width} columns, found {len(row)}"))
+            continue
+        kept.append(index)
+        values.append(tuple(row[position].strip() for position in positions))
+
+    invalid = validate_rows(values, rules)
+    if invalid:
+        for position, errors in invalid:
+            rejected.append((kept[position], "; ".join(errors)))
+        # Report the chunk's rejected rows in file order
+        rejected.sort()
+        skip = {position for position, _ in invalid}
+        kept = [index for position, index in enumerate(kept) if position not in skip]
+        values = [row for position, row in enumerate(values) if position not in skip]
+    return kept, values, rejected
+
+def validate_batches(batches: Iterable[Batch], positions: Sequence[int],
+                     processes: int = 0) -> Iterator[Tuple[Batch, Validated]]:
+    """
+    Validate chunks in order, optionally across a process pool.
+
+    Each chunk is yielded with its result, so rows can be looked up by
+    position.
+
+    With processes > 0 the chunks go through services.workers.map_in_order,
+    so reading, validating and inserting overlap while memory stays
+    bounded. Each worker installs this process's active validation rules
+    once, as it starts.
+
+    Args:
+        batches: Chunks from an ImportSource
+        positions: Position of each IMPORT_FIELDS column in a row
+        processes: Number of worker processes; 0 validates in this process
+    """
+    # The rules are installed once per worker rather than pickled, and
+    # compiled again, with every chunk
+    validate = partial(validate_batch, positions=positions)
+    # map_in_order reads the chunks and returns their results in the same order
+    sent: Deque[Batch] = deque()
+
+    def send():
+        for batch in batches:
+            sent.append(batch)
+            yield batch
+
+    results = map_in_order(validate, send(), processes, set_validation_rules, (get_validation_rules(),))
+    try:
+        for validated in results:
+            yield sent.popleft(), validated
+    finally:
+        # Shut the pool down now if the consumer stops early
+        results.close()
+
+def error_file_writer(out, headers: Sequence[str], line_header: str = 'Line'):
+    """Start a rejected-rows CSV: the original columns plus where the row was and why it was rejected"""
+    writer = csv.writer(out)
+    writer.writerow(list(headers) + [line_header, 'Error'])
+    return writer
+
+def default_error_file(filename: str) -> str:
+    """Where rejected rows go by default: employees.csv -> employees.errors.csv"""
+    if filename.lower().endswith('.gz'):
+        filename = filename[:-3]
+    return os.path.splitext(filename)[0] + '.errors.csv'
@@ -0,0 +1,98 @@
+from itertools import islice
+from typing import Any, Iterator, List, Tuple
+
+import openpyxl
+from services.exporters import EXPORT_HEADERS
+from services.importers import IMPORT_CHUNK_SIZE, Batch, ImportSource, map_headers
+
+# Every sheet's rows are reordered to IMPORT_FIELDS order under these headers
+IMPORT_HEADERS = EXPORT_HEADERS[1:]
+
+def to_text(value: Any) -> str:
+    """Convert a cell value to the text the validators expect: 30.0 -> '30', None -> ''"""
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def count_rows(sheet) -> int:
+    """
+    Count the rows of a read-only sheet.
+
+    Uses the dimensions recorded in the file when there are any; files
+    written in write-only mode (as export_to_excel does) have none, so
+    their XML is scanned for row elements, which takes a fraction of the
+    time parsing the rows does.
+    """
+    if sheet.max_row is not None:
+        return sheet.max_row
+    rows = 0
+    tail = b""
+    # ReadOnlyWorksheet's own accessor for the sheet's XML in the archive
+    with sheet._get_source() as source:
+        while True:
+            chunk = source.read(1 << 20)
+            if not chunk:
+                break
+            data = tail + chunk
+            rows += data.count(b"<row ") + data.count(b"<row>")
+            tail = data[-4:]
+    return rows
+
+def open_excel(filename: str, chunk_size: int = IMPORT_CHUNK_SIZE) -> ImportSource:
+    """
+    Open an Excel workbook for import, streamed as chunks of raw rows.
+
+    The workbook is opened in openpyxl's read-only mode, which parses the
+    sheets row by row instead of loading them. Every sheet with a header
+    row is read in order; headers are checked for all sheets before any
+    row is returned, and each sheet's columns are reordered to IMPORT_HEADERS
+    so the chunks share one header row. Cell values are converted with
+    to_text, rows are located as 'Sheet!row' and progress is measured in
+    rows.
+
+    Args:
+        filename: Path to the .xlsx file
+        chunk_size: Rows per chunk
+
+    Raises:
+        ValueError: If a sheet is missing a column or no sheet has a header row
+    """
+    workbook = openpyxl.load_workbook(filename, read_only=True, data_only=True)
+    try:
+        sheets: List[Tuple[Any, List[int]]] = []
+        for sheet in workbook.worksheets:
+            header = next(sheet.iter_rows(max_row=1, values_only=True), None)
+            if not header or not any(value is not None for value in header):
+                continue
+            try:
+                sheets.append((sheet, map_headers(header)))
+            except ValueError as e:
+                raise ValueError(f"Sheet '{sheet.title}': {e}") from None
+        if not sheets:
+            raise ValueError("The workbook is empty")
+        total = sum(max(count_rows(sheet) - 1, 0) for sheet, _ in sheets)
+    except BaseException:
+        workbook.close()
+        raise
+
+    read = 0
+
+    def rows() -> Iterator[Tuple[str, List[str]]]:
+        nonlocal read
+        for sheet, positions in sheets:
+            for number, values in enumerate(sheet.iter_rows(min_row=2, values_only=True), 2):
+                read += 1
+                yield (f"{sheet.title}!{number}",
+                       [to_text(values[position]) if position < len(values) else "" for position in positions])
+
+    def batches() -> Iterator[Batch]:
+        source = rows()
+        while True:
+            batch = list(islice(source, chunk_size))
+            if not batch:
+                break
+            yield batch
+
+    return ImportSource(list(IMPORT_HEADERS), batches(), total, lambda: read, workbook.close, line_header='Row')
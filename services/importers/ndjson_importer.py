@@ -0,0 +1,52 @@
+import json
+from typing import Any, BinaryIO, Dict, Iterator, Optional, Tuple
+from services.importers import IMPORT_FIELDS
+from models.employee import NULLABLE_FIELDS
+
+def to_employee_data(record: Any) -> Dict[str, Optional[str]]:
+    """
+    Convert one decoded NDJSON record to add_employee's input.
+
+    A null age or gender stays None, so the employee is stored without
+    it as it was exported; other null values become empty strings.
+
+    Raises:
+        ValueError: If the record is not an object or a value has the wrong type
+    """
+    if not isinstance(record, dict):
+        raise ValueError("Record is not a JSON object")
+    employee_data = {}
+    for field in IMPORT_FIELDS:
+        value = record.get(field)
+        if value is None:
+            value = None if field in NULLABLE_FIELDS else ""
+        elif field == 'age' and isinstance(value, int) and not isinstance(value, bool):
+            value = str(value)
+        elif not isinstance(value, str):
+            raise ValueError(f"Field '{field}' must be a {'number' if field == 'age' else 'string'}")
+        employee_data[field] = value
+    return employee_data
+
+def read_records(stream: BinaryIO) -> Iterator[Tuple[int, Optional[Dict[str, str]], str]]:
+    """
+    Stream records from an NDJSON file, one line at a time.
+
+    Blank lines are skipped. A line that is not valid JSON, or not an
+    employee record, is reported with its error instead of stopping the
+    import.
+
+    Args:
+        stream: Binary stream from services.importers.open_input
+
+    Returns:
+        Iterator of (line_number, employee_data, error); employee_data is
+        None when error is set
+    """
+    decode = json.JSONDecoder().decode
+    for line_number, line in enumerate(stream, 1):
+        if not line.strip():
+            continue
+        try:
+            yield line_number, to_employee_data(decode(line.decode('utf-8'))), ""
+        except (UnicodeDecodeError, ValueError) as e:
+            yield line_number, None, str(e)
@@ -0,0 +1,68 @@
+# Worker processes for the CPU-bound steps
+#
+# Import validation, similarity comparisons and bundle exports hand work to
+# a process pool. The workers are spawned, not forked: the caller may be
+# running Tk and other threads, which a forked child would inherit in
+# whatever state they were in.
+from collections import deque
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence, TypeVar
+
+Task = TypeVar('Task')
+Result = TypeVar('Result')
+
+def process_pool(max_workers: int, initializer: Optional[Callable[..., Any]] = None, initargs: Sequence = ()):
+    """
+    Start a pool of spawned worker processes.
+
+    Args:
+        max_workers: Number of worker processes
+        initializer: Called as initializer(*initargs) once in each worker
+            as it starts, e.g. to install state every task uses
+        initargs: Arguments for initializer, pickled once per worker
+
+    Returns:
+        A concurrent.futures.ProcessPoolExecutor, to be used as a context manager
+    """
+    # Imported here to keep them off the startup path
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"),
+                               initializer=initializer, initargs=tuple(initargs))
+
+def map_in_order(func: Callable[[Task], Result], tasks: Iterable[Task], processes: int = 0,
+                 initializer: Optional[Callable[..., Any]] = None, initargs: Sequence = ()) -> Iterator[Result]:
+    """
+    Apply func to each task and yield the results in task order.
+
+    With processes > 0 the tasks run in a process pool, with up to two
+    tasks per process in flight: producing the tasks, running them and
+    consuming the results overlap while memory stays bounded. func must be
+    picklable (a module-level function or a partial of one); it is sent
+    with every task, so state that is costly to pickle belongs in
+    initializer instead.
+
+    Args:
+        func: Function run on each task
+        tasks: The tasks, read lazily
+        processes: Number of worker processes; 0 runs func in this process
+        initializer: Run once per worker process (see process_pool); not
+            called when processes is 0
+        initargs: Arguments for initializer
+    """
+    if not processes:
+        yield from map(func, tasks)
+        return
+
+    with process_pool(processes, initializer, initargs) as pool:
+        pending = deque()
+        tasks = iter(tasks)
+        while True:
+            while len(pending) < processes * 2:
+                task = next(tasks, None)
+                if task is None:
+                    break
+                pending.append(pool.submit(func, task))
+            if not pending:
+                break
+            yield pending.popleft().result()
@@ -0,0 +1,178 @@
+import unittest
+import os
+import tempfile
+import sqlite3
+import threading
+import time
+from db.database import Database
+from models.employee import Employee
+
+class TestDatabase(unittest.TestCase):
+    """Test cases for the Database class."""
+
+    def setUp(self):
+        """Set up an on-disk database so a second connection can observe commits."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "test.db")
+        self.db = Database(self.db_path)
+
+    def tearDown(self):
+        """Clean up after each test."""
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def _employee(self, name='John Doe', email='john@example.com'):
+        """Build a valid employee for inserts."""
+        return Employee(name=name, age='30', job='Developer', email=email, gender='Male',
+                        phone='123-456-7890', address='123 Main St')
+
+    def _committed_count(self):
+        """Count rows visible to an independent connection."""
+        con = sqlite3.connect(self.db_path)
+        try:
+            return con.execute("SELECT COUNT(*) FROM Employees").fetchone()[0]
+        finally:
+            con.close()
+
+    def test_insert_employees_returns_ids_in_order(self):
+        """Test that bulk insert returns ids matching the input order."""
+        self.db.insert_employee(self._employee())
+        ids = self.db.insert_employees([self._employee('A'), self._employee('B')])
+
+        self.assertEqual(len(ids), 2)
+        self.assertEqual(self.db.fetch_employee_by_id(ids[0])[1], 'A')
+        self.assertEqual(self.db.fetch_employee_by_id(ids[1])[1], 'B')
+
+    def test_insert_employees_maintains_search_and_statistics(self):
+        """Test that the bulk path updates derived tables like the per-row triggers do."""
+        self.db.insert_employee(self._employee('Single Insert'))
+        self.db.insert_employees([self._employee('Bulk One'), self._employee('Bulk Two')])
+
+        self.assertEqual(len(self.db.search_employees('bulk')), 2)
+        self.assertEqual(self.db.verify_statistics(), [])
+        self.assertIn(('job', 'Developer', 3), self.db.fetch_statistics())
+
+        # The trigger guard must never be left set
+        flag = self.db.con.execute("SELECT bulk_load FROM trigger_control").fetchone()[0]
+        self.assertEqual(flag, 0)
+
+    def test_transaction_commits_once(self):
+        """Test that writes in a transaction are only visible after it ends."""
+        with self.db.transaction():
+            employee_id = self.db.insert_employee(self._employee())
+            self.db.update_employee(Employee(employee_id, 'Jane Doe', '31', 'Developer',
+                                             'jane@example.com', 'Female', '123-456-7890', 'x'))
+            self.assertEqual(self._committed_count(), 0)
+
+        self.assertEqual(self._committed_count(), 1)
+        self.assertEqual(self.db.fetch_employee_by_id(employee_id)[1], 'Jane Doe')
+
+    def test_transaction_rolls_back_on_error(self):
+        """Test that an exception inside a transaction undoes every write."""
+        existing_id = self.db.insert_employee(self._employee())
+
+        with self.assertRaises(RuntimeError):
+            with self.db.transaction():
+                self.db.insert_employee(self._employee('Jane Doe'))
+                self.db.remove_employee(existing_id)
+                raise RuntimeError("abort")
+
+        rows = self.db.fetch_all_employees()
+        self.assertEqual([row[0] for row in rows], [existing_id])
+
+    def test_nested_transaction_rolls_back_inner_only(self):
+        """Test that a failing nested block does not abort the outer one."""
+        with self.db.transaction():
+            self.db.insert_employee(self._employee('Outer'))
+            try:
+                with self.db.transaction():
+                    self.db.insert_employee(self._employee('Inner'))
+                    raise ValueError("inner failure")
+            except ValueError:
+                pass
+
+        names = [row[1] for row in self.db.fetch_all_employees()]
+        self.assertEqual(names, ['Outer'])
+
+    def test_commit_batching_by_count(self):
+        """Test that batched autocommit flushes every N writes."""
+        self.db.set_commit_batching(commit_every=3)
+
+        self.db.insert_employee(self._employee('A'))
+        self.db.insert_employee(self._employee('B'))
+        self.assertEqual(self._committed_count(), 0)
+
+        self.db.insert_employee(self._employee('C'))
+        self.assertEqual(self._committed_count(), 3)
+
+        self.db.insert_employee(self._employee('D'))
+        self.db.flush()
+        self.assertEqual(self._committed_count(), 4)
+
+    def test_commit_batching_by_interval(self):
+        """Test that batched autocommit flushes once pending writes are old enough."""
+        self.db.set_commit_batching(commit_interval_ms=0)
+        self.db.insert_employee(self._employee())
+        self.assertEqual(self._committed_count(), 1)
+
+    def test_commit_batching_flushes_quiet_tail(self):
+        """Test that a batch is committed after the interval without another write."""
+        self.db.set_commit_batching(commit_every=100, commit_interval_ms=50)
+        self.db.insert_employee(self._employee('A'))
+        self.assertEqual(self._committed_count(), 0)
+
+        # The writer lock is released too, so another thread can write
+        inserted = threading.Event()
+        def insert():
+            self.db.insert_employee(self._employee('B'))
+            self.db.release_connection()
+            inserted.set()
+
+        time.sleep(0.2)
+        self.assertEqual(self._committed_count(), 1)
+        threading.Thread(target=insert, daemon=True).start()
+        self.assertTrue(inserted.wait(3))
+        self.assertEqual(self._committed_count(), 2)
+
+    def test_wal_mode_enabled(self):
+        """Test that file databases are opened in WAL mode."""
+        mode = self.db.con.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(mode, "wal")
+
+    def test_write_not_blocked_by_open_reader(self):
+        """Test that a long-running read does not block a commit."""
+        self.db.insert_employees([self._employee('A'), self._employee('B')])
+
+        # Keep a read transaction open on another connection, as an export would
+        reader = sqlite3.connect(self.db_path, timeout=0.1)
+        try:
+            cursor = reader.execute("SELECT * FROM Employees")
+            cursor.fetchone()
+
+            self.db.insert_employee(self._employee('C'))
+            self.assertEqual(self._committed_count(), 3)
+
+            # The reader keeps its snapshot
+            self.assertEqual(len(cursor.fetchall()), 1)
+        finally:
+            reader.close()
+
+    def test_threads_use_separate_connections(self):
+        """Test that worker threads get their own connection and can write."""
+        main_connection = self.db.con
+        results = {}
+
+        def worker():
+            results['same_connection'] = self.db.con is main_connection
+            results['id'] = self.db.insert_employee(self._employee('Worker'))
+            self.db.release_connection()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        self.assertFalse(results['same_connection'])
+        self.assertEqual(self.db.fetch_employee_by_id(results['id'])[1], 'Worker')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+from db.database import Database
+from services.duplicates import name_key, soundex
+from services.employee_service import EmployeeService
+from models.employee import Employee
+
+class TestSimilarEmployees(unittest.TestCase):
+    """Test cases for the blocked similar-employee finder."""
+
+    def setUp(self):
+        """Set up a database with two near-duplicate pairs among distinct employees."""
+        self.db = Database(":memory:")
+        self.service = EmployeeService(self.db)
+        people = [
+            ('Jon Smith', '12 Main St, Cairo', '555-111-2222'),
+            ('Omar Hassan', '7 Sea Rd, Alexandria', '555-222-3333'),
+            ('John Smith', '12 Main Street, Cairo', '555-999-8888'),
+            ('Sara Ahmed', '9 Nile Rd, Cairo', '555-333-4444'),
+            ('Mona Kaya', '40 Hill Ave, Ankara', '555-444-5555'),
+            ('Sarah Ahmed', 'Nine Nile Rd, Cairo', '(555) 333-4444'),
+            ('Ali Karim', '12 Main St, Cairo', '555-666-7777'),
+        ]
+        self.db.insert_employees(
+            Employee(None, name, '30', 'Engineer', f"e{i}@example.com", 'Female', phone, address)
+            for i, (name, address, phone) in enumerate(people)
+        )
+
+    def tearDown(self):
+        """Clean up after each test."""
+        self.db.close()
+
+    def test_soundex_and_name_key(self):
+        """Test the phonetic keys used to block names."""
+        self.assertEqual([soundex(word) for word in ('Robert', 'Rupert', 'Ashcraft', 'Tymczak', 'Pfister', 'Lee')],
+                         ['R163', 'R163', 'A261', 'T522', 'P236', 'L000'])
+        self.assertEqual({name_key(name) for name in ('Jon Smith', 'John Smith', 'john a. smyth')}, {'J500 S530'})
+        self.assertEqual(name_key('  '), '')
+
+    def test_finds_pairs_within_blocks(self):
+        """Test that near-duplicates are found through any blocking key, each pair once."""
+        success, message, summary = self.service.find_similar_employees(threshold=0.8)
+
+        self.assertTrue(success, message)
+        self.assertEqual([pair[1:] for pair in summary['pairs']], [(1, 3), (4, 6)])
+        self.assertGreater(summary['pairs'][0][0], 0.9)
+        # Name blocks give (1, 3) and (4, 6); the '12 main ' address block adds
+        # (1, 7) and (3, 7) but not (1, 3) again, and the phone block adds nothing
+        self.assertEqual(summary['compared'], 4)
+        self.assertEqual(summary['skipped_blocks'], 0)
+
+    def test_renamed_employee_is_reblocked(self):
+        """Test that a name change made with plain SQL clears the stored name key."""
+        self.service.find_similar_employees()
+        self.db.con.execute("UPDATE Employees SET name = 'Mona Kay', address = '7 Sea Rd, Alexandria' WHERE id = 5")
+        self.db.con.commit()
+        self.assertIsNone(self.db.con.execute("SELECT name_key FROM Employees WHERE id = 5").fetchone()[0])
+
+        _, _, summary = self.service.find_similar_employees(threshold=0.8)
+        self.assertIn((1, 3), [pair[1:] for pair in summary['pairs']])
+        self.assertEqual(self.db.con.execute("SELECT name_key FROM Employees WHERE id = 5").fetchone()[0], 'M500 K000')
+
+    def test_large_blocks_are_skipped(self):
+        """Test that blocks above max_block_size are counted instead of compared."""
+        _, _, summary = self.service.find_similar_employees(threshold=0.8, max_block_size=2)
+
+        # The '12 main ' address block has three employees
+        self.assertEqual(summary['skipped_blocks'], 1)
+        self.assertEqual([pair[1:] for pair in summary['pairs']], [(1, 3), (4, 6)])
+
+    def test_pair_in_skipped_block_is_compared_by_next_key(self):
+        """Test that sharing a skipped block does not stop a later key from comparing a pair."""
+        self.db.con.execute("DELETE FROM Employees")
+        self.db.con.commit()
+        people = [('John Smith', f"{i} Elm Road, Town {i}", f"555-100-{i:04d}") for i in range(10)]
+        people += [('Jon Smith', '99 Oak Avenue', '555-200-0001'), ('John Smith', '99 Oak Avenue', '555-200-0002')]
+        ids = self.db.insert_employees(
+            Employee(None, name, '30', 'Engineer', f"s{i}@example.com", 'Male', phone, address)
+            for i, (name, address, phone) in enumerate(people)
+        )
+
+        _, _, summary = self.service.find_similar_employees(max_block_size=5)
+
+        self.assertEqual(summary['skipped_blocks'], 1)
+        self.assertEqual([pair[1:] for pair in summary['pairs']], [tuple(ids[-2:])])
+
+    def test_process_pool_gives_the_same_pairs(self):
+        """Test the worker-process path."""
+        _, _, expected = self.service.find_similar_employees(threshold=0.8)
+        success, message, summary = self.service.find_similar_employees(threshold=0.8, processes=2)
+
+        self.assertTrue(success, message)
+        self.assertEqual(summary['pairs'], expected['pairs'])
+
+if __name__ == '__main__':
+    unittest.main()
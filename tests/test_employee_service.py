@@ -1,6 +1,8 @@
 import unittest
 import os
 import sqlite3
+import tempfile
+import threading
 from db.database import Database
 from services.employee_service import EmployeeService
 from models.employee import Employee
@@ -64,6 +66,49 @@ class TestEmployeeService(unittest.TestCase):
         self.assertTrue(success)
         self.assertEqual(len(employees), 0)
     
+    def test_add_employees_bulk(self):
+        """Test adding a batch of employees with one invalid row."""
+        second_employee = self.test_employee_data.copy()
+        second_employee['name'] = 'Jane Doe'
+        second_employee['email'] = 'jane@example.com'
+        second_employee['phone'] = '123-456-7891'
+        invalid_employee = self.test_employee_data.copy()
+        invalid_employee['email'] = 'not-an-email'
+
+        success, message, results = self.service.add_employees(
+            [self.test_employee_data, invalid_employee, second_employee]
+        )
+
+        # Check result
+        self.assertTrue(success)
+        self.assertEqual(message, "Added 2 of 3 employees")
+        self.assertEqual(len(results), 3)
+        self.assertTrue(results[0][0])
+        self.assertEqual(results[1], (False, "Invalid email format", None))
+        self.assertTrue(results[2][0])
+
+        # Returned ids must point at the right rows
+        success, _, employee = self.service.get_employee_by_id(results[2][2])
+        self.assertTrue(success)
+        self.assertEqual(employee.name, 'Jane Doe')
+
+    def test_add_employees_non_string_values(self):
+        """Test that a non-string value is validated as text and only fails its own row."""
+        second_employee = dict(self.test_employee_data, email='jane@example.com', phone='123-456-7891', age=30.5)
+
+        success, message, results = self.service.add_employees([dict(self.test_employee_data, age=30), second_employee])
+
+        self.assertTrue(success, message)
+        self.assertTrue(results[0][0])
+        self.assertEqual(results[1], (False, "Age must be a number", None))
+        self.assertEqual(self.service.get_all_employees()[2][0][2], 30)
+
+    def test_add_employees_empty(self):
+        """Test adding an empty batch."""
+        success, message, results = self.service.add_employees([])
+        self.assertTrue(success)
+        self.assertEqual(results, [])
+
     def test_update_employee(self):
         """Test updating an employee."""
         # Add employee
@@ -87,8 +132,72 @@ class TestEmployeeService(unittest.TestCase):
         self.assertTrue(success)
         self.assertEqual(len(employees), 1)
         self.assertEqual(employees[0][1], 'Jane Doe')
-        self.assertEqual(employees[0][2], '35')
+        self.assertEqual(employees[0][2], 35)
     
+    def test_duplicate_email_or_phone_is_refused(self):
+        """Test that adds and updates matching another employee's email or phone are refused."""
+        _, _, first_id = self.service.add_employee(self.test_employee_data)
+
+        same_email = self.test_employee_data.copy()
+        same_email.update(email='John@Example.com', phone='555-000-1111')
+        self.assertEqual(self.service.add_employee(same_email),
+                         (False, f"Duplicate of employee #{first_id} (same email)", None))
+
+        same_phone = self.test_employee_data.copy()
+        same_phone.update(email='other@example.com', phone='(123) 456 7890')
+        self.assertEqual(self.service.add_employee(same_phone),
+                         (False, f"Duplicate of employee #{first_id} (same phone)", None))
+
+        # Updating an employee's own email and phone is not a duplicate, taking another's is
+        other = self.test_employee_data.copy()
+        other.update(email='other@example.com', phone='555-000-1111')
+        _, _, other_id = self.service.add_employee(other)
+        self.assertTrue(self.service.update_employee(other_id, dict(other, name='Other'))[0])
+        self.assertEqual(self.service.update_employee(other_id, dict(other, phone='1234567890')),
+                         (False, f"Duplicate of employee #{first_id} (same phone)", None))
+
+    def test_bulk_adds_refuse_duplicates(self):
+        """Test that add_employees and imports refuse stored and in-batch duplicates like add_employee."""
+        _, _, first_id = self.service.add_employee(self.test_employee_data)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'employees.csv')
+            self.service.export_to_csv(filename)
+            success, message, summary = self.service.import_csv(filename)
+        self.assertTrue(success, message)
+        self.assertEqual((summary['imported'], summary['errors']),
+                         (0, [(2, f"Duplicate of employee #{first_id} (same email)")]))
+
+        new = dict(self.test_employee_data, email='new@example.com', phone='555-000-2222')
+        success, message, results = self.service.add_employees([
+            dict(self.test_employee_data, email='A@X.com', phone='555-000-1111'),
+            dict(new, email='a@x.COM'),
+            new,
+            dict(self.test_employee_data, email='other@example.com', phone='(555) 000 2222'),
+        ])
+        self.assertEqual(message, "Added 2 of 4 employees")
+        second_id = results[0][2]
+        self.assertEqual(results[1], (False, f"Duplicate of employee #{second_id} (same email)", None))
+        self.assertTrue(results[2][0])
+        self.assertEqual(results[3], (False, f"Duplicate of employee #{results[2][2]} (same phone)", None))
+        self.assertEqual(self.service.get_duplicate_report()[2], {'email': [], 'phone': []})
+
+    def test_duplicate_report(self):
+        """Test that employees stored twice before the check existed are reported in groups."""
+        rows = [('john@example.com', '123-456-7890'), (' JOHN@example.com', '555-000-1111'),
+                ('jane@example.com', '(555) 000-1111'), ('cid@example.com', '555 000 1111'),
+                ('dee@example.com', '999-999-9999')]
+        self.db.insert_employees(Employee(None, 'Person', '30', 'Developer', email, 'Male', phone, 'Street')
+                                 for email, phone in rows)
+
+        success, message, report = self.service.get_duplicate_report()
+        self.assertTrue(success)
+        self.assertEqual(message, "Found 2 group(s) of employees with the same email or phone number")
+        self.assertEqual(report, {'email': [('john@example.com', [1, 2])], 'phone': [('5550001111', [2, 3, 4])]})
+
+        # A legacy duplicate can still be edited
+        data = dict(self.test_employee_data, email='JOHN@example.com', phone='555-000-1111')
+        self.assertTrue(self.service.update_employee(2, dict(data, name='Renamed'))[0])
+
     def test_delete_employee(self):
         """Test deleting an employee."""
         # Add employee
@@ -108,6 +217,18 @@ class TestEmployeeService(unittest.TestCase):
         self.assertTrue(success)
         self.assertEqual(len(employees), 0)
     
+    def test_transaction_rolls_back_all_calls(self):
+        """Test that a service transaction is atomic."""
+        with self.assertRaises(RuntimeError):
+            with self.service.transaction():
+                success, _, _ = self.service.add_employee(self.test_employee_data)
+                self.assertTrue(success)
+                raise RuntimeError("abort")
+
+        success, _, employees = self.service.get_all_employees()
+        self.assertTrue(success)
+        self.assertEqual(len(employees), 0)
+
     def test_get_employee_by_id(self):
         """Test getting an employee by ID."""
         # Add employee
@@ -140,6 +261,317 @@ class TestEmployeeService(unittest.TestCase):
         self.assertEqual(message, "Employee with ID 999 not found")
         self.assertIsNone(employee)
     
+    def test_get_employees_by_email(self):
+        """Test looking up employees by email."""
+        success, _, employee_id = self.service.add_employee(self.test_employee_data)
+        self.assertTrue(success)
+
+        success, _, employees = self.service.get_employees_by_email('john@example.com')
+        self.assertTrue(success)
+        self.assertEqual([e.id for e in employees], [employee_id])
+
+        success, _, employees = self.service.get_employees_by_email('nobody@example.com')
+        self.assertTrue(success)
+        self.assertEqual(employees, [])
+
+    def test_get_employees_by_name(self):
+        """Test looking up employees by name."""
+        self.service.add_employee(self.test_employee_data)
+        second_employee = self.test_employee_data.copy()
+        second_employee.update(email='john.doe@example.com', phone='123-456-7891')
+        self.service.add_employee(second_employee)
+
+        success, _, employees = self.service.get_employees_by_name('John Doe')
+        self.assertTrue(success)
+        self.assertEqual(len(employees), 2)
+        self.assertEqual(employees[1].email, 'john.doe@example.com')
+
+    def test_get_employees_page(self):
+        """Test keyset pagination over employees."""
+        employees_data = []
+        for i in range(5):
+            data = self.test_employee_data.copy()
+            data.update(name=f'Employee {i}', email=f'employee{i}@example.com', phone=f'555-000-000{i}')
+            employees_data.append(data)
+        _, _, results = self.service.add_employees(employees_data)
+        ids = [result[2] for result in results]
+
+        success, _, page = self.service.get_employees_page(limit=2)
+        self.assertTrue(success)
+        self.assertEqual([row[0] for row in page], ids[:2])
+
+        success, _, page = self.service.get_employees_page(after_id=page[-1][0], limit=2)
+        self.assertEqual([row[0] for row in page], ids[2:4])
+
+        success, _, page = self.service.get_employees_page(after_id=ids[-1], limit=2)
+        self.assertEqual(page, [])
+
+    def test_get_employees_at(self):
+        """Test fetching the virtual list's window by position, with and without ID gaps."""
+        employees_data = []
+        for i in range(8):
+            data = self.test_employee_data.copy()
+            data.update(name=f'Employee {i}', email=f'employee{i}@example.com', phone=f'555-000-000{i}')
+            employees_data.append(data)
+        _, _, results = self.service.add_employees(employees_data)
+        ids = [result[2] for result in results]
+
+        for gaps in (False, True):
+            with self.subTest(gaps=gaps):
+                if gaps:
+                    for employee_id in (ids.pop(1), ids.pop(3)):
+                        self.service.delete_employee(employee_id)
+                success, _, rows = self.service.get_employees_at(2, 3)
+                self.assertTrue(success)
+                self.assertEqual([row[0] for row in rows], ids[2:5])
+                self.assertEqual(self.service.get_employees_at(len(ids), 3)[2], [])
+
+                # Relative to a top row: forward, back, and back past the first employee
+                self.assertEqual([row[0] for row in self.service.get_employees_at(2, 2, ids[1])[2]], ids[3:5])
+                self.assertEqual([row[0] for row in self.service.get_employees_at(-2, 2, ids[3])[2]], ids[1:3])
+                self.assertEqual([row[0] for row in self.service.get_employees_at(-5, 2, ids[1])[2]], ids[0:2])
+
+    def test_iter_employees(self):
+        """Test streaming all employees in small chunks."""
+        employees_data = []
+        for i in range(7):
+            data = self.test_employee_data.copy()
+            data.update(name=f'Employee {i}', email=f'employee{i}@example.com', phone=f'555-000-000{i}')
+            employees_data.append(data)
+        self.service.add_employees(employees_data)
+
+        rows = list(self.service.iter_employees(chunk_size=3))
+        self.assertEqual([row[1] for row in rows], [f'Employee {i}' for i in range(7)])
+        self.assertEqual(rows, self.service.get_all_employees()[2])
+
+    def test_query_filters_and_sorts_in_sql(self):
+        """Test server-side filtering, sorting and limiting."""
+        people = [('Ann', '25', 'Engineer'), ('Bob', '35', 'Engineer'),
+                  ('Cid', '45', 'Designer'), ('Dan', '30', 'Engineer')]
+        employees_data = []
+        for i, (name, age, job) in enumerate(people):
+            data = self.test_employee_data.copy()
+            data.update(name=name, age=age, job=job, email=f"{name.lower()}@example.com", phone=f"123-456-789{i}")
+            employees_data.append(data)
+        self.service.add_employees(employees_data)
+
+        success, _, employees = self.service.query(
+            filters={'job': 'Engineer', 'age': {'gte': 28}}, order_by='-age'
+        )
+        self.assertTrue(success)
+        self.assertEqual([row[1] for row in employees], ['Bob', 'Dan'])
+
+        success, _, employees = self.service.query(order_by='name', limit=2, offset=1)
+        self.assertEqual([row[1] for row in employees], ['Bob', 'Cid'])
+
+        success, _, count = self.service.count_employees({'job': ['Designer', 'Pilot']})
+        self.assertTrue(success)
+        self.assertEqual(count, 1)
+
+        success, message, employees = self.service.query(filters={'salary': 1})
+        self.assertFalse(success)
+        self.assertEqual(message, "Invalid query: Unknown filter column 'salary'")
+
+    def test_search_employees(self):
+        """Test full-text search with prefix matching across columns."""
+        self.service.add_employee(self.test_employee_data)
+        second_employee = self.test_employee_data.copy()
+        second_employee.update(name='Jane Roe', job='Designer', email='jane@example.com', phone='123-456-7891')
+        self.service.add_employee(second_employee)
+
+        success, _, employees = self.service.search_employees('jo')
+        self.assertTrue(success)
+        self.assertEqual([row[1] for row in employees], ['John Doe'])
+
+        success, _, employees = self.service.search_employees('desig')
+        self.assertEqual([row[1] for row in employees], ['Jane Roe'])
+
+        success, _, employees = self.service.search_employees('example.com')
+        self.assertEqual(len(employees), 2)
+
+        # Punctuation in the query must not break the FTS5 parser
+        success, _, employees = self.service.search_employees('"john (')
+        self.assertTrue(success)
+        self.assertEqual([row[1] for row in employees], ['John Doe'])
+
+        # Unicode digits are not IDs
+        success, _, employees = self.service.search_employees('\u00b2')
+        self.assertTrue(success)
+        self.assertEqual(employees, [])
+
+    def test_search_index_follows_updates_and_deletes(self):
+        """Test that the search index stays in sync with the Employees table."""
+        _, _, employee_id = self.service.add_employee(self.test_employee_data)
+
+        updated_data = self.test_employee_data.copy()
+        updated_data['name'] = 'Johanna Smith'
+        self.service.update_employee(employee_id, updated_data)
+        _, _, employees = self.service.search_employees('doe')
+        self.assertEqual(employees, [])
+        _, _, employees = self.service.search_employees('johanna')
+        self.assertEqual([row[0] for row in employees], [employee_id])
+
+        # Numeric queries also match the employee ID
+        _, _, employees = self.service.search_employees(str(employee_id))
+        self.assertEqual([row[0] for row in employees], [employee_id])
+
+        self.service.delete_employee(employee_id)
+        _, _, employees = self.service.search_employees('johanna')
+        self.assertEqual(employees, [])
+
+    def test_statistics_follow_writes(self):
+        """Test that trigger-maintained statistics track inserts, updates and deletes."""
+        people = [('Ann', '25', 'Engineer', 'Female'), ('Bob', '35', 'Engineer', 'Male'),
+                  ('Cid', '38', 'Designer', 'Male')]
+        employees_data = []
+        for i, (name, age, job, gender) in enumerate(people):
+            data = self.test_employee_data.copy()
+            data.update(name=name, age=age, job=job, gender=gender,
+                        email=f"{name.lower()}@example.com", phone=f"123-456-789{i}")
+            employees_data.append(data)
+        _, _, results = self.service.add_employees(employees_data)
+
+        # Move Bob to Design and remove Ann
+        updated_data = employees_data[1].copy()
+        updated_data['job'] = 'Designer'
+        self.service.update_employee(results[1][2], updated_data)
+        self.service.delete_employee(results[0][2])
+
+        success, _, statistics = self.service.get_statistics()
+        self.assertTrue(success)
+        self.assertEqual(statistics, {
+            'total': 2,
+            'by_job': {'Designer': 2},
+            'by_gender': {'Male': 2},
+            'by_age_band': {'30-39': 2},
+        })
+
+        consistent, _, mismatches = self.service.check_statistics()
+        self.assertTrue(consistent)
+        self.assertEqual(mismatches, [])
+
+    def test_rebuild_statistics(self):
+        """Test that out-of-date statistics are detected and rebuilt."""
+        self.service.add_employee(self.test_employee_data)
+        with self.db.transaction() as con:
+            con.execute("UPDATE employee_stats SET headcount = 5 WHERE dimension = 'job'")
+
+        consistent, message, mismatches = self.service.check_statistics()
+        self.assertFalse(consistent)
+        self.assertEqual(mismatches, [('job', 'Developer', 5, 1)])
+
+        success, _, _ = self.service.rebuild_statistics()
+        self.assertTrue(success)
+        consistent, _, _ = self.service.check_statistics()
+        self.assertTrue(consistent)
+
+    def test_employee_cache_hits_and_invalidation(self):
+        """Test that lookups are cached and the service's writes evict stale entries."""
+        _, _, employee_id = self.service.add_employee(self.test_employee_data)
+
+        self.service.get_employee_by_id(employee_id)
+        _, _, employee = self.service.get_employee_by_id(employee_id)
+        employee.name = 'Changed by caller'
+        _, _, stats = self.service.get_cache_stats()
+        self.assertEqual(stats['employees']['hits'], 1)
+        self.assertEqual(stats['employees']['misses'], 1)
+
+        # Modifying a returned object must not leak into the cache
+        _, _, employee = self.service.get_employee_by_id(employee_id)
+        self.assertEqual(employee.name, 'John Doe')
+
+        updated_data = self.test_employee_data.copy()
+        updated_data['name'] = 'John Updated'
+        self.service.update_employee(employee_id, updated_data)
+        _, _, employee = self.service.get_employee_by_id(employee_id)
+        self.assertEqual(employee.name, 'John Updated')
+
+        self.service.delete_employee(employee_id)
+        success, _, _ = self.service.get_employee_by_id(employee_id)
+        self.assertFalse(success)
+
+    def test_all_employees_snapshot(self):
+        """Test that the full employee list is reused until the data changes."""
+        self.service.add_employee(self.test_employee_data)
+        self.service.get_all_employees()
+        self.service.get_all_employees()
+
+        second_employee = self.test_employee_data.copy()
+        second_employee.update(email='jane@example.com', phone='123-456-7891')
+        self.service.add_employee(second_employee)
+        _, _, employees = self.service.get_all_employees()
+
+        self.assertEqual(len(employees), 2)
+        _, _, stats = self.service.get_cache_stats()
+        self.assertEqual(stats['all_employees'], {'hits': 1, 'misses': 2})
+
+    def test_own_writes_keep_other_cached_employees(self):
+        """Test that adding or updating an employee evicts only that employee."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db = Database(os.path.join(tmpdir, 'cache.db'))
+            service = EmployeeService(db)
+            try:
+                _, _, employee_id = service.add_employee(self.test_employee_data)
+                service.get_employee_by_id(employee_id)
+
+                second_employee = self.test_employee_data.copy()
+                second_employee.update(email='jane@example.com', phone='123-456-7891')
+                _, _, second_id = service.add_employee(second_employee)
+                second_employee['name'] = 'Jane Doe'
+                service.update_employee(second_id, second_employee)
+                service.get_employee_by_id(employee_id)
+
+                _, _, stats = service.get_cache_stats()
+                self.assertEqual(stats['employees']['hits'], 1)
+                self.assertEqual(stats['employees']['misses'], 1)
+            finally:
+                db.close()
+
+    def test_cache_skips_rows_fetched_before_a_concurrent_update(self):
+        """Test that a row read before another thread's update is not cached over it."""
+        _, _, employee_id = self.service.add_employee(self.test_employee_data)
+        fetch = self.db.fetch_employee_by_id
+
+        def fetch_then_update(row_id):
+            # The update commits between this read and the cache put
+            row = fetch(row_id)
+            writer = threading.Thread(target=self.service.update_employee,
+                                      args=(employee_id, dict(self.test_employee_data, name='Updated')))
+            writer.start()
+            writer.join()
+            return row
+
+        self.db.fetch_employee_by_id = fetch_then_update
+        _, _, employee = self.service.get_employee_by_id(employee_id)
+        self.assertEqual(employee.name, 'John Doe')
+        self.db.fetch_employee_by_id = fetch
+
+        _, _, employee = self.service.get_employee_by_id(employee_id)
+        self.assertEqual(employee.name, 'Updated')
+
+    def test_cache_sees_writes_from_other_connections(self):
+        """Test that a commit made outside the service clears the caches."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'cache.db')
+            db = Database(path)
+            service = EmployeeService(db)
+            try:
+                _, _, employee_id = service.add_employee(self.test_employee_data)
+                service.get_employee_by_id(employee_id)
+                service.get_all_employees()
+
+                other = sqlite3.connect(path)
+                with other:
+                    other.execute("UPDATE Employees SET name = 'Renamed' WHERE id = ?", (employee_id,))
+                other.close()
+
+                _, _, employee = service.get_employee_by_id(employee_id)
+                _, _, employees = service.get_all_employees()
+                self.assertEqual(employee.name, 'Renamed')
+                self.assertEqual(employees[0][1], 'Renamed')
+            finally:
+                db.close()
+
     def test_get_all_employees(self):
         """Test getting all employees."""
         # Initially, there should be no employees
@@ -153,6 +585,7 @@ class TestEmployeeService(unittest.TestCase):
         second_employee = self.test_employee_data.copy()
         second_employee['name'] = 'Jane Doe'
         second_employee['email'] = 'jane@example.com'
+        second_employee['phone'] = '123-456-7891'
         self.service.add_employee(second_employee)
         
         # Get all employees
@@ -0,0 +1,366 @@
+import csv
+import gzip
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+import openpyxl
+from db.database import Database
+from services.employee_service import EmployeeService
+from services import exporters
+from services.exporters import EXPORT_HEADERS, register_exporter
+from services.exporters.changes_exporter import write_changes
+from services.export_queue import ExportJob, ExportQueue
+from models.employee import Employee
+
+class TestExport(unittest.TestCase):
+    """Test cases for the EmployeeService export methods."""
+
+    def setUp(self):
+        """Set up a database with a few hundred employees."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = Database(":memory:")
+        self.service = EmployeeService(self.db)
+        self.db.insert_employees(
+            Employee(None, f"Employee {i}", str(20 + i % 40), 'Engineer', f"e{i}@example.com",
+                     'Male' if i % 2 else 'Female', f"123-456-{i:04d}", f"{i} Main St")
+            for i in range(250)
+        )
+
+    def tearDown(self):
+        """Clean up after each test."""
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def path(self, name):
+        """Path of a file in the temporary directory."""
+        return os.path.join(self.tmpdir.name, name)
+
+    def test_export_to_csv(self):
+        """Test that every employee is written after the header row."""
+        filename = self.path('employees.csv')
+        progress = []
+        success, _, _ = self.service.export_to_csv(filename, chunk_size=100,
+                                                   progress=lambda done, total: progress.append((done, total)))
+
+        self.assertTrue(success)
+        with open(filename, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(rows[0], EXPORT_HEADERS)
+        self.assertEqual(len(rows), 251)
+        self.assertEqual(rows[1][1], 'Employee 0')
+        self.assertEqual(progress, [(100, 250), (200, 250), (250, 250)])
+
+    def test_export_to_csv_gzip(self):
+        """Test that '.gz' filenames produce gzip-compressed CSV."""
+        filename = self.path('employees.csv.gz')
+        success, _, _ = self.service.export_to_csv(filename, filters={'gender': 'Male'})
+
+        self.assertTrue(success)
+        with gzip.open(filename, 'rt', newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual(len(rows), 126)
+
+    def test_export_to_csv_cancel(self):
+        """Test that a cancelled export reports failure and leaves no file behind."""
+        filename = self.path('employees.csv')
+        success, message, result = self.service.export_to_csv(filename, chunk_size=100,
+                                                              should_cancel=lambda: True)
+
+        self.assertFalse(success)
+        self.assertEqual(message, "Export cancelled")
+        self.assertIsNone(result)
+        self.assertFalse(os.path.exists(filename))
+
+    def test_export_to_excel(self):
+        """Test the write-only Excel export, including column widths."""
+        filename = self.path('employees.xlsx')
+        success, _, _ = self.service.export_to_excel(filename, filters={'age': {'lt': 30}})
+
+        self.assertTrue(success)
+        workbook = openpyxl.load_workbook(filename)
+        self.assertEqual(workbook.sheetnames, ['Employees'])
+        sheet = workbook['Employees']
+        rows = list(sheet.values)
+        self.assertEqual(list(rows[0]), EXPORT_HEADERS)
+        self.assertEqual(len(rows), 71)
+        self.assertEqual(rows[1][:3], (1, 'Employee 0', 20))
+        # Longest email is 'e249@example.com' (16 characters)
+        self.assertAlmostEqual(sheet.column_dimensions['E'].width, (16 + 2) * 1.2)
+
+    def test_export_to_excel_rolls_over_sheets(self):
+        """Test that rows continue on a new sheet when one is full."""
+        filename = self.path('employees.xlsx')
+        success, _, _ = self.service.export_to_excel(filename, max_rows_per_sheet=100)
+
+        self.assertTrue(success)
+        workbook = openpyxl.load_workbook(filename, read_only=True)
+        self.assertEqual(workbook.sheetnames, ['Employees', 'Employees (2)', 'Employees (3)'])
+        counts = [len(list(sheet.values)) for sheet in workbook.worksheets]
+        self.assertEqual(counts, [100, 100, 53])
+        last = list(workbook['Employees (3)'].values)
+        self.assertEqual(last[0], tuple(EXPORT_HEADERS))
+        self.assertEqual(last[-1][1], 'Employee 249')
+        workbook.close()
+
+    def test_export_to_pdf(self):
+        """Test the paged PDF export and its progress reporting."""
+        filename = self.path('employees.pdf')
+        progress = []
+        success, _, _ = self.service.export_to_pdf(filename,
+                                                   progress=lambda done, total: progress.append((done, total)))
+
+        self.assertTrue(success)
+        with open(filename, 'rb') as f:
+            self.assertTrue(f.read(5).startswith(b'%PDF'))
+        # 20 rows fit under the title on page 1, 23 on every following page
+        self.assertEqual(progress[:2], [(20, 250), (43, 250)])
+        self.assertEqual(progress[-1], (250, 250))
+        self.assertEqual(len(progress), 11)
+
+    def test_export_to_pdf_cancel_and_empty(self):
+        """Test cancelling a PDF export and exporting an empty selection."""
+        filename = self.path('employees.pdf')
+        success, message, _ = self.service.export_to_pdf(filename, should_cancel=lambda: True)
+        self.assertFalse(success)
+        self.assertEqual(message, "Export cancelled")
+        self.assertFalse(os.path.exists(filename))
+
+        success, _, _ = self.service.export_to_pdf(filename, filters={'job': 'Pilot'})
+        self.assertTrue(success)
+        self.assertTrue(os.path.exists(filename))
+
+        # A bad filter is reported like the other formats do, not raised
+        success, message, _ = self.service.export_to_pdf(filename, filters={'salary': 1},
+                                                         progress=lambda done, total: None)
+        self.assertFalse(success)
+        self.assertTrue(message.startswith("Error exporting to PDF"))
+
+    def test_export_queue_runs_jobs_in_order(self):
+        """Test that queued exports run on the worker one after another."""
+        export_queue = ExportQueue()
+        csv_job = export_queue.submit("CSV", self.service.export_to_csv, self.path('a.csv'))
+        pdf_job = export_queue.submit("PDF", self.service.export_to_pdf, self.path('a.pdf'))
+        skipped = export_queue.submit("CSV", self.service.export_to_csv, self.path('b.csv'))
+        skipped.cancel()
+        skipped_import = export_queue.submit("CSV", self.service.import_csv, self.path('a.csv'), action="Import")
+        skipped_import.cancel()
+
+        self.assertTrue(export_queue.wait(timeout=30))
+        self.assertEqual(export_queue.finished(), [csv_job, pdf_job, skipped, skipped_import])
+        self.assertEqual(csv_job.status, ExportJob.DONE)
+        self.assertEqual((pdf_job.rows_done, pdf_job.rows_total), (250, 250))
+        self.assertEqual((skipped.status, skipped.message), (ExportJob.CANCELLED, "Export cancelled"))
+        self.assertEqual((skipped_import.status, skipped_import.message), (ExportJob.CANCELLED, "Import cancelled"))
+        self.assertFalse(os.path.exists(self.path('b.csv')))
+        self.assertFalse(export_queue.busy())
+
+    def test_export_queue_reports_failures(self):
+        """Test that a failing export is reported, not raised on the worker."""
+        export_queue = ExportQueue()
+        job = export_queue.submit("CSV", self.service.export_to_csv,
+                                  self.path(os.path.join('missing', 'a.csv')))
+
+        self.assertTrue(export_queue.wait(timeout=30))
+        self.assertEqual(job.status, ExportJob.FAILED)
+        self.assertTrue(job.message.startswith("Error exporting to CSV"))
+
+    def test_export_bundle(self):
+        """Test exporting several formats from one snapshot in worker processes."""
+        directory = self.path('bundle')
+        success, message, results = self.service.export_bundle(['csv', 'xlsx', 'pdf'], directory,
+                                                               filters={'gender': 'Female'})
+
+        self.assertTrue(success, message)
+        for export_format, extension in (('csv', '.csv'), ('xlsx', '.xlsx'), ('pdf', '.pdf')):
+            with self.subTest(export_format=export_format):
+                self.assertTrue(results[export_format]['success'])
+                self.assertEqual(results[export_format]['filename'],
+                                 os.path.join(directory, 'employees' + extension))
+                self.assertGreater(results[export_format]['seconds'], 0)
+        self.assertIn('snapshot', results)
+        with open(results['csv']['filename'], newline='', encoding='utf-8') as f:
+            self.assertEqual(len(list(csv.reader(f))), 126)
+
+        success, message, _ = self.service.export_bundle(['csv', 'docx'], directory)
+        self.assertFalse(success)
+        self.assertIn('docx', message)
+
+    def test_export_bundle_cancel(self):
+        """Test that a cancelled bundle stops and leaves no files behind."""
+        directory = self.path('bundle')
+        success, message, _ = self.service.export_bundle(['csv', 'pdf'], directory, should_cancel=lambda: True)
+        self.assertFalse(success)
+        self.assertEqual(message, "Export cancelled")
+
+        # Cancelled once the first format has been started
+        checks = []
+        def cancel_after_first_format():
+            checks.append(None)
+            return len(checks) > 2
+        success, message, _ = self.service.export_bundle(['csv', 'pdf'], directory,
+                                                         should_cancel=cancel_after_first_format)
+        self.assertFalse(success)
+        self.assertEqual(message, "Export cancelled")
+        self.assertEqual(os.listdir(directory), [])
+
+    def test_register_exporter(self):
+        """Test that new formats can register themselves and are used by export()."""
+        def export_names(service, filename, filters=None, order_by=None, **options):
+            with open(filename, 'w', encoding='utf-8') as f:
+                for row in service.iter_employees(filters=filters, order_by=order_by):
+                    f.write(row[1] + "\n")
+            return True, "Names exported", filename
+
+        register_exporter('names', '.txt', 'Names', export=export_names)
+        self.addCleanup(exporters._REGISTRY.pop, 'names', None)
+
+        filename = self.path('names.txt')
+        success, _, _ = self.service.export('names', filename, filters={'age': 20})
+        self.assertTrue(success)
+        with open(filename, encoding='utf-8') as f:
+            self.assertEqual(len(f.read().splitlines()), 7)
+
+        success, message, _ = self.service.export('docx', filename)
+        self.assertFalse(success)
+        self.assertIn("Unknown export format 'docx'", message)
+
+    def test_export_backends_are_imported_lazily(self):
+        """Test with -X importtime that importing the service skips openpyxl and reportlab."""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import services.employee_service'],
+                                cwd=root, capture_output=True, text=True, check=True)
+        imported = {line.rsplit('|', 1)[-1].strip() for line in result.stderr.splitlines()
+                    if line.startswith('import time:')}
+
+        self.assertIn('services.exporters', imported)
+        self.assertFalse({name for name in imported if name.split('.')[0] in ('openpyxl', 'reportlab')})
+
+    def test_ndjson_round_trip(self):
+        """Test that NDJSON keeps types and imports back, skipping bad records."""
+        filename = self.path('employees.ndjson.gz')
+        success, _, _ = self.service.export('ndjson', filename, filters={'age': {'lt': 22}})
+        self.assertTrue(success)
+        with gzip.open(filename, 'rt', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(len(records), 14)
+        self.assertEqual(records[0], {'id': 1, 'name': 'Employee 0', 'age': 20, 'job': 'Engineer',
+                                      'email': 'e0@example.com', 'gender': 'Female',
+                                      'phone': '123-456-0000', 'address': '0 Main St'})
+
+        with gzip.open(filename, 'at', encoding='utf-8') as f:
+            f.write('{"name": "Broken"\n\n')
+            f.write(json.dumps(dict(records[0], age='old')) + '\n')
+
+        target = EmployeeService(Database(":memory:"))
+        progress = []
+        success, message, summary = target.import_ndjson(filename, chunk_size=5,
+                                                         progress=lambda done, total: progress.append(done))
+        self.assertTrue(success, message)
+        self.assertEqual(summary['imported'], 14)
+        self.assertEqual([line for line, _ in summary['errors']], [15, 17])
+        self.assertEqual([row[1:] for row in target.db.fetch_all_employees()],
+                         [row[1:] for row in self.db.query_employees({'age': {'lt': 22}})])
+        self.assertEqual(len(progress), 4)
+
+        # Importing it again only finds duplicates
+        success, message, summary = target.import_ndjson(filename)
+        self.assertEqual(message, "Imported 0 employee(s); 16 record(s) rejected")
+        self.assertTrue(summary['errors'][0][1].startswith("Duplicate of employee #1"))
+        target.db.close()
+
+        # A cancelled import keeps the chunks committed before it stopped
+        target = EmployeeService(Database(":memory:"))
+        success, message, summary = target.import_ndjson(filename, chunk_size=5, should_cancel=lambda: True)
+        self.assertEqual((success, message), (False, "Import cancelled. Imported 5 employee(s)"))
+        self.assertEqual(target.db.count_employees(), 5)
+        target.db.close()
+
+        # An age or gender the schema migration stored as NULL reads back as NULL
+        self.db.con.execute("UPDATE Employees SET age = NULL, gender = NULL WHERE id = 1")
+        self.db.con.commit()
+        filename = self.path('nulls.ndjson')
+        self.service.export('ndjson', filename, filters={'id': 1})
+        target = EmployeeService(Database(":memory:"))
+        success, message, summary = target.import_ndjson(filename)
+        self.assertEqual(summary['imported'], 1, message)
+        self.assertEqual(target.db.fetch_all_employees()[0][1:], self.db.fetch_employee_by_id(1)[1:])
+        target.db.close()
+
+    def test_export_snapshot(self):
+        """Test the stepped database snapshot, its progress and cancelling it."""
+        db = Database(self.path('source.db'))
+        service = EmployeeService(db)
+        service.add_employees([{'name': f"Employee {i}", 'age': '30', 'job': 'x' * 500,
+                                'email': f"e{i}@example.com", 'gender': 'Male',
+                                'phone': f"123-456-{i:04d}", 'address': 'a'} for i in range(500)])
+        filename = self.path('snapshot.db')
+        progress = []
+        success, message, _ = service.export_snapshot(filename, pages_per_step=20,
+                                                      progress=lambda done, total: progress.append((done, total)))
+        self.assertTrue(success, message)
+        self.assertGreater(len(progress), 2)
+        self.assertEqual(progress[-1][0], progress[-1][1])
+
+        copy = Database(filename)
+        self.assertEqual(copy.fetch_all_employees(), db.fetch_all_employees())
+        copy.close()
+
+        success, message, _ = service.export_snapshot(self.path('cancelled.db'), pages_per_step=20,
+                                                      should_cancel=lambda: True)
+        self.assertEqual((success, message), (False, "Export cancelled"))
+        self.assertFalse(os.path.exists(self.path('cancelled.db')))
+        self.assertFalse(os.path.exists(self.path('cancelled.db.partial')))
+        db.close()
+
+    def test_export_changes_since_checkpoint(self):
+        """Test that delta exports contain only the changes since the last one."""
+        first = self.path('initial.csv')
+        success, _, summary = self.service.export_changes(first, 'payroll')
+        self.assertTrue(success)
+        self.assertEqual((summary['insert'], summary['update'], summary['delete']), (250, 0, 0))
+
+        # Nothing changed: an empty delta
+        success, _, summary = self.service.export_changes(self.path('empty.csv'), 'payroll')
+        self.assertEqual(sum(summary[op] for op in ('insert', 'update', 'delete')), 0)
+
+        employee = self.db.fetch_employee_by_id(10)
+        self.service.update_employee(10, {'name': 'Renamed', 'age': str(employee[2]), 'job': employee[3],
+                                          'email': employee[4], 'gender': employee[5],
+                                          'phone': employee[6], 'address': employee[7]})
+        self.service.delete_employee(20)
+        self.service.add_employee({'name': 'New Hire', 'age': '25', 'job': 'Engineer',
+                                   'email': 'new@example.com', 'gender': 'Female',
+                                   'phone': '987-654-3210', 'address': '1 New St'})
+
+        delta = self.path('delta.csv')
+        success, message, summary = self.service.export_changes(delta, 'payroll')
+        self.assertTrue(success, message)
+        with open(delta, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        self.assertEqual([(row[0], row[1], row[2]) for row in rows[1:]],
+                         [('update', '10', 'Renamed'), ('delete', '20', ''), ('insert', '251', 'New Hire')])
+
+        # A preview does not consume the changes, and other checkpoints are independent
+        self.service.delete_employee(30)
+        success, _, preview = self.service.export_changes(self.path('preview.json'), 'payroll',
+                                                          export_format='json', advance=False)
+        with open(self.path('preview.json'), encoding='utf-8') as f:
+            document = json.load(f)
+        self.assertEqual([(c['change'], c['id']) for c in document['changes']], [('delete', 30)])
+        self.assertEqual(self.db.get_checkpoint('payroll'), preview['since'])
+
+        _, _, checkpoints = self.service.get_export_checkpoints()
+        self.assertEqual([(c['name'], c['pending']) for c in checkpoints], [('payroll', 1)])
+
+        # write_changes on its own, with no header fields
+        filename = self.path('changes.json')
+        write_changes(self.db.iter_changes(0), filename, 'json')
+        with open(filename, encoding='utf-8') as f:
+            # One entry per employee ever changed, in its latest state
+            self.assertEqual(len(json.load(f)['changes']), 251)
+
+if __name__ == '__main__':
+    unittest.main()
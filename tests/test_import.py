@@ -0,0 +1,174 @@
+import csv
+import os
+import tempfile
+import unittest
+from db.database import Database
+from services.employee_service import EmployeeService
+from models.employee import Employee
+from utils.validators import ValidationRules, get_validation_rules, set_validation_rules
+
+class TestImport(unittest.TestCase):
+    """Test cases for the EmployeeService import methods."""
+
+    def setUp(self):
+        """Set up an empty database and a temporary directory."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db = Database(":memory:")
+        self.service = EmployeeService(self.db)
+
+    def tearDown(self):
+        """Clean up after each test."""
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def path(self, name):
+        """Path of a file in the temporary directory."""
+        return os.path.join(self.tmpdir.name, name)
+
+    def write_csv(self, name, rows):
+        """Write rows to a CSV file and return its path."""
+        filename = self.path(name)
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            csv.writer(f).writerows(rows)
+        return filename
+
+    def test_import_csv_round_trip(self):
+        """Test that a CSV export imports back into another database."""
+        source = Database(":memory:")
+        source.insert_employees(
+            Employee(None, f"Employee {i}", str(20 + i % 40), 'Engineer', f"e{i}@example.com",
+                     'Male' if i % 2 else 'Female', f"123-456-{i:04d}", f"{i} Main St, Floor 2")
+            for i in range(120)
+        )
+        filename = self.path('employees.csv')
+        EmployeeService(source).export_to_csv(filename)
+
+        progress = []
+        success, message, summary = self.service.import_csv(
+            filename, chunk_size=50, progress=lambda done, total: progress.append((done, total)))
+
+        self.assertTrue(success, message)
+        self.assertEqual((summary['imported'], summary['rejected'], summary['error_file']), (120, 0, None))
+        self.assertEqual(self.db.fetch_all_employees(), source.fetch_all_employees())
+        self.assertEqual(len(progress), 3)
+        self.assertEqual(progress[-1][0], progress[-1][1])
+        self.assertFalse(os.path.exists(self.path('employees.errors.csv')))
+        source.close()
+
+    def test_import_csv_writes_rejected_rows(self):
+        """Test that invalid and duplicate rows are skipped and written to the error file with reasons."""
+        filename = self.write_csv('roster.csv', [
+            ['email', ' NAME ', 'Age', 'Job', 'Gender', 'Phone', 'Address', 'Notes'],
+            ['ann@example.com', 'Ann', '31', 'Pilot', 'Female', '555-123-4567', '1 Road', 'x'],
+            ['bob@example', 'Bob', '40', 'Pilot', 'Male', '555-123-4567', '2 Road', ''],
+            [],
+            ['cy@example.com', 'Cy', 'forty', 'Pilot', 'Male', '555-123-4567', '3 Road', ''],
+            ['short', 'row'],
+            [' dee@example.com ', 'Dee', '28', 'Pilot', 'Female', '555-123-0000', '4 Road', ''],
+            ['ANN@example.com', 'Ann', '31', 'Pilot', 'Female', '555-999-0000', '1 Road', ''],
+        ])
+
+        success, message, summary = self.service.import_csv(filename)
+
+        self.assertTrue(success, message)
+        self.assertEqual((summary['imported'], summary['rejected']), (2, 4))
+        self.assertEqual([row[4] for row in self.db.fetch_all_employees()], ['ann@example.com', 'dee@example.com'])
+        with open(summary['error_file'], newline='', encoding='utf-8') as f:
+            rejected = list(csv.reader(f))
+        self.assertEqual(summary['error_file'], self.path('roster.errors.csv'))
+        self.assertEqual(rejected[0][-2:], ['Line', 'Error'])
+        self.assertEqual([(row[-2], row[-1]) for row in rejected[1:]], [
+            ('3', 'Invalid email format'),
+            ('5', 'Age must be a number'),
+            ('6', 'Expected at least 7 columns, found 2'),
+            ('8', 'Duplicate of employee #1 (same email)'),
+        ])
+
+    def test_import_csv_requires_columns(self):
+        """Test that a file missing a column is refused before anything is inserted."""
+        filename = self.write_csv('partial.csv', [['Name', 'Email'], ['Ann', 'ann@example.com']])
+        success, message, summary = self.service.import_csv(filename)
+
+        self.assertFalse(success)
+        self.assertIn("Missing column(s): Age, Job, Gender, Phone, Address", message)
+        self.assertEqual(self.db.count_employees(), 0)
+
+    def test_import_csv_validates_in_worker_processes(self):
+        """Test the process-pool validation path gives the same result, in order."""
+        rows = [['Name', 'Age', 'Job', 'Email', 'Gender', 'Phone', 'Address']]
+        rows += [[f"E{i}", '30' if i % 7 else 'x', 'Dev', f"e{i}@example.com", 'Male', f"555-123-{i:04d}", 'a']
+                 for i in range(100)]
+        filename = self.write_csv('many.csv', rows)
+
+        success, message, summary = self.service.import_csv(filename, chunk_size=10, processes=2)
+
+        self.assertTrue(success, message)
+        self.assertEqual((summary['imported'], summary['rejected']), (85, 15))
+        names = [row[1] for row in self.db.fetch_all_employees()]
+        self.assertEqual(names, [f"E{i}" for i in range(100) if i % 7])
+
+        # The workers validate with this process's configured rules
+        rows = [rows[0]] + [[f"F{i}", '30', 'Dev', f"f{i}@example.com", 'Male', f"555-456-{i:04d}", 'a']
+                            for i in range(20)]
+        previous = get_validation_rules()
+        set_validation_rules(ValidationRules({'job': {'allowed': ['Pilot']}}))
+        try:
+            _, _, summary = self.service.import_csv(self.write_csv('jobs.csv', rows), chunk_size=10, processes=2)
+        finally:
+            set_validation_rules(previous)
+        self.assertEqual((summary['imported'], summary['rejected']), (0, 20))
+        self.assertEqual(summary['errors'][0], (2, "Job must be one of: Pilot"))
+
+    def test_import_excel_round_trip_across_sheets(self):
+        """Test that an Excel export, split over several sheets, imports back with its types converted."""
+        source = Database(":memory:")
+        source.insert_employees(
+            Employee(None, f"Employee {i}", str(20 + i % 40), 'Engineer', f"e{i}@example.com",
+                     'Male' if i % 2 else 'Female', f"123-456-{i:04d}", f"{i} Main St")
+            for i in range(25)
+        )
+        filename = self.path('employees.xlsx')
+        EmployeeService(source).export('xlsx', filename, max_rows_per_sheet=11)
+
+        progress = []
+        success, message, summary = self.service.import_excel(
+            filename, chunk_size=10, progress=lambda done, total: progress.append((done, total)))
+
+        self.assertTrue(success, message)
+        self.assertEqual((summary['imported'], summary['rejected'], summary['errors']), (25, 0, []))
+        self.assertEqual(self.db.fetch_all_employees(), source.fetch_all_employees())
+        self.assertEqual(progress[-1], (25, 25))
+        source.close()
+
+    def test_import_excel_reports_rejected_rows(self):
+        """Test that Excel values are converted to text and invalid rows are reported by sheet and row."""
+        import openpyxl
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.title = "Staff"
+        sheet.append(['Email', 'Name', 'Age', 'Job', 'Gender', 'Phone', 'Address'])
+        sheet.append(['ann@example.com', 'Ann', 31.0, 'Pilot', 'Female', '555-123-4567', '1 Road'])
+        sheet.append(['bob@example', 'Bob', 40, 'Pilot', 'Male', '555-123-4567', '2 Road'])
+        sheet.append([None] * 7)
+        sheet.append(['cy@example.com', 'Cy', 30.5, 'Pilot', 'Male', '555-123-4567', '3 Road'])
+        sheet.append(['dee@example.com', 'Dee', 28, 'Pilot', 'Female', '555-123-4567'])
+        filename = self.path('staff.xlsx')
+        workbook.save(filename)
+
+        success, message, summary = self.service.import_excel(filename)
+
+        self.assertTrue(success, message)
+        self.assertEqual((summary['imported'], summary['rejected']), (1, 3))
+        self.assertEqual(self.db.fetch_all_employees()[0][1:3], ('Ann', 31))
+        self.assertEqual(summary['errors'], [
+            ('Staff!3', 'Invalid email format'),
+            ('Staff!5', 'Age must be a number'),
+            ("Staff!6", "Field 'address' is required"),
+        ])
+        with open(summary['error_file'], newline='', encoding='utf-8') as f:
+            rejected = list(csv.reader(f))
+        self.assertEqual(rejected[0], ['Name', 'Age', 'Job', 'Email', 'Gender', 'Phone', 'Address', 'Row', 'Error'])
+        self.assertEqual(rejected[1][:4], ['Bob', '40', 'Pilot', 'bob@example'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+import os
+import tempfile
+import sqlite3
+from db.database import Database
+from db.migrations import LATEST_VERSION, migrate, get_schema_version
+from models.employee import Employee
+
+class TestMigrations(unittest.TestCase):
+    """Test cases for schema versioning and migrations."""
+
+    def setUp(self):
+        """Create a database file in the original, untyped layout."""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "legacy.db")
+
+        con = sqlite3.connect(self.db_path)
+        con.execute("""
+            CREATE TABLE Employees(
+                id INTEGER PRIMARY KEY, name TEXT, age TEXT, job TEXT,
+                email TEXT, gender TEXT, phone TEXT, address TEXT
+            )
+        """)
+        con.executemany("INSERT INTO Employees VALUES (?,?,?,?,?,?,?,?)", [
+            (1, 'osama', '32', 'engineer', 'osama@gmail.com', 'Male', '12345678954', 'istanbul'),
+            (2, 'sara', ' 45 ', 'artist', 'sara@email.com', 'female', '5510898923', 'istanbul'),
+            (5, 'eman', 'thirty', 'pilot', 'eemy@yahoo.com', 'Other', '589232144', 'egypt'),
+        ])
+        con.commit()
+        con.close()
+
+    def tearDown(self):
+        """Clean up after each test."""
+        self.tmpdir.cleanup()
+
+    def test_legacy_database_is_upgraded_in_place(self):
+        """Test that opening a legacy file converts it to typed columns."""
+        db = Database(self.db_path)
+        try:
+            self.assertEqual(db.schema_version(), LATEST_VERSION)
+
+            rows = db.fetch_all_employees()
+            self.assertEqual([row[0] for row in rows], [1, 2, 5])
+            self.assertEqual([row[2] for row in rows], [32, 45, None])
+            self.assertEqual([row[5] for row in rows], ['Male', 'Female', None])
+
+            # The unconvertible row is kept verbatim for review
+            kept = db.con.execute("SELECT id, age, gender FROM employees_v1_nonconforming").fetchall()
+            self.assertEqual(kept, [(5, 'thirty', 'Other')])
+
+            # Existing rows are still searchable
+            self.assertEqual([row[0] for row in db.search_employees('osa')], [1])
+        finally:
+            db.close()
+
+    def test_typed_columns_enforce_constraints(self):
+        """Test that the CHECK constraints reject out-of-range values."""
+        db = Database(self.db_path)
+        try:
+            employee = Employee(name='x', age='30', job='j', email='x@y.com', gender='Male',
+                                phone='1234567890', address='a')
+            employee_id = db.insert_employee(employee)
+            age = db.con.execute("SELECT typeof(age) FROM Employees WHERE id=?", (employee_id,)).fetchone()[0]
+            self.assertEqual(age, 'integer')
+
+            for bad in (Employee(name='x', age='200', gender='Male'),
+                        Employee(name='x', age='abc', gender='Male'),
+                        Employee(name='x', age='30', gender='Unknown')):
+                with self.subTest(employee=bad):
+                    with self.assertRaises(sqlite3.IntegrityError):
+                        db.insert_employee(bad)
+        finally:
+            db.close()
+
+    def test_migrations_run_once(self):
+        """Test that reopening a migrated database applies nothing."""
+        Database(self.db_path).close()
+
+        con = sqlite3.connect(self.db_path)
+        try:
+            self.assertEqual(get_schema_version(con), LATEST_VERSION)
+            self.assertEqual(migrate(con), [])
+        finally:
+            con.close()
+
+    def test_change_tracking_covers_existing_rows_and_raw_sql(self):
+        """Test that upgraded rows are stamped and writes from other tools are tracked."""
+        Database(self.db_path).close()
+
+        con = sqlite3.connect(self.db_path)
+        try:
+            self.assertEqual(con.execute("SELECT seq FROM change_counter").fetchone()[0], 5)
+            stamped = con.execute("SELECT COUNT(*) FROM Employees WHERE created_at IS NOT NULL "
+                                  "AND change_seq = created_seq").fetchone()[0]
+            self.assertEqual(stamped, 3)
+
+            con.execute("INSERT INTO Employees(name, age, gender) VALUES ('new', 30, 'Male')")
+            con.execute("UPDATE Employees SET job = 'architect' WHERE id = 1")
+            con.execute("UPDATE Employees SET job = 'artist' WHERE id = 2")  # Unchanged value
+            con.execute("DELETE FROM Employees WHERE id = 5")
+            con.commit()
+        finally:
+            con.close()
+
+        db = Database(self.db_path)
+        try:
+            changes = [(op, employee_id) for op, employee_id, _, _ in db.iter_changes(5)]
+            self.assertEqual(changes, [('insert', 6), ('update', 1), ('delete', 5)])
+            self.assertEqual(db.count_changes(5), 3)
+        finally:
+            db.close()
+
+    def test_fresh_database_gets_latest_schema(self):
+        """Test that a brand new database starts at the latest version."""
+        db = Database(":memory:")
+        try:
+            self.assertEqual(db.schema_version(), LATEST_VERSION)
+            self.assertEqual(db.fetch_all_employees(), [])
+        finally:
+            db.close()
+
+if __name__ == '__main__':
+    unittest.main()
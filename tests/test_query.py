@@ -0,0 +1,63 @@
+import unittest
+from db.query import compile_query, query_cache_info
+
+class TestQueryCompiler(unittest.TestCase):
+    """Test cases for the filter/sort spec compiler."""
+
+    def test_equality_in_range_and_prefix(self):
+        """Test that each filter form compiles to parameterized SQL."""
+        sql, params = compile_query(
+            filters={
+                'job': 'Engineer',
+                'gender': ['Male', 'Female'],
+                'age': {'gte': 25, 'lt': 40},
+                'name': {'prefix': 'Jo'},
+            },
+            order_by=['-age', 'name'],
+            limit=10,
+            offset=20,
+        )
+
+        self.assertIn("age >= ? AND age < ?", sql)
+        self.assertIn("gender IN (?, ?)", sql)
+        self.assertIn("job = ?", sql)
+        self.assertIn("name >= ? AND name < ?", sql)
+        self.assertTrue(sql.endswith("ORDER BY age DESC, name, id LIMIT ? OFFSET ?"))
+        self.assertEqual(params, [25, 40, 'Male', 'Female', 'Engineer', 'Jo', 'Jp', 10, 20])
+        self.assertNotIn("Engineer", sql)
+
+    def test_null_and_empty_in(self):
+        """Test IS NULL comparisons and empty IN lists."""
+        sql, params = compile_query(filters={'gender': None, 'job': []}, count_only=True)
+        self.assertEqual(sql, "SELECT COUNT(*) FROM Employees WHERE gender IS NULL AND 0")
+        self.assertEqual(params, [])
+
+    def test_same_shape_reuses_compiled_sql(self):
+        """Test that queries differing only in values share one cache entry."""
+        compile_query(filters={'email': {'prefix': 'cache-a'}}, limit=5)
+        hits_before = query_cache_info().hits
+        sql_a, _ = compile_query(filters={'email': {'prefix': 'cache-a'}}, limit=5)
+        sql_b, params_b = compile_query(filters={'email': {'prefix': 'cache-b'}}, limit=7)
+
+        self.assertEqual(sql_a, sql_b)
+        self.assertEqual(params_b, ['cache-b', 'cache-c', 7])
+        self.assertEqual(query_cache_info().hits, hits_before + 2)
+
+    def test_rejects_unknown_columns_and_operators(self):
+        """Test that only known columns and operators reach the SQL."""
+        invalid_specs = [
+            {'filters': {'salary': 1}},
+            {'filters': {'age': {'like': '3%'}}},
+            {'filters': {'age': {'prefix': '3'}}},
+            {'order_by': 'name; DROP TABLE Employees'},
+            {'order_by': '--age'},
+            {'order_by': ['name', '-']},
+        ]
+
+        for spec in invalid_specs:
+            with self.subTest(spec=spec):
+                with self.assertRaises(ValueError):
+                    compile_query(**spec)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,8 @@
+import pickle
 import unittest
-from utils.validators import validate_email, validate_phone, validate_employee_data
+from utils.config import AppConfig
+from utils.validators import (validate_email, validate_phone, validate_employee_data, validate_rows, validate_columns,
+                              ValidationRules, get_validation_rules, set_validation_rules)
 
 class TestValidators(unittest.TestCase):
     """Test cases for validator functions."""
@@ -149,5 +152,159 @@ class TestValidators(unittest.TestCase):
         self.assertFalse(is_valid)
         self.assertEqual(message, "Age must be a number")
 
+    def test_validate_employee_data_age_out_of_range(self):
+        """Test validate_employee_data with an age the database would reject."""
+        data = {
+            'name': 'John Doe',
+            'age': '200',
+            'job': 'Developer',
+            'email': 'john@example.com',
+            'gender': 'Male',
+            'phone': '123-456-7890',
+            'address': '123 Main St, City, Country'
+        }
+
+        is_valid, message = validate_employee_data(data)
+        self.assertFalse(is_valid)
+        self.assertEqual(message, "Age must be between 0 and 150")
+
+    def test_validate_employee_data_unknown_gender(self):
+        """Test validate_employee_data with a gender outside the allowed values."""
+        data = {
+            'name': 'John Doe',
+            'age': '30',
+            'job': 'Developer',
+            'email': 'john@example.com',
+            'gender': 'Unknown',
+            'phone': '123-456-7890',
+            'address': '123 Main St, City, Country'
+        }
+
+        is_valid, message = validate_employee_data(data)
+        self.assertFalse(is_valid)
+        self.assertEqual(message, "Gender must be one of: Male, Female")
+
+    def test_validate_rows_collects_every_error(self):
+        """Test validate_rows lists only invalid rows, each with all of its errors."""
+        rows = [
+            ('John Doe', '30', 'Developer', 'john@example.com', 'Male', '123-456-7890', '1 Main St'),
+            ('', 'thirty', 'Developer', 'john@', 'Other', '123', '1 Main St'),
+            ('Jane Doe', '200', '', 'jane@example.com', 'Female', '(123) 456-7890', '2 Main St'),
+        ]
+
+        self.assertEqual(validate_rows(rows), [
+            (1, ["Field 'name' is required", "Invalid email format", "Invalid phone number format",
+                 "Age must be a number", "Gender must be one of: Male, Female"]),
+            (2, ["Field 'job' is required", "Age must be between 0 and 150"]),
+        ])
+
+    def test_validate_rows_short_rows_and_none(self):
+        """Test that missing values are reported rather than ignored or raised."""
+        rows = [
+            ('A', '30', 'J', 'a@example.com', 'Male'),
+            ('John Doe', None, 'Developer', None, 'Male', '123-456-7890', None),
+        ]
+        self.assertEqual(validate_rows(rows), [
+            (0, ["Expected 7 values, got 5"]),
+            (1, ["Field 'age' is required", "Field 'email' is required", "Field 'address' is required"]),
+        ])
+
+    def test_validate_rows_matches_validate_employee_data(self):
+        """Test the batch path's first error is the one validate_employee_data reports."""
+        fields = ['name', 'age', 'job', 'email', 'gender', 'phone', 'address']
+        valid = ['John Doe', '30', 'Developer', 'john@example.com', 'Male', '123-456-7890', '1 Main St']
+        variants = ['', '٣٠', ' 30', '-1', '1234567890123', 'a@b.c', 'x@example.com\n', 'female',
+                    '(12) 34-56 78 90', '12-34-56-78-9']
+        rows = [valid[:i] + [value] + valid[i + 1:] for i in range(len(fields)) for value in variants]
+
+        errors = dict(validate_rows(rows))
+        for index, row in enumerate(rows):
+            with self.subTest(row=row):
+                is_valid, message = validate_employee_data(dict(zip(fields, row)))
+                self.assertEqual(is_valid, index not in errors)
+                if not is_valid:
+                    self.assertEqual(errors[index][0], message)
+
+    def test_validate_columns(self):
+        """Test validate_columns validates values given per field."""
+        columns = {
+            'name': ['John Doe', 'Jane Doe'],
+            'age': ['30', '31'],
+            'job': ['Developer', 'Pilot'],
+            'email': ['john@example.com', 'jane@example'],
+            'gender': ['Male', 'Female'],
+            'phone': ['123-456-7890', '123-456-7890'],
+            'address': ['1 Main St', '2 Main St'],
+        }
+
+        self.assertEqual(validate_columns(columns), [(1, ["Invalid email format"])])
+
+class TestValidationRules(unittest.TestCase):
+    """Test cases for configured validation rules."""
+
+    def setUp(self):
+        """Set up a valid row and rules for one business unit."""
+        self.row = ('John Doe', '30', 'Pilot', 'john@example.com', 'Male', '123-456-7890', '1 Main St')
+        self.rules = ValidationRules({
+            'age': {'min': 21, 'max': 65},
+            'job': {'allowed': ['Pilot', 'Engineer']},
+            'phone': {'regex': r'^\+[0-9]{11,13}$', 'message': "Phone must be in +<country><number> form"},
+            'address': {'required': None},
+        })
+
+    def replace(self, **values):
+        """The valid row with some fields replaced."""
+        fields = ['name', 'age', 'job', 'email', 'gender', 'phone', 'address']
+        return tuple(values.get(field, value) for field, value in zip(fields, self.row))
+
+    def test_overrides_apply(self):
+        """Test that overridden rules replace the defaults and the rest still apply."""
+        row = self.replace(phone='+201234567890', address='')
+        self.assertEqual(self.rules.validate_rows([row]), [])
+        self.assertEqual(self.rules.validate_rows([self.replace(age='18', job='Writer', email='x', address='')]), [
+            (0, ["Invalid email format", "Phone must be in +<country><number> form",
+                 "Age must be between 21 and 65", "Job must be one of: Pilot, Engineer"]),
+        ])
+
+    def test_invalid_rules_are_refused(self):
+        """Test that a bad configuration fails when it is compiled, not when a record is checked."""
+        for overrides, message in [
+            ({'salary': {'required': True}}, "Unknown field 'salary'"),
+            ({'name': {'length': 5}}, "Unknown rule(s) for 'name': length"),
+            ({'email': {'regex': '(['}}, "Invalid regex for 'email'"),
+            ({'age': {'max': 200}}, "Age range must be within 0 and 150"),
+            ({'gender': {'allowed': ['Other']}}, "Gender values must be among: Male, Female"),
+            ({'age': {'required': None}}, "Age must stay required"),
+            ({'gender': {'required': False}}, "Gender must stay required"),
+            ({'age': {'min': '18'}}, "'min' for 'age' must be a whole number"),
+            ({'age': {'max': 60.5}}, "'max' for 'age' must be a whole number"),
+            ({'age': {'allowed': [30, 40]}}, "'allowed' for 'age' must be a list of strings"),
+            ({'job': {'allowed': 'Pilot'}}, "'allowed' for 'job' must be a list of strings"),
+            ({'email': {'regex': 5}}, "'regex' for 'email' must be a string"),
+        ]:
+            with self.subTest(overrides=overrides):
+                with self.assertRaises(ValueError) as context:
+                    ValidationRules(overrides)
+                self.assertIn(message, str(context.exception))
+
+    def test_active_rules_and_pickling(self):
+        """Test the active rules drive validate_employee_data and survive being sent to a worker."""
+        config = AppConfig()
+        config.config['validation'] = {'age': {'min': 21}}
+        rules = config.get_validation_rules()
+        self.assertIs(config.get_validation_rules(), rules)
+
+        previous = get_validation_rules()
+        set_validation_rules(rules)
+        try:
+            data = dict(zip(['name', 'age', 'job', 'email', 'gender', 'phone', 'address'], self.replace(age='20')))
+            self.assertEqual(validate_employee_data(data), (False, "Age must be between 21 and 150"))
+        finally:
+            set_validation_rules(previous)
+        self.assertEqual(validate_employee_data(data), (True, ""))
+
+        copy = pickle.loads(pickle.dumps(rules))
+        self.assertEqual(copy.validate_rows([self.replace(age='20')]), [(0, ["Age must be between 21 and 150"])])
+
 if __name__ == '__main__':
     unittest.main()
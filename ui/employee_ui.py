@@ -132,12 +132,23 @@ class EmployeeUI:
         export_menu.add_command(label="Export to CSV", command=self.export_utils.export_to_csv)
         export_menu.add_command(label="Export to Excel", command=self.export_utils.export_to_excel)
         export_menu.add_command(label="Export to PDF", command=self.export_utils.export_to_pdf)
+        export_menu.add_separator()
+        export_menu.add_command(label="Export All Formats...", command=self.export_utils.export_bundle)
+        export_menu.add_command(label="Export Database Snapshot...", command=self.export_utils.export_snapshot)
 
+        file_menu.add_command(label="Import from CSV...", command=self.export_utils.import_from_csv)
+        file_menu.add_command(label="Import from Excel...", command=self.export_utils.import_from_excel)
         file_menu.add_cascade(label="Export Data", menu=export_menu)
         file_menu.add_separator()
         file_menu.add_command(label="Exit", command=self.root.quit)
         menubar.add_cascade(label="File", menu=file_menu)
 
+        # Reports menu
+        reports_menu = tk.Menu(menubar, tearoff=0)
+        reports_menu.add_command(label="Workforce Statistics", command=self._show_statistics)
+        reports_menu.add_command(label="Duplicate Employees", command=self._show_duplicates)
+        menubar.add_cascade(label="Reports", menu=reports_menu)
+
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
         help_menu.add_command(label="About", command=self._show_about)
@@ -156,6 +167,38 @@ class EmployeeUI:
         """Display all employees in the treeview"""
         self.view_tab.display_employees()
 
+    def _show_statistics(self):
+        """Show headcount by job, gender split and age histogram"""
+        success, message, statistics = self.service.get_statistics()
+        if not success:
+            messagebox.showerror("Error", message)
+            return
+
+        lines = [f"Total employees: {statistics['total']}", "", "By job:"]
+        lines += [f"    {job}: {count}" for job, count in statistics['by_job'].items()]
+        lines += ["", "By gender:"]
+        lines += [f"    {gender}: {count}" for gender, count in statistics['by_gender'].items()]
+        lines += ["", "By age:"]
+        lines += [f"    {band}: {count}" for band, count in statistics['by_age_band'].items()]
+        messagebox.showinfo("Workforce Statistics", "\n".join(lines))
+
+    def _show_duplicates(self):
+        """Show employees stored more than once with the same email or phone number"""
+        success, message, report = self.service.get_duplicate_report()
+        if not success:
+            messagebox.showerror("Error", message)
+            return
+
+        lines = [message]
+        for field, groups in report.items():
+            if groups:
+                lines += ["", f"Same {field}:"]
+                lines += [f"    {key}: " + ", ".join(f"#{employee_id}" for employee_id in ids)
+                          for key, ids in groups[:20]]
+                if len(groups) > 20:
+                    lines.append(f"    ... and {len(groups) - 20} more")
+        messagebox.showinfo("Duplicate Employees", "\n".join(lines))
+
     def _show_about(self):
         """Show about dialog"""
         messagebox.showinfo(
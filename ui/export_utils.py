@@ -1,8 +1,20 @@
+import os
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import ttk, filedialog, messagebox
+from services.exporters import export_formats, get_exporter_spec
+from services.export_queue import ExportJob, ExportQueue
+
+# How often the progress dialog checks on the export worker
+POLL_INTERVAL_MS = 100
 
 class ExportUtils:
-    """Utility class for exporting employee data to different formats."""
+    """
+    Utility class for exporting employee data to different formats.
+
+    Exports run one at a time on a background thread so the window stays
+    responsive; further exports started meanwhile are queued. Progress is
+    picked up from the worker with root.after polling.
+    """
 
     def __init__(self, ui_instance):
         """
@@ -12,27 +24,23 @@ class ExportUtils:
             ui_instance: Main UI instance for accessing shared resources
         """
         self.ui = ui_instance
+        self.queue = ExportQueue()
+        self.dialog = None
+        self._polling = False
 
     def export_to_csv(self):
         """Export employee data to CSV format"""
         # Ask user for save location
         filename = filedialog.asksaveasfilename(
             defaultextension=".csv",
-            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")],
+            filetypes=[("CSV files", "*.csv"), ("Compressed CSV files", "*.csv.gz"), ("All files", "*.*")],
             title="Export to CSV"
         )
 
         if not filename:
             return  # User cancelled
 
-        # Call service to export data
-        success, message, _ = self.ui.service.export_to_csv(filename)
-
-        # Show result message
-        if success:
-            messagebox.showinfo("Export Successful", message)
-        else:
-            messagebox.showerror("Export Failed", message)
+        self._start_export("CSV", self.ui.service.export_to_csv, filename)
 
     def export_to_excel(self):
         """Export employee data to Excel format"""
@@ -46,14 +54,7 @@ class ExportUtils:
         if not filename:
             return  # User cancelled
 
-        # Call service to export data
-        success, message, _ = self.ui.service.export_to_excel(filename)
-
-        # Show result message
-        if success:
-            messagebox.showinfo("Export Successful", message)
-        else:
-            messagebox.showerror("Export Failed", message)
+        self._start_export("Excel", self.ui.service.export_to_excel, filename)
 
     def export_to_pdf(self):
         """Export employee data to PDF format"""
@@ -67,11 +68,148 @@ class ExportUtils:
         if not filename:
             return  # User cancelled
 
-        # Call service to export data
-        success, message, _ = self.ui.service.export_to_pdf(filename)
+        self._start_export("PDF", self.ui.service.export_to_pdf, filename)
+
+    def export_snapshot(self):
+        """Save a copy of the whole database file, made in the background"""
+        # Ask user for save location
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".db",
+            filetypes=[("SQLite databases", "*.db"), ("All files", "*.*")],
+            title="Export Database Snapshot"
+        )
+
+        if not filename:
+            return  # User cancelled
+
+        self._start_export("Database snapshot", self.ui.service.export_snapshot, filename, unit="pages")
+
+    def import_from_csv(self):
+        """Import employees from a CSV file in the background; rejected rows go to an error file"""
+        filename = filedialog.askopenfilename(
+            filetypes=[("CSV files", "*.csv"), ("Compressed CSV files", "*.csv.gz"), ("All files", "*.*")],
+            title="Import from CSV"
+        )
+
+        if not filename:
+            return  # User cancelled
+
+        self._start_export("CSV", self.ui.service.import_csv, filename, unit="bytes", action="Import")
+
+    def import_from_excel(self):
+        """Import employees from an Excel workbook in the background; rejected rows go to an error file"""
+        filename = filedialog.askopenfilename(
+            filetypes=[("Excel files", "*.xlsx"), ("All files", "*.*")],
+            title="Import from Excel"
+        )
+
+        if not filename:
+            return  # User cancelled
+
+        self._start_export("Excel", self.ui.service.import_excel, filename, unit="rows", action="Import")
+
+    def export_bundle(self):
+        """Export employee data to every registered format at once, from one snapshot"""
+        # Ask user for the target folder
+        directory = filedialog.askdirectory(title="Export All Formats to Folder", mustexist=False)
+
+        if not directory:
+            return  # User cancelled
+
+        label = " + ".join(get_exporter_spec(export_format).label for export_format in export_formats())
+        self._start_export(label, self._export_bundle, directory)
+
+    def _export_bundle(self, directory: str, progress=None, should_cancel=None):
+        """Queue adapter for export_bundle, which reports no per-row progress"""
+        return self.ui.service.export_bundle(export_formats(), directory, should_cancel=should_cancel)
+
+    def _start_export(self, label: str, export, filename: str, unit: str = "employees",
+                      action: str = "Export"):
+        """Queue an export (or import) on the worker and make sure progress is being shown"""
+        self.queue.submit(label, export, filename, unit, action)
+        self._show_dialog()
+        if not self._polling:
+            self._polling = True
+            self.ui.root.after(POLL_INTERVAL_MS, self._poll)
+
+    def _show_dialog(self):
+        """Create the (non-modal) progress dialog, or bring it to the front"""
+        if self.dialog is not None:
+            self.dialog.deiconify()
+            self.dialog.lift()
+            return
+
+        self.dialog = tk.Toplevel(self.ui.root)
+        self.dialog.title("Exporting")
+        self.dialog.resizable(False, False)
+        self.dialog.transient(self.ui.root)
+        self.dialog.protocol("WM_DELETE_WINDOW", self.dialog.withdraw)  # Keep exporting in the background
+
+        frame = ttk.Frame(self.dialog, padding=15)
+        frame.pack(fill='both', expand=True)
+
+        self.status_label = ttk.Label(frame, text="Starting export...", width=50)
+        self.status_label.pack(anchor='w')
+        self.progress_bar = ttk.Progressbar(frame, length=360, mode='determinate')
+        self.progress_bar.pack(fill='x', pady=10)
+        self.queue_label = ttk.Label(frame, text="")
+        self.queue_label.pack(anchor='w')
+
+        buttons = ttk.Frame(frame)
+        buttons.pack(anchor='e', pady=(10, 0))
+        ttk.Button(buttons, text="Cancel", command=self._cancel_current).pack(side='left', padx=5)
+        ttk.Button(buttons, text="Cancel All", command=self.queue.cancel_all).pack(side='left')
+
+    def _cancel_current(self):
+        """Stop the export that is running now; queued exports still run"""
+        job = self.queue.current()
+        if job is not None:
+            job.cancel()
+
+    def _poll(self):
+        """Report finished exports and refresh the progress dialog"""
+        for job in self.queue.finished():
+            self._report(job)
+
+        if not self.queue.busy():
+            self._polling = False
+            if self.dialog is not None:
+                self.dialog.destroy()
+                self.dialog = None
+            return
+
+        self._update_dialog()
+        self.ui.root.after(POLL_INTERVAL_MS, self._poll)
+
+    def _update_dialog(self):
+        """Show the running job's progress and how many are queued"""
+        if self.dialog is None:
+            return
+        job = self.queue.current()
+        if job is not None:
+            name = os.path.basename(job.filename)
+            self.dialog.title(f"{job.action}ing")
+            if job.cancelled:
+                self.status_label.config(text=f"Cancelling {job.label} {job.action.lower()}...")
+            elif job.rows_total:
+                self.status_label.config(
+                    text=f"{job.label}: {name} ({job.rows_done:,} of {job.rows_total:,} {job.unit})")
+            else:
+                self.status_label.config(text=f"{job.label}: {name}")
+            self.progress_bar.config(maximum=max(job.rows_total, 1), value=job.rows_done)
+
+        waiting = len(self.queue.waiting())
+        self.queue_label.config(text=f"{waiting} more export(s) queued" if waiting else "")
 
-        # Show result message
-        if success:
-            messagebox.showinfo("Export Successful", message)
-        else:
-            messagebox.showerror("Export Failed", message)
\ No newline at end of file
+    def _report(self, job: ExportJob):
+        """Show the outcome of a finished export"""
+        if job.action == "Import":
+            # Chunks committed before a failure or cancel are kept, so refresh either way
+            self.ui.view_tab.display_employees()
+        if job.status == ExportJob.DONE:
+            messagebox.showinfo(f"{job.action} Successful", job.message)
+        elif job.status == ExportJob.FAILED:
+            messagebox.showerror(f"{job.action} Failed", job.message)
+        elif job.action == "Import":
+            messagebox.showinfo("Import Cancelled", job.message)
+        # Cancelled exports were asked for by the user; nothing to report
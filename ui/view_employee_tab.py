@@ -1,9 +1,20 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+def _display_values(row):
+    """A row's values as shown: NULL (an age or gender kept by migration 2) shows as blank, not 'None'"""
+    return tuple('' if value is None else value for value in row)
+
 class ViewEmployeeTab:
     """Class for the View Employees tab functionality."""
 
+    # Maximum number of search results shown at once
+    SEARCH_LIMIT = 500
+
+    # Scrolls up to this many rows walk the key from the top row; longer
+    # jumps count from the first employee
+    RELATIVE_SCROLL_LIMIT = 1000
+
     def __init__(self, parent, ui_instance):
         """
         Initialize the View Employees tab.
@@ -15,6 +26,13 @@ class ViewEmployeeTab:
         self.parent = parent
         self.ui = ui_instance
 
+        # The full list is virtualized: the treeview only holds the rows on
+        # screen, and the scrollbar is driven from the employee count.
+        # Search results are few enough to be shown the usual way.
+        self.virtual = False
+        self.total = 0
+        self.position = 0
+
         # Create tab
         self.tab = ttk.Frame(parent)
         parent.add(self.tab, text='View Employees')
@@ -94,13 +112,25 @@ class ViewEmployeeTab:
         self.tv['show'] = 'headings'
         self.tv.bind("<ButtonRelease-1>", self._get_selected_row)
 
+        # Scrolling goes through the tab so the virtual list can fetch rows
+        self.tv.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.tv.bind("<Button-4>", self._on_mouse_wheel)
+        self.tv.bind("<Button-5>", self._on_mouse_wheel)
+        for key, rows in (("<Up>", -1), ("<Down>", 1)):
+            self.tv.bind(key, lambda event, rows=rows: self._on_arrow_key(rows))
+        for key, args in (("<Prior>", ('scroll', -1, 'pages')), ("<Next>", ('scroll', 1, 'pages')),
+                          ("<Home>", ('moveto', 0)), ("<End>", ('moveto', 1))):
+            self.tv.bind(key, lambda event, args=args: self._on_scroll_key(*args))
+        # Refill when the window is resized and more or fewer rows fit
+        self.tv.bind("<Configure>", self._on_resize)
+
         # Add scrollbar
-        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.tv.yview)
-        self.tv.configure(yscrollcommand=scrollbar.set)
+        self.scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self._on_scrollbar)
+        self.tv.configure(yscrollcommand=self._on_tree_scroll)
 
         # Pack treeview and scrollbar
         self.tv.pack(side=tk.LEFT, fill='both', expand=True)
-        scrollbar.pack(side=tk.RIGHT, fill='y')
+        self.scrollbar.pack(side=tk.RIGHT, fill='y')
 
     def _create_action_buttons(self, parent):
         """Create action buttons for employee management"""
@@ -128,7 +158,7 @@ class ViewEmployeeTab:
         selected_row = self.tv.focus()
         data = self.tv.item(selected_row)
         if 'values' in data and data['values']:
-            row = data["values"]
+            row = _display_values(data["values"])
             self.ui.selected_employee_id = row[0]
 
             # Fill form with selected employee data without switching tabs
@@ -153,22 +183,24 @@ class ViewEmployeeTab:
 
     def _filter_employees(self, search_text):
         """Filter employees based on search text"""
+        if not search_text.strip():
+            self.display_employees()
+            return
+
         # Clear existing items
+        self.virtual = False
         self.tv.delete(*self.tv.get_children())
 
-        # Fetch all employees
-        success, message, all_employees = self.ui.service.get_all_employees()
+        # Let the full-text index find the matches instead of scanning every row
+        success, message, matches = self.ui.service.search_employees(search_text, limit=self.SEARCH_LIMIT)
 
         if not success:
             messagebox.showerror("Error", message)
             return
 
-        # Filter and display matching employees
-        for row in all_employees:
-            # Check if search text is in ID or name (case insensitive)
-            if (search_text in str(row[0]).lower() or
-                search_text in str(row[1]).lower()):
-                self.tv.insert("", tk.END, values=row)
+        # Display matching employees, best match first
+        for row in matches:
+            self.tv.insert("", tk.END, iid=row[0], values=_display_values(row))
 
     def _switch_to_edit(self):
         """Switch to Add Employee tab for editing"""
@@ -217,6 +249,9 @@ class ViewEmployeeTab:
         export_menu.add_command(label="Export to CSV", command=self.ui.export_utils.export_to_csv)
         export_menu.add_command(label="Export to Excel", command=self.ui.export_utils.export_to_excel)
         export_menu.add_command(label="Export to PDF", command=self.ui.export_utils.export_to_pdf)
+        export_menu.add_separator()
+        export_menu.add_command(label="Export All Formats...", command=self.ui.export_utils.export_bundle)
+        export_menu.add_command(label="Export Database Snapshot...", command=self.ui.export_utils.export_snapshot)
 
         # Display popup menu
         try:
@@ -228,17 +263,130 @@ class ViewEmployeeTab:
             export_menu.grab_release()
 
     def display_employees(self):
-        """Display all employees in the treeview"""
-        # Clear existing items
-        self.tv.delete(*self.tv.get_children())
+        """
+        Display all employees in the treeview, virtualized.
+
+        Only the rows that fit on screen are fetched and inserted, so
+        opening the list costs about the same for any number of employees.
+        The scroll position is kept across refreshes.
+        """
+        success, message, total = self.ui.service.count_employees()
+
+        if not success:
+            messagebox.showerror("Error", message)
+            return
+
+        self.virtual = True
+        self.total = total
+        self._show_rows(self.position)
+
+    def _visible_rows(self):
+        """Number of whole rows the treeview has room for"""
+        children = self.tv.get_children()
+        box = self.tv.bbox(children[0]) if children else ''
+        if box:
+            top, row_height = box[1], box[3]
+        else:
+            # Nothing shown yet: assume the heading is one row high
+            row_height = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+            top = row_height
+        return max(1, (self.tv.winfo_height() - top) // row_height)
 
-        # Fetch all employees
-        success, message, employees = self.ui.service.get_all_employees()
+    def _show_rows(self, position, from_id=None):
+        """
+        Fill the treeview with the rows starting at a position in the list.
+
+        Args:
+            position: Index of the new top row in the whole list
+            from_id: ID of the current top row, to move relative to it
+        """
+        visible = self._visible_rows()
+        position = max(0, min(position, self.total - visible))
+        move = position - self.position
+        if from_id is not None and abs(move) <= self.RELATIVE_SCROLL_LIMIT:
+            success, message, rows = self.ui.service.get_employees_at(move, visible, from_id)
+        else:
+            success, message, rows = self.ui.service.get_employees_at(position, visible)
 
         if not success:
             messagebox.showerror("Error", message)
             return
 
-        # Display employees in treeview
-        for row in employees:
-            self.tv.insert("", tk.END, values=row)
+        self.position = position
+        self.tv.delete(*self.tv.get_children())
+        for row in rows:
+            self.tv.insert("", tk.END, iid=row[0], values=_display_values(row))
+        # Undo any scrolling left over from search results
+        self.tv.yview_moveto(0)
+
+        # Keep the selected employee selected while it is on screen
+        if self.ui.selected_employee_id is not None and self.tv.exists(self.ui.selected_employee_id):
+            self.tv.selection_set(self.ui.selected_employee_id)
+            self.tv.focus(self.ui.selected_employee_id)
+
+        if self.total:
+            self.scrollbar.set(position / self.total, min(1.0, (position + len(rows)) / self.total))
+        else:
+            self.scrollbar.set(0, 1)
+
+    def _scroll_to(self, position):
+        """Move the virtual list so position is the top row"""
+        children = self.tv.get_children()
+        self._show_rows(position, int(children[0]) if children else None)
+
+    def _on_scrollbar(self, *args):
+        """Handle the scrollbar: ('moveto', fraction) or ('scroll', n, 'units'|'pages')"""
+        if not self.virtual:
+            self.tv.yview(*args)
+            return
+        if args[0] == 'moveto':
+            self._scroll_to(round(float(args[1]) * self.total))
+        else:
+            step = self._visible_rows() if args[2] == 'pages' else 1
+            self._scroll_to(self.position + int(args[1]) * step)
+
+    def _on_tree_scroll(self, first, last):
+        """Follow the treeview's own scrolling, which the virtual list does not use"""
+        if not self.virtual:
+            self.scrollbar.set(first, last)
+
+    def _on_mouse_wheel(self, event):
+        """Scroll the virtual list by three rows per wheel step"""
+        if not self.virtual:
+            return None
+        if event.num == 4 or event.delta > 0:
+            self._scroll_to(self.position - 3)
+        else:
+            self._scroll_to(self.position + 3)
+        return "break"
+
+    def _on_arrow_key(self, rows):
+        """Scroll the virtual list when the focus moves past its first or last row"""
+        if not self.virtual:
+            return None
+        children = self.tv.get_children()
+        if not children:
+            return "break"
+        edge = children[0] if rows < 0 else children[-1]
+        if self.tv.focus() != edge:
+            # Moving within the window is left to the treeview
+            return None
+        self._scroll_to(self.position + rows)
+        children = self.tv.get_children()
+        if children:
+            row = children[0] if rows < 0 else children[-1]
+            self.tv.selection_set(row)
+            self.tv.focus(row)
+        return "break"
+
+    def _on_scroll_key(self, *args):
+        """Page Up/Down, Home and End"""
+        if not self.virtual:
+            return None
+        self._on_scrollbar(*args)
+        return "break"
+
+    def _on_resize(self, event):
+        """Refill the virtual list when the number of visible rows changes"""
+        if self.virtual and len(self.tv.get_children()) != min(self._visible_rows(), self.total):
+            self._scroll_to(self.position)
@@ -1,6 +1,8 @@
 # Utils package initialization
-from utils.validators import validate_employee_data, validate_email, validate_phone
+from utils.validators import (validate_employee_data, validate_email, validate_phone, validate_rows, validate_columns,
+                              ValidationRules, set_validation_rules)
 from utils.config import AppConfig
 
-__all__ = ['validate_employee_data', 'validate_email', 'validate_phone', 'AppConfig']
+__all__ = ['validate_employee_data', 'validate_email', 'validate_phone', 'validate_rows', 'validate_columns',
+           'ValidationRules', 'set_validation_rules', 'AppConfig']
 
@@ -1,6 +1,7 @@
 import json
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+from utils.validators import ValidationRules
 
 class AppConfig:
     """
@@ -11,9 +12,16 @@ class AppConfig:
         self.config_file = "app_config.json"
         self.default_config = {
             "db_path": "Employee.db",
-            "theme": "Light"
+            "theme": "Light",
+            "database": {
+                "journal_mode": "WAL",
+                "synchronous": "NORMAL",
+                "busy_timeout_ms": 5000
+            },
+            "validation": {}
         }
         self.config = self._load_config()
+        self._validation_rules: Optional[ValidationRules] = None
     
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or use defaults"""
@@ -42,6 +50,27 @@ class AppConfig:
         """Set database path"""
         self.config["db_path"] = path
     
+    def get_database_options(self) -> Dict[str, Any]:
+        """Get connection options (journal mode, sync level, busy timeout) for Database"""
+        options = dict(self.default_config["database"])
+        options.update(self.config.get("database", {}))
+        return options
+
+    def get_validation_rules(self) -> ValidationRules:
+        """
+        Get the employee validation rules, compiled on first use.
+
+        The "validation" section maps field names to rule overrides, e.g.
+        {"age": {"min": 18, "max": 67}, "job": {"allowed": ["Engineer", "Pilot"]}};
+        see utils.validators.DEFAULT_FIELD_RULES for the rule keys.
+
+        Raises:
+            ValueError: If the section has an invalid rule
+        """
+        if self._validation_rules is None:
+            self._validation_rules = ValidationRules(self.config.get("validation"))
+        return self._validation_rules
+
     def get_theme(self) -> str:
         """Get UI theme"""
         return self.config.get("theme", self.default_config["theme"])
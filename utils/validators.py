@@ -1,5 +1,259 @@
 import re
-from typing import Tuple, Dict, Any
+from typing import Tuple, Dict, Any, Callable, Collection, Iterable, List, Mapping, Optional, Sequence
+from models.employee import GENDERS, MIN_AGE, MAX_AGE
+
+# Fields every employee has, in Employee.to_tuple() order (without id);
+# validate_rows takes rows of values in this order
+REQUIRED_FIELDS = ('name', 'age', 'job', 'email', 'gender', 'phone', 'address')
+
+# Patterns are compiled once here rather than looked up on every call
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# 10 to 15 digits, spaces, dashes and parentheses, at least 10 of them digits
+PHONE_PATTERN = re.compile(r'^(?=[0-9\s\-\(\)]{10,15}$)(?:[\s\-\(\)]*[0-9]){10}')
+
+# Built-in rules per field. app_config.json's "validation" section
+# overrides them key by key (see AppConfig.get_validation_rules). A rule
+# may set:
+#   required  the value must not be empty
+#   regex     the value must match, from its start (end the pattern with $
+#             to match all of it)
+#   numeric   the value must be a whole number; implied by min and max
+#   min, max  numeric range, inclusive
+#   allowed   list of accepted values
+#   message   error for a failed regex, numeric, range or allowed check
+# Checks other than 'required' run in the order the fields are listed.
+DEFAULT_FIELD_RULES: Dict[str, Dict[str, Any]] = {
+    'email': {'required': True, 'regex': EMAIL_PATTERN.pattern, 'message': "Invalid email format"},
+    'phone': {'required': True, 'regex': PHONE_PATTERN.pattern, 'message': "Invalid phone number format"},
+    'age': {'required': True, 'min': MIN_AGE, 'max': MAX_AGE},
+    'gender': {'required': True, 'allowed': list(GENDERS)},
+    'name': {'required': True},
+    'job': {'required': True},
+    'address': {'required': True},
+}
+
+RULE_KEYS = ('required', 'regex', 'numeric', 'min', 'max', 'allowed', 'message')
+
+def _is_number(value: str) -> bool:
+    """ASCII digits only, as SQLite stores the age as an INTEGER"""
+    return value.isdigit() and value.isascii()
+
+def _accept(value: Any) -> bool:
+    return True
+
+def _call(predicate: Callable[[Any], Any], value: Any) -> Any:
+    return predicate(value)
+
+class ValidationRules:
+    """
+    Field rules compiled into validator callables.
+
+    Patterns are compiled and the checks for each field are built once,
+    when the rules are created; validating a record only calls them.
+    Instances pickle as their rules and are compiled again when
+    unpickled, so validate_batches sends them to each worker process
+    once, when it starts.
+    """
+
+    def __init__(self, overrides: Optional[Mapping[str, Mapping[str, Any]]] = None):
+        """
+        Compile the default rules with overrides applied.
+
+        Args:
+            overrides: Per-field rule keys replacing the defaults; a key
+                set to None removes that rule
+
+        Raises:
+            ValueError: If a field, rule or pattern is invalid, or the rules
+                would accept values the database rejects
+        """
+        self.overrides = {field: dict(rule) for field, rule in (overrides or {}).items()}
+        rules = {field: dict(rule) for field, rule in DEFAULT_FIELD_RULES.items()}
+        for field, rule in self.overrides.items():
+            if field not in rules:
+                raise ValueError(f"Unknown field '{field}' in validation rules")
+            unknown = set(rule) - set(RULE_KEYS)
+            if unknown:
+                raise ValueError(f"Unknown rule(s) for '{field}': {', '.join(sorted(unknown))}")
+            rules[field].update(rule)
+        self.rules = {field: {key: value for key, value in rule.items() if value is not None}
+                      for field, rule in rules.items()}
+
+        self._required = [(REQUIRED_FIELDS.index(field), f"Field '{field}' is required")
+                          for field in REQUIRED_FIELDS if self.rules[field].get('required')]
+        # (position in a row, [(check, message), ...]) in rule order
+        self._checks: List[Tuple[int, List[Tuple[Callable[[str], Any], str]]]] = []
+        # One callable per field, in row order, true for a valid value
+        self._predicates: List[Callable[[Any], Any]] = [bool if position in dict(self._required) else _accept
+                                                        for position in range(len(REQUIRED_FIELDS))]
+        for field, rule in self.rules.items():
+            checks, predicate = self._compile(field, rule)
+            if checks:
+                position = REQUIRED_FIELDS.index(field)
+                self._checks.append((position, checks))
+                self._predicates[position] = predicate
+
+    def __reduce__(self):
+        return ValidationRules, (self.overrides,)
+
+    @staticmethod
+    def _compile(field: str, rule: Dict[str, Any]) -> Tuple[List[Tuple[Callable[[str], Any], str]], Callable]:
+        """
+        Build one field's checks.
+
+        Returns:
+            Tuple of (checks, predicate): the (check, message) pairs run in
+            order for error messages, and a single callable true for a
+            valid value, used on the fast path
+        """
+        label = field.capitalize()
+        # Config values are checked here so a wrong type is reported, not raised later
+        for key in ('regex', 'message'):
+            if key in rule and not isinstance(rule[key], str):
+                raise ValueError(f"'{key}' for '{field}' must be a string")
+        for key in ('min', 'max'):
+            if key in rule and (isinstance(rule[key], bool) or not isinstance(rule[key], int)):
+                raise ValueError(f"'{key}' for '{field}' must be a whole number")
+        if 'allowed' in rule and (not isinstance(rule['allowed'], (list, tuple))
+                                  or not all(isinstance(value, str) for value in rule['allowed'])):
+            raise ValueError(f"'allowed' for '{field}' must be a list of strings")
+
+        message = rule.get('message')
+        checks = []
+        # Same checks, with the numeric and range tests fused, for the predicate
+        tests = []
+        if 'regex' in rule:
+            try:
+                pattern = re.compile(rule['regex'])
+            except re.error as e:
+                raise ValueError(f"Invalid regex for '{field}': {e}") from None
+            checks.append((pattern.match, message or f"Invalid {field} format"))
+            tests.append(pattern.match)
+
+        if field in ('age', 'gender') and not rule.get('required'):
+            # '' would fail the column's CHECK constraint
+            raise ValueError(f"{label} must stay required: the database cannot store an empty {field}")
+
+        low, high = rule.get('min'), rule.get('max')
+        if field == 'age':
+            # The column only holds integers within the database's CHECK range
+            low = MIN_AGE if low is None else low
+            high = MAX_AGE if high is None else high
+            if not MIN_AGE <= low <= high <= MAX_AGE:
+                raise ValueError(f"Age range must be within {MIN_AGE} and {MAX_AGE}")
+        low = float('-inf') if low is None else low
+        high = float('inf') if high is None else high
+        if rule.get('numeric') or low != float('-inf') or high != float('inf'):
+            checks.append((_is_number, message or f"{label} must be a number"))
+            if low != float('-inf') and high != float('inf'):
+                range_message = f"{label} must be between {low} and {high}"
+            elif low != float('-inf'):
+                range_message = f"{label} must be at least {low}"
+            else:
+                range_message = f"{label} must be at most {high}"
+            checks.append((lambda value: low <= int(value) <= high, message or range_message))
+            tests.append(lambda value: value.isdigit() and value.isascii() and low <= int(value) <= high)
+
+        allowed = rule.get('allowed')
+        if field == 'gender':
+            allowed = GENDERS if allowed is None else allowed
+            if not set(allowed) <= set(GENDERS):
+                raise ValueError(f"Gender values must be among: {', '.join(GENDERS)}")
+        if allowed is not None:
+            values = frozenset(allowed)
+            checks.append((values.__contains__, message or f"{label} must be one of: {', '.join(allowed)}"))
+            tests.append(values.__contains__)
+
+        return checks, ValidationRules._predicate(tests, bool(rule.get('required')))
+
+    @staticmethod
+    def _predicate(tests: List[Callable[[str], Any]], required: bool) -> Callable[[Any], Any]:
+        """Combine a field's tests into one callable, calling a single test directly when possible"""
+        if len(tests) == 1:
+            test = tests[0]
+            if required and not test(''):
+                # An empty value already fails the test
+                return test
+            if required:
+                return lambda value: value and test(value)
+            return lambda value: not value or test(value)
+        if required:
+            return lambda value: value and all(test(value) for test in tests)
+        return lambda value: not value or all(test(value) for test in tests)
+
+    def row_errors(self, row: Sequence[Any], nullable: Collection[str] = ()) -> List[str]:
+        """
+        Collect every problem with one employee.
+
+        Args:
+            row: Values in REQUIRED_FIELDS order
+            nullable: Fields that may be None, for rows the database holds
+                without them; None there is not an error
+
+        Returns:
+            Error messages: missing required fields first, then each
+            field's first failed check, in rule order; empty if the
+            employee is valid. None counts as an empty value, and other
+            values that are not strings (an int age) are checked as text.
+        """
+        if len(row) != len(REQUIRED_FIELDS):
+            return [f"Expected {len(REQUIRED_FIELDS)} values, got {len(row)}"]
+        row = [value if value is None or isinstance(value, str) else str(value) for value in row]
+        errors = [message for position, message in self._required
+                  if not row[position] and not (row[position] is None and REQUIRED_FIELDS[position] in nullable)]
+        # Checks only apply to the fields that are there
+        for position, checks in self._checks:
+            value = row[position]
+            if value:
+                for check, message in checks:
+                    if not check(value):
+                        errors.append(message)
+                        break
+        return errors
+
+    def validate_rows(self, rows: Iterable[Sequence[str]]) -> List[Tuple[int, List[str]]]:
+        """
+        Validate many employees at once, collecting every error of each.
+
+        Rows that are already clean pass one predicate per field, and only
+        the rows failing it are checked again for their messages.
+
+        Args:
+            rows: Rows of strings (or None for a missing value) in
+                REQUIRED_FIELDS order
+
+        Returns:
+            (index, errors) for each invalid row, in order; valid rows are not listed
+        """
+        predicates = self._predicates
+        row_errors = self.row_errors
+        width = len(REQUIRED_FIELDS)
+        invalid = []
+        for index, row in enumerate(rows):
+            try:
+                if len(row) == width and all(map(_call, predicates, row)):
+                    continue
+            except (TypeError, AttributeError):
+                # A None or non-string value: the predicates expect
+                # strings, row_errors converts them
+                pass
+            errors = row_errors(row)
+            if errors:
+                invalid.append((index, errors))
+        return invalid
+
+# Rules used by the functions below; main.py installs the configured ones
+_active_rules = ValidationRules()
+
+def set_validation_rules(rules: ValidationRules) -> None:
+    """Use rules for every later validation in this process"""
+    global _active_rules
+    _active_rules = rules
+
+def get_validation_rules() -> ValidationRules:
+    """The rules validation currently uses"""
+    return _active_rules
 
 def validate_email(email: str) -> bool:
     """
@@ -11,8 +265,7 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return EMAIL_PATTERN.match(email) is not None
 
 def validate_phone(phone: str) -> bool:
     """
@@ -26,37 +279,66 @@ def validate_phone(phone: str) -> bool:
     """
     # Allow digits, spaces, dashes, and parentheses
     # Ensure at least 10 digits (excluding formatting characters)
-    if len(re.sub(r'[\s\-\(\)]', '', phone)) < 10:
-        return False
-    pattern = r'^[0-9\s\-\(\)]{10,15}$'
-    return bool(re.match(pattern, phone))
+    return PHONE_PATTERN.match(phone) is not None
 
-def validate_employee_data(employee_data: Dict[str, Any]) -> Tuple[bool, str]:
+def row_errors(row: Sequence[Any], rules: Optional[ValidationRules] = None) -> List[str]:
     """
-    Validate employee data before saving.
+    Collect every problem with one employee.
 
     Args:
-        employee_data: Dictionary containing employee data
+        row: Values in REQUIRED_FIELDS order
+        rules: Rules to apply; defaults to the active ones
 
     Returns:
-        Tuple of (is_valid, error_message)
+        Error messages, in the order validate_employee_data checks them;
+        empty if the employee is valid
     """
-    # Check for empty fields
-    required_fields = ['name', 'age', 'job', 'email', 'gender', 'phone', 'address']
-    for field in required_fields:
-        if field not in employee_data or not employee_data[field]:
-            return False, f"Field '{field}' is required"
+    return (rules or _active_rules).row_errors(row)
 
-    # Validate email format
-    if not validate_email(employee_data['email']):
-        return False, "Invalid email format"
+def validate_rows(rows: Iterable[Sequence[str]],
+                  rules: Optional[ValidationRules] = None) -> List[Tuple[int, List[str]]]:
+    """
+    Validate many employees at once, collecting every error of each.
+
+    Meant for imports: rows that are already clean pass one combined
+    check, and only the rows failing it are checked field by field for
+    their messages.
 
-    # Validate phone format
-    if not validate_phone(employee_data['phone']):
-        return False, "Invalid phone number format"
+    Args:
+        rows: Rows of strings in REQUIRED_FIELDS order
+        rules: Rules to apply; defaults to the active ones
 
-    # Validate age is numeric
-    if not employee_data['age'].isdigit():
-        return False, "Age must be a number"
+    Returns:
+        (index, errors) for each invalid row, in order; valid rows are not listed
+    """
+    return (rules or _active_rules).validate_rows(rows)
+
+def validate_columns(columns: Mapping[str, Sequence[str]],
+                     rules: Optional[ValidationRules] = None) -> List[Tuple[int, List[str]]]:
+    """
+    Validate employees given as one sequence of values per field.
 
+    Args:
+        columns: Equal-length value sequences keyed by REQUIRED_FIELDS
+        rules: Rules to apply; defaults to the active ones
+
+    Returns:
+        (index, errors) for each invalid row, as validate_rows
+    """
+    return validate_rows(zip(*(columns[field] for field in REQUIRED_FIELDS)), rules)
+
+def validate_employee_data(employee_data: Dict[str, Any], nullable: Collection[str] = ()) -> Tuple[bool, str]:
+    """
+    Validate employee data before saving.
+
+    Args:
+        employee_data: Dictionary containing employee data
+        nullable: Fields allowed to be None (see models.employee.NULLABLE_FIELDS)
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    errors = _active_rules.row_errors([employee_data.get(field) for field in REQUIRED_FIELDS], nullable)
+    if errors:
+        return False, errors[0]
     return True, ""